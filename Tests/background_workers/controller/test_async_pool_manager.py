@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import unittest
+from typing import Any, List
+from background_workflows.controller.main.async_pool_manager import AsyncPoolManager
+
+class TestAsyncPoolManager(unittest.TestCase):
+    def test_runs_coroutines_concurrently_and_deletes_messages(self) -> None:
+        """
+        Test that submitted tasks run concurrently on the event loop, occupy slots while
+        running, and have their queue messages deleted once they finish.
+        """
+        apm: AsyncPoolManager = AsyncPoolManager(max_tasks=3)
+        started: threading.Semaphore = threading.Semaphore(0)
+        release: threading.Event = threading.Event()
+        deleted: List[Any] = []
+
+        class AwaitingTask:
+            async def execute_single_async(self, msg: Any) -> None:
+                started.release()
+                while not release.is_set():
+                    await asyncio.sleep(0.01)
+
+        class Queue:
+            def delete_message(self, raw_msg: Any) -> None:
+                deleted.append(raw_msg)
+
+        for i in range(3):
+            apm.submit_task(AwaitingTask(), None, f"raw-{i}", Queue())
+        for _ in range(3):
+            self.assertTrue(started.acquire(timeout=5), "All coroutines should start without blocking each other.")
+        self.assertEqual(apm.available_slots(), 0)
+
+        release.set()
+        apm.shutdown(wait=True)
+        self.assertEqual(sorted(deleted), ["raw-0", "raw-1", "raw-2"])
+        self.assertEqual(apm.current_thread_count(), 0)
+
+    def test_failed_task_keeps_message(self) -> None:
+        """
+        Test that a task raising an exception releases its slot without deleting the message.
+        """
+        apm: AsyncPoolManager = AsyncPoolManager(max_tasks=1)
+        deleted: List[Any] = []
+
+        class FailingTask:
+            async def execute_single_async(self, msg: Any) -> None:
+                raise RuntimeError("boom")
+
+        class Queue:
+            def delete_message(self, raw_msg: Any) -> None:
+                deleted.append(raw_msg)
+
+        apm.submit_task(FailingTask(), None, "raw", Queue())
+        self.assertTrue(apm.wait_for_completion(timeout=5))
+        apm.shutdown()
+        self.assertEqual(deleted, [])
+        self.assertEqual(apm.available_slots(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import time
+import unittest
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+
+
+class TestCpuSampler(unittest.TestCase):
+    def test_invalid_parameters(self) -> None:
+        """
+        Test that out-of-range window and smoothing values are rejected.
+        """
+        with self.assertRaises(ValueError):
+            CpuSampler(sample_interval=0)
+        with self.assertRaises(ValueError):
+            CpuSampler(smoothing_factor=0.0)
+        with self.assertRaises(ValueError):
+            CpuSampler(smoothing_factor=1.5)
+
+    def test_get_usage_does_not_block(self) -> None:
+        """
+        Test that reading the usage returns immediately, even with a long sample window.
+        """
+        sampler: CpuSampler = CpuSampler(sample_interval=5.0)
+        sampler.start()
+        try:
+            started: float = time.monotonic()
+            for _ in range(100):
+                sampler.get_usage()
+            self.assertLess(time.monotonic() - started, 0.5)
+        finally:
+            sampler.stop()
+
+    def test_background_sampling(self) -> None:
+        """
+        Test that the background thread produces a usage value between 0.0 and 1.0.
+        """
+        sampler: CpuSampler = CpuSampler(sample_interval=0.05)
+        sampler.start()
+        self.assertTrue(sampler.is_running())
+        time.sleep(0.3)
+        usage: float = sampler.get_usage()
+        sampler.stop()
+        self.assertFalse(sampler.is_running())
+        self.assertGreaterEqual(usage, 0.0)
+        self.assertLessEqual(usage, 1.0)
+
+    def test_smoothing(self) -> None:
+        """
+        Test that new samples are blended into the moving average using the smoothing factor.
+        """
+        sampler: CpuSampler = CpuSampler(smoothing_factor=0.5)
+        sampler._busy_fraction = lambda previous, current: 1.0  # type: ignore[assignment]
+        self.assertEqual(sampler.sample_once(), 1.0)
+        sampler._busy_fraction = lambda previous, current: 0.0  # type: ignore[assignment]
+        self.assertAlmostEqual(sampler.sample_once(), 0.5)
+        self.assertAlmostEqual(sampler.sample_once(), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
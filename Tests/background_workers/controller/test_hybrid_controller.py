@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+import unittest
+from typing import List
+from Tests.sample_tasks.async_sample_task import AsyncSampleTask  # noqa: F401
+from Tests.sample_tasks.sample_task import SampleTask  # noqa: F401
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.hybrid.hybrid_controller import HybridController
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.storage.queue.local_queue_backend import LocalQueueBackend
+
+class TestHybridController(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Set up an in-memory SQLite task store and a local queue backend.
+        """
+        self.store: SqliteTaskStore = SqliteTaskStore(":memory:")
+        self.store.create_if_not_exists()
+        self.queue: LocalQueueBackend = LocalQueueBackend()
+
+    def _enqueue(self, row_key: str, task_type: str) -> None:
+        self.store.upsert_task(
+            TaskEntity(PartitionKey="res", RowKey=row_key, TaskType=task_type, InputPayload='{"x": 2}')
+        )
+        self.queue.send_message(json.dumps({
+            "resource_id": "res",
+            "row_key": row_key,
+            "task_type": task_type,
+            "payload": {}
+        }))
+
+    def test_lane_limits(self) -> None:
+        """
+        Test that each lane gets its own concurrency limit and disabled lanes are omitted.
+        """
+        controller: HybridController = HybridController(
+            self.store, self.queue, max_threads=3, max_processes=0, max_async_tasks=7
+        )
+        self.assertEqual(
+            controller.lane_limits(),
+            {AppConstants.ExecutionModes.THREAD: 3, AppConstants.ExecutionModes.ASYNC: 7},
+        )
+        self.assertEqual(controller.prefetch_buffer.capacity, 10 * AppConstants.MainController.PREFETCH_MULTIPLIER_DEFAULT)
+        controller.shutdown_lanes()
+
+    def test_default_lanes(self) -> None:
+        """
+        Test that the process lane is opt-in, so the default controller works with an
+        in-memory store that worker processes could not reopen.
+        """
+        controller: HybridController = HybridController(self.store, self.queue)
+        self.assertIsNone(controller.process_pool)
+        self.assertEqual(
+            set(controller.lane_limits()),
+            {AppConstants.ExecutionModes.THREAD, AppConstants.ExecutionModes.ASYNC},
+        )
+        controller.shutdown_lanes()
+
+    def test_routes_by_execution_mode(self) -> None:
+        """
+        Test that thread and async activities from one queue are routed to their own lanes
+        and both complete.
+        """
+        controller: HybridController = HybridController(
+            self.store, self.queue, max_threads=1, max_processes=0, max_async_tasks=4, cpu_threshold=1.01
+        )
+        row_keys: List[str] = []
+        for i in range(3):
+            self._enqueue(f"async-{i}", "ASYNC_SAMPLE_TASK")
+            self._enqueue(f"thread-{i}", "SAMPLE_TASK")
+            row_keys += [f"async-{i}", f"thread-{i}"]
+
+        async_lane: str = controller._lane_for(
+            type("Msg", (), {"task_type": "ASYNC_SAMPLE_TASK"})()
+        )
+        self.assertEqual(async_lane, AppConstants.ExecutionModes.ASYNC)
+
+        runner: threading.Thread = threading.Thread(target=controller.run, daemon=True)
+        runner.start()
+        deadline: float = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            statuses = [self.store.get_task("res", row_key).Status for row_key in row_keys]
+            if all(status == "COMPLETED" for status in statuses):
+                break
+            time.sleep(0.05)
+
+        controller.shutdown()
+        runner.join(timeout=5)
+        controller.shutdown_lanes()
+
+        self.assertFalse(runner.is_alive(), "Run loop should exit after shutdown().")
+        self.assertEqual(statuses, ["COMPLETED"] * len(row_keys))
+        self.assertEqual(json.loads(self.store.get_task("res", "async-0").OutputPayload), {"answer": 4})
+
+    def test_async_activity_without_async_lane_is_released(self) -> None:
+        """
+        Test that an async activity is not run on the thread lane when the asyncio lane is
+        disabled: its message goes back to the queue and the task stays CREATED.
+        """
+        controller: HybridController = HybridController(
+            self.store, self.queue, max_threads=1, max_processes=0, max_async_tasks=0
+        )
+        msg = type("Msg", (), {"task_type": "ASYNC_SAMPLE_TASK"})()
+        self.assertIsNone(controller._lane_for(msg))
+        self._enqueue("async-0", "ASYNC_SAMPLE_TASK")
+
+        controller.run_once()
+        controller.shutdown_lanes()
+
+        self.assertEqual(len(self.queue.queue), 1)
+        self.assertEqual(len(controller.prefetch_buffer), 0)
+        self.assertEqual(self.store.get_task("res", "async-0").Status, "CREATED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, Optional
+from Tests.sample_tasks.async_sample_task import AsyncSampleTask  # noqa: F401
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.async_controller.main_async_controller import MainAsyncController
+from background_workflows.storage.queue.async_local_queue_backend import AsyncLocalQueueBackend
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.tasks.process_single_queue import ProcessSingleQueue
+from background_workflows.utils.decorators import register_activity
+
+# Released by the tests to let GatedAsyncTask jobs finish.
+_gate: Optional[asyncio.Event] = None
+
+
+@register_activity("ASYNC_GATED_TASK", execution_mode=AppConstants.ExecutionModes.ASYNC)
+class GatedAsyncTask(ProcessSingleQueue):
+    def do_work_on_single(self, payload: Dict[str, Any]) -> str:
+        raise NotImplementedError("GatedAsyncTask only runs asynchronously.")
+
+    async def do_work_on_single_async(self, payload: Dict[str, Any]) -> str:
+        await _gate.wait()
+        return "{}"
+
+class TestMainAsyncController(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        """
+        Set up an in-memory SQLite task store and an asyncio-native local queue.
+        """
+        self.store: SqliteTaskStore = SqliteTaskStore(":memory:")
+        self.store.create_if_not_exists()
+        self.queue: AsyncLocalQueueBackend = AsyncLocalQueueBackend()
+        self.controller: MainAsyncController = MainAsyncController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_concurrent_tasks=10,
+            poll_interval_secs=0.05,
+        )
+
+    async def _enqueue(self, row_key: str, task_type: str) -> None:
+        self.store.upsert_task(
+            TaskEntity(PartitionKey="res", RowKey=row_key, TaskType=task_type, InputPayload='{"x": 3}')
+        )
+        await self.queue.send_message_async(json.dumps({
+            "resource_id": "res",
+            "row_key": row_key,
+            "task_type": task_type,
+            "payload": {}
+        }))
+
+    async def _wait_until_completed(self, row_keys: list) -> list:
+        statuses = []
+        for _ in range(100):
+            statuses = [self.store.get_task("res", row_key).Status for row_key in row_keys]
+            if all(status == "COMPLETED" for status in statuses):
+                break
+            await asyncio.sleep(0.05)
+        return statuses
+
+    async def test_never_leases_beyond_free_slots(self) -> None:
+        """
+        Test that the controller only receives as many messages as it has free slots, and
+        picks up the rest as soon as running jobs finish (without waiting poll_interval_secs).
+        """
+        global _gate
+        _gate = asyncio.Event()
+        controller: MainAsyncController = MainAsyncController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_concurrent_tasks=2,
+            poll_interval_secs=60,
+        )
+        row_keys = [f"gated-{i}" for i in range(5)]
+        for row_key in row_keys:
+            await self._enqueue(row_key, "ASYNC_GATED_TASK")
+
+        runner: asyncio.Task = asyncio.create_task(controller.run())
+        for _ in range(100):
+            if controller.free_slots() == 0:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        self.assertEqual(controller.free_slots(), 0)
+        self.assertEqual(len(self.queue.queue), 3, "Messages beyond free capacity must stay in the queue.")
+
+        _gate.set()
+        statuses = await self._wait_until_completed(row_keys)
+        await controller.shutdown()
+        await asyncio.wait_for(runner, timeout=5)
+        self.assertEqual(statuses, ["COMPLETED"] * len(row_keys))
+
+    async def test_shutdown_drains_in_flight_jobs(self) -> None:
+        """
+        Test that shutdown stops leasing and that run() waits for in-flight jobs to finish.
+        """
+        global _gate
+        _gate = asyncio.Event()
+        controller: MainAsyncController = MainAsyncController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_concurrent_tasks=2,
+            poll_interval_secs=60,
+        )
+        row_keys = [f"drain-{i}" for i in range(3)]
+        for row_key in row_keys:
+            await self._enqueue(row_key, "ASYNC_GATED_TASK")
+
+        runner: asyncio.Task = asyncio.create_task(controller.run())
+        while controller.free_slots():
+            await asyncio.sleep(0.01)
+        await controller.shutdown()
+        asyncio.get_running_loop().call_later(0.1, _gate.set)
+        await asyncio.wait_for(runner, timeout=5)
+
+        statuses = [self.store.get_task("res", row_key).Status for row_key in row_keys]
+        self.assertEqual(statuses[:2], ["COMPLETED", "COMPLETED"])
+        self.assertEqual(len(self.queue.queue), 1, "The un-leased message should stay in the queue.")
+
+    async def test_drain_deadline_releases_messages(self) -> None:
+        """
+        Test that jobs still running at the drain deadline are cancelled and their messages released.
+        """
+        global _gate
+        _gate = asyncio.Event()
+        controller: MainAsyncController = MainAsyncController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_concurrent_tasks=2,
+            poll_interval_secs=60,
+            drain_timeout_secs=0.1,
+        )
+        for i in range(2):
+            await self._enqueue(f"stuck-{i}", "ASYNC_GATED_TASK")
+
+        runner: asyncio.Task = asyncio.create_task(controller.run())
+        while controller.free_slots():
+            await asyncio.sleep(0.01)
+        await controller.shutdown()
+        await asyncio.wait_for(runner, timeout=5)
+
+        self.assertEqual(controller.free_slots(), 2)
+        released = sorted(json.loads(content)["row_key"] for content in self.queue.queue)
+        self.assertEqual(released, ["stuck-0", "stuck-1"])
+
+    async def test_uses_native_async_queue(self) -> None:
+        """
+        Test that the controller awaits an IAsyncQueueBackend directly and processes its messages.
+        """
+        self.assertIs(self.controller.async_queue_backend, self.queue)
+
+        row_keys = [f"row-{i}" for i in range(3)]
+        for row_key in row_keys:
+            self.store.upsert_task(
+                TaskEntity(PartitionKey="res", RowKey=row_key, TaskType="ASYNC_SAMPLE_TASK", InputPayload='{"x": 3}')
+            )
+            await self.queue.send_message_async(json.dumps({
+                "resource_id": "res",
+                "row_key": row_key,
+                "task_type": "ASYNC_SAMPLE_TASK",
+                "payload": {}
+            }))
+
+        runner: asyncio.Task = asyncio.create_task(self.controller.run())
+        statuses = []
+        for _ in range(100):
+            statuses = [self.store.get_task("res", row_key).Status for row_key in row_keys]
+            if all(status == "COMPLETED" for status in statuses):
+                break
+            await asyncio.sleep(0.05)
+
+        await self.controller.shutdown()
+        await asyncio.wait_for(runner, timeout=5)
+
+        self.assertEqual(statuses, ["COMPLETED"] * len(row_keys))
+        self.assertEqual(json.loads(self.store.get_task("res", "row-0").OutputPayload), {"answer": 6})
+
+
+if __name__ == "__main__":
+    unittest.main()
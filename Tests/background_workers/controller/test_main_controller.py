@@ -1,9 +1,31 @@
 import unittest
 import json
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Dict, Optional
+from Tests.sample_tasks.sample_task import SampleTask  # noqa: F401
+from background_workflows.constants.app_constants import AppConstants
 from background_workflows.controller.main.main_controller import MainController
+from background_workflows.storage.schemas.task_entity import TaskEntity
 from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
 from background_workflows.storage.queue.local_queue_backend import LocalQueueBackend
+from background_workflows.tasks.process_single_queue import ProcessSingleQueue
+from background_workflows.utils.decorators import register_activity
+
+
+# Set by tests to let BlockingTestTask return.
+_unblock: threading.Event = threading.Event()
+
+
+@register_activity("BLOCKING_TEST_TASK")
+class BlockingTestTask(ProcessSingleQueue):
+    def do_work_on_single(self, payload: Dict[str, Any]) -> str:
+        """
+        Hold the worker slot until the test sets _unblock.
+        """
+        _unblock.wait(timeout=30)
+        return "{}"
+
 
 class TestMainController(unittest.TestCase):
     def setUp(self) -> None:
@@ -48,5 +70,136 @@ class TestMainController(unittest.TestCase):
         )
         self.assertTrue(log_found, f"Expected warning log not found. Captured logs: {cm.output}")
 
+    def test_receive_is_bounded_by_prefetch_buffer(self) -> None:
+        """
+        Test that a pass never leases more messages than the prefetch buffer can hold, and that
+        run_once() releases the messages it could not dispatch.
+        """
+        _unblock.clear()
+        self.addCleanup(_unblock.set)
+        controller: MainController = MainController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_threads=1,
+            cpu_threshold=1.01,
+            prefetch_multiplier=2,
+        )
+        for i in range(3):
+            self.queue.send_message(json.dumps({
+                "resource_id": "res",
+                "row_key": f"row-{i}",
+                "task_type": "BLOCKING_TEST_TASK",
+                "payload": {}
+            }))
+            self.store.upsert_task(
+                TaskEntity(PartitionKey="res", RowKey=f"row-{i}", TaskType="BLOCKING_TEST_TASK", InputPayload="{}")
+            )
+
+        requested = []
+        receive = self.queue.receive_messages
+        self.queue.receive_messages = lambda max_messages=1, visibility_timeout=60: (
+            requested.append(max_messages) or receive(max_messages, visibility_timeout)
+        )
+
+        controller.run_once()
+        _unblock.set()
+        controller.thread_pool.shutdown()
+
+        self.assertEqual(requested, [2], "Only prefetch-buffer capacity should be received.")
+        self.assertEqual(len(controller.prefetch_buffer), 0)
+        self.assertEqual(
+            [json.loads(raw)["row_key"] for raw in self.queue.queue], ["row-1", "row-2"],
+            "The undispatched message should be released ahead of the one never received."
+        )
+
+    def test_invalid_dispatch_mode(self) -> None:
+        """
+        Test that an unknown dispatch mode is rejected.
+        """
+        with self.assertRaises(ValueError):
+            MainController(self.store, self.queue, dispatch_mode="bogus")
+
+    def test_continuous_dispatch_drains_queue(self) -> None:
+        """
+        Test that the continuous dispatch mode processes more messages than there are worker
+        slots without waiting for the fixed polling sleep, and exits on shutdown().
+        """
+        controller: MainController = MainController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_threads=2,
+            cpu_threshold=1.01,
+            dispatch_mode=AppConstants.MainController.DispatchModes.CONTINUOUS,
+        )
+        row_keys = [f"row-{i}" for i in range(6)]
+        for row_key in row_keys:
+            self.store.upsert_task(
+                TaskEntity(PartitionKey="res", RowKey=row_key, TaskType="SAMPLE_TASK", InputPayload='{"x": 1}')
+            )
+            self.queue.send_message(json.dumps({
+                "resource_id": "res",
+                "row_key": row_key,
+                "task_type": "SAMPLE_TASK",
+                "payload": {}
+            }))
+
+        runner: threading.Thread = threading.Thread(target=controller.run, daemon=True)
+        runner.start()
+        deadline: float = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            statuses = [self.store.get_task("res", row_key).Status for row_key in row_keys]
+            if all(status == "COMPLETED" for status in statuses):
+                break
+            time.sleep(0.05)
+
+        controller.shutdown()
+        runner.join(timeout=5)
+        controller.thread_pool.shutdown()
+
+        self.assertFalse(runner.is_alive(), "Run loop should exit after shutdown().")
+        self.assertEqual(statuses, ["COMPLETED"] * len(row_keys))
+
+    def test_shutdown_wakes_continuous_dispatcher(self) -> None:
+        """
+        Test that shutdown() ends a continuous run loop that is waiting for a free worker slot
+        right away, instead of after MAIN_LOOP_SLEEP_SECS.
+        """
+        _unblock.clear()
+        self.addCleanup(_unblock.set)
+        controller: MainController = MainController(
+            task_store=self.store,
+            queue_backend=self.queue,
+            max_threads=1,
+            cpu_threshold=1.01,
+            dispatch_mode=AppConstants.MainController.DispatchModes.CONTINUOUS,
+        )
+        for row_key in ("busy", "waiting"):
+            self.store.upsert_task(TaskEntity(PartitionKey="res", RowKey=row_key, TaskType="BLOCKING_TEST_TASK", InputPayload="{}"))
+            self.queue.send_message(json.dumps({
+                "resource_id": "res",
+                "row_key": row_key,
+                "task_type": "BLOCKING_TEST_TASK",
+                "payload": {}
+            }))
+
+        runner: threading.Thread = threading.Thread(target=controller.run, daemon=True)
+        runner.start()
+        deadline: float = time.monotonic() + 5
+        while len(controller.prefetch_buffer) != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        started: float = time.monotonic()
+        controller.shutdown()
+        runner.join(timeout=5)
+        elapsed: float = time.monotonic() - started
+        _unblock.set()
+        controller.thread_pool.shutdown()
+
+        self.assertFalse(runner.is_alive(), "Run loop should exit after shutdown().")
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(len(self.queue.queue), 1, "The waiting message should be released on exit.")
+
+
 if __name__ == "__main__":
     unittest.main()
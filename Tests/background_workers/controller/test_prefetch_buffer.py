@@ -0,0 +1,76 @@
+import json
+import unittest
+from typing import Any, List
+from background_workflows.controller.main.prefetch_buffer import PrefetchBuffer
+from background_workflows.storage.schemas.task_message import TaskMessage
+
+
+class RecordingQueue:
+    """
+    A queue backend stub that records update_message calls.
+    """
+
+    def __init__(self) -> None:
+        self.updates: List[Any] = []
+
+    def update_message(self, msg: Any, visibility_timeout: int = 60) -> None:
+        self.updates.append((msg["id"], visibility_timeout))
+
+
+def make_message(row_key: str) -> Any:
+    content: str = json.dumps({"resource_id": "res", "row_key": row_key, "task_type": "T", "payload": {}})
+    return {"id": row_key, "pop_receipt": None, "content": content}
+
+
+class TestPrefetchBuffer(unittest.TestCase):
+    def test_capacity(self) -> None:
+        """
+        Test that the buffer is bounded and returns messages in FIFO order.
+        """
+        buffer: PrefetchBuffer = PrefetchBuffer(capacity=2, visibility_timeout=60)
+        for row_key in ("a", "b"):
+            raw = make_message(row_key)
+            buffer.put(raw, TaskMessage(raw), object())
+        self.assertEqual(buffer.free_capacity(), 0)
+        with self.assertRaises(OverflowError):
+            raw = make_message("c")
+            buffer.put(raw, TaskMessage(raw), object())
+
+        self.assertEqual(buffer.pop().task_message.row_key, "a")
+        self.assertEqual(buffer.pop().task_message.row_key, "b")
+        self.assertIsNone(buffer.pop())
+
+    def test_renew_expiring(self) -> None:
+        """
+        Test that only leases inside the renewal margin are renewed, in a single pass.
+        """
+        buffer: PrefetchBuffer = PrefetchBuffer(capacity=3, visibility_timeout=60, renew_margin_secs=10)
+        for row_key in ("a", "b"):
+            raw = make_message(row_key)
+            buffer.put(raw, TaskMessage(raw), object())
+        queue: RecordingQueue = RecordingQueue()
+
+        self.assertEqual(buffer.renew_expiring(queue), 0)
+
+        buffer._items[0].lease_expires_at -= 55
+        self.assertEqual(buffer.renew_expiring(queue), 1)
+        self.assertEqual(queue.updates, [("a", 60)])
+        self.assertEqual(len(buffer), 2)
+
+    def test_release_all(self) -> None:
+        """
+        Test that releasing the buffer sets every message's visibility timeout to zero.
+        """
+        buffer: PrefetchBuffer = PrefetchBuffer(capacity=2, visibility_timeout=60)
+        for row_key in ("a", "b"):
+            raw = make_message(row_key)
+            buffer.put(raw, TaskMessage(raw), object())
+        queue: RecordingQueue = RecordingQueue()
+
+        self.assertEqual(buffer.release_all(queue), 2)
+        self.assertEqual(queue.updates, [("a", 0), ("b", 0)])
+        self.assertEqual(len(buffer), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
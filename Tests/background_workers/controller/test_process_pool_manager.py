@@ -0,0 +1,81 @@
+import json
+import os
+import unittest
+from typing import Any, Optional
+from Tests.sample_tasks.sample_task import SampleTask
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.process_pool_manager import ProcessPoolManager
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+
+
+class RecordingQueue:
+    """
+    A queue backend stub that records deleted messages.
+    """
+
+    def __init__(self) -> None:
+        self.deleted: list = []
+
+    def delete_message(self, msg: Any) -> None:
+        self.deleted.append(msg)
+
+
+class TestProcessPoolManager(unittest.TestCase):
+    def setUp(self) -> None:
+        """
+        Create a file-backed SQLite store that worker processes can open independently.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        self.factory: TaskStoreFactory = TaskStoreFactory(
+            store_mode=AppConstants.TaskStoreFactory.StoreModes.SQLITE,
+            sqlite_db_path=self.db_path,
+        )
+        self.store = self.factory.get_task_store()
+
+    def tearDown(self) -> None:
+        self.store.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_submit_runs_task_in_worker_process(self) -> None:
+        """
+        Test that a task submitted to the process pool is executed by a worker with its own
+        store connection, and that the queue message is deleted in the parent.
+        """
+        self.store.upsert_task(
+            TaskEntity(PartitionKey="res", RowKey="123", TaskType="SAMPLE_TASK", InputPayload='{"x": 21}')
+        )
+        raw_msg = {
+            "id": 1,
+            "pop_receipt": None,
+            "content": json.dumps({"resource_id": "res", "row_key": "123", "task_type": "SAMPLE_TASK", "payload": {}}),
+        }
+        queue: RecordingQueue = RecordingQueue()
+        ppm: ProcessPoolManager = ProcessPoolManager(self.factory, max_processes=1)
+        try:
+            ppm.submit_task(SampleTask(self.store), TaskMessage(raw_msg), raw_msg, queue)
+            self.assertEqual(ppm.in_flight_count("SAMPLE_TASK"), 1)
+        finally:
+            ppm.shutdown()
+
+        self.assertEqual(ppm.current_thread_count(), 0)
+        self.assertEqual(queue.deleted, [raw_msg])
+        finished: Optional[TaskEntity] = self.store.get_task("res", "123")
+        self.assertEqual(finished.Status, "COMPLETED")
+        self.assertEqual(json.loads(finished.OutputPayload)["answer"], 42)
+
+    def test_memory_store_cannot_be_shared(self) -> None:
+        """
+        Test that an in-memory SQLite store cannot be used to configure worker processes.
+        """
+        from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+
+        with self.assertRaises(ValueError):
+            TaskStoreFactory.from_task_store(SqliteTaskStore(":memory:"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from typing import Any
 from background_workflows.controller.main.thread_pool_manager import ThreadPoolManager
@@ -27,5 +28,62 @@ class TestThreadPoolManager(unittest.TestCase):
         count: int = tpm.current_thread_count()
         self.assertEqual(count, 0, "There should be no active threads initially.")
 
+    def test_available_slots_and_wait_for_completion(self) -> None:
+        """
+        Test that a running task occupies a slot and that wait_for_completion wakes up when it finishes.
+        """
+        tpm: ThreadPoolManager = ThreadPoolManager(max_threads=2)
+        release: threading.Event = threading.Event()
+
+        class BlockingTask:
+            def execute_single(self, msg: Any) -> None:
+                release.wait(5)
+
+        class Queue:
+            def delete_message(self, raw_msg: Any) -> None:
+                pass
+
+        tpm.submit_task(BlockingTask(), None, None, Queue())
+        self.assertEqual(tpm.available_slots(), 1)
+        self.assertFalse(tpm.wait_for_completion(timeout=0.05))
+
+        release.set()
+        self.assertTrue(tpm.wait_for_completion(timeout=5))
+        self.assertEqual(tpm.available_slots(), 2)
+        tpm.shutdown()
+
+    def test_in_flight_by_type_and_wait_for_free_slot(self) -> None:
+        """
+        Test that in-flight counts are tracked per task type and that wait_for_free_slot
+        blocks while the pool is saturated.
+        """
+        tpm: ThreadPoolManager = ThreadPoolManager(max_threads=2)
+        release: threading.Event = threading.Event()
+
+        class BlockingTask:
+            def execute_single(self, msg: Any) -> None:
+                release.wait(5)
+
+        class Queue:
+            def delete_message(self, raw_msg: Any) -> None:
+                pass
+
+        class Msg:
+            def __init__(self, task_type: str) -> None:
+                self.task_type = task_type
+
+        tpm.submit_task(BlockingTask(), Msg("A"), None, Queue())
+        tpm.submit_task(BlockingTask(), Msg("B"), None, Queue())
+        self.assertEqual(tpm.current_thread_count(), 2)
+        self.assertEqual(tpm.in_flight_by_type(), {"A": 1, "B": 1})
+        self.assertEqual(tpm.in_flight_count("A"), 1)
+        self.assertFalse(tpm.wait_for_free_slot(timeout=0.05))
+
+        release.set()
+        self.assertTrue(tpm.wait_for_free_slot(timeout=5))
+        tpm.shutdown()
+        self.assertEqual(tpm.current_thread_count(), 0)
+        self.assertEqual(tpm.in_flight_by_type(), {})
+
 if __name__ == "__main__":
     unittest.main()
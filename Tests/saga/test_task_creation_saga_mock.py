@@ -147,5 +147,42 @@ class TestTaskCreationSaga( unittest.TestCase ):
         mock_queue_backend.send_message.assert_not_called()
 
 
+    @patch( 'background_workflows.storage.blobs.i_blob_store.IBlobStore' )
+    @patch( 'background_workflows.storage.queue.i_queue_backend.IQueueBackend' )
+    @patch( 'background_workflows.storage.tables.i_task_storage.ITaskStore' )
+    def test_run_saga_failure_when_upsert_not_durable(self, mock_task_store, mock_queue_backend, mock_blob_store):
+        """
+        Test that a buffered upsert whose flush reports a failed write is treated as an upsert
+        failure: the blob is deleted and no message is sent.
+        """
+        mock_task_store.upsert_task = MagicMock( return_value = True )
+        mock_task_store.flush = MagicMock( return_value = False )
+        mock_blob_store.upload_blob = MagicMock()
+        mock_blob_store.delete_blob = MagicMock()
+        mock_queue_backend.send_message = MagicMock()
+
+        saga = TaskCreationSaga(
+            activity_type = 'test_activity',
+            task_store = mock_task_store,
+            queue_backend = mock_queue_backend,
+            blob_store = mock_blob_store,
+            resource_id = 'test_resource_id',
+            store_mode = 'sqlite',
+            active_table_name = AppConstants.TaskStoreFactory.get_active_table_name(),
+            finished_table_name = AppConstants.TaskStoreFactory.get_finished_table_name(),
+            database_name = AppConstants.TaskStoreFactory.get_sqlite_db_path(),
+            container_name = 'test_container',
+            blob_name = 'test_blob',
+            blob_content = 'test_blob_content'
+        )
+
+        with self.assertRaises( SagaFailure ):
+            saga.run_saga()
+
+        mock_task_store.flush.assert_called_once()
+        mock_blob_store.delete_blob.assert_called_once_with( 'test_container', 'test_blob' )
+        mock_queue_backend.send_message.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,24 @@
+import asyncio
+import json
+from typing import Any, Dict
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.tasks.process_single_queue import ProcessSingleQueue
+from background_workflows.utils.decorators import register_activity
+from background_workflows.utils.task_logger import logger
+
+@register_activity("ASYNC_SAMPLE_TASK", execution_mode=AppConstants.ExecutionModes.ASYNC)
+class AsyncSampleTask(ProcessSingleQueue):
+    def do_work_on_single(self, payload: Dict[str, Any]) -> str:
+        raise NotImplementedError("AsyncSampleTask only runs on the asyncio lane.")
+
+    async def do_work_on_single_async(self, payload: Dict[str, Any]) -> str:
+        """
+        For demonstration: Yield to the event loop, then multiply the input 'x' by 2.
+
+        :param payload: A dictionary containing the input parameters, e.g., {"x": <number>}.
+        :return: A JSON string representing the output payload, e.g., {"answer": <result>}.
+        """
+        x: Any = payload.get("x", 0)
+        logger.info(f"[AsyncSampleTask] Received x={x}")
+        await asyncio.sleep(0.01)
+        return json.dumps({"answer": x * 2})
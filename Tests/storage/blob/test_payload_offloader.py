@@ -0,0 +1,119 @@
+import os
+import shutil
+import unittest
+import uuid
+from unittest.mock import patch
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.local_blob_store import LocalBlobStore
+from background_workflows.storage.blobs.payload_offloader import PayloadOffloader, PayloadReference
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class CountingBlobStore( LocalBlobStore ):
+    """
+    LocalBlobStore that counts uploads and downloads.
+    """
+
+    def __init__(self, root_dir: str) -> None:
+        super().__init__( root_dir )
+        self.uploads: int = 0
+        self.downloads: int = 0
+
+    def upload_blob(self, container_name: str, blob_name: str, data: bytes) -> None:
+        self.uploads += 1
+        super().upload_blob( container_name, blob_name, data )
+
+    def download_blob(self, container_name: str, blob_name: str) -> bytes:
+        self.downloads += 1
+        return super().download_blob( container_name, blob_name )
+
+
+class TestPayloadOffloader( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up an offloader with a 100-character threshold over a local blob store.
+        """
+        self.root: str = f"test_blobs_TestPayloadOffloader_{uuid.uuid4().hex[ :6 ]}"
+        self.blob_store: CountingBlobStore = CountingBlobStore( self.root )
+        self.offloader: PayloadOffloader = PayloadOffloader( self.blob_store, "payloads", threshold = 100 )
+        self.offloader.create_if_not_exists()
+
+    def tearDown(self) -> None:
+        """
+        Remove the blob root directory.
+        """
+        shutil.rmtree( self.root, ignore_errors = True )
+
+    def test_small_payloads_stay_inline(self) -> None:
+        """
+        Test that an entity without large payloads is written as is.
+        """
+        entity = TaskEntity( PartitionKey = "res", RowKey = "row", InputPayload = '{"x": 1}' )
+
+        self.assertIs( self.offloader.offload( entity ), entity )
+        self.assertEqual( self.blob_store.uploads, 0 )
+
+    def test_large_payload_is_replaced_by_reference(self) -> None:
+        """
+        Test that a large payload is uploaded once, the stored copy carries a reference, and
+        the caller's entity still reads the payload without a download.
+        """
+        payload: str = '{"data": "' + "x" * 500 + '"}'
+        entity = TaskEntity( PartitionKey = "res", RowKey = "row", InputPayload = payload )
+
+        stored: TaskEntity = self.offloader.offload( entity )
+        self.assertTrue( PayloadOffloader.is_reference( stored.InputPayload ) )
+        self.assertEqual( PayloadOffloader.parse_reference( stored.InputPayload ), ( "payloads", "row.InputPayload" ) )
+        self.assertEqual( entity.InputPayload, payload )
+        self.assertEqual( self.blob_store.downloads, 0 )
+
+        # Unchanged payloads are not uploaded again.
+        self.offloader.offload( entity )
+        self.assertEqual( self.blob_store.uploads, 1 )
+
+    def test_attach_loads_lazily(self) -> None:
+        """
+        Test that a referenced payload is downloaded on first access only, and that the
+        entity stays clean.
+        """
+        payload: str = "y" * 500
+        stored: TaskEntity = self.offloader.offload( TaskEntity( PartitionKey = "res", RowKey = "row",
+                                                                 OutputPayload = payload ) )
+        read = TaskEntity.from_dict( stored.to_dict() )
+
+        self.offloader.attach( read )
+        self.assertIsInstance( read.field_loader( "OutputPayload" ), PayloadReference )
+        self.assertEqual( self.blob_store.downloads, 0 )
+        self.assertEqual( read.OutputPayload, payload )
+        self.assertEqual( read.OutputPayload, payload )
+        self.assertEqual( self.blob_store.downloads, 1 )
+        self.assertEqual( read.dirty_fields, frozenset() )
+
+    def test_delete_payloads(self) -> None:
+        """
+        Test that only references are deleted, and that a missing blob is not an error.
+        """
+        stored: TaskEntity = self.offloader.offload( TaskEntity( PartitionKey = "res", RowKey = "row",
+                                                                 InputPayload = "z" * 500 ) )
+
+        self.assertEqual( self.offloader.delete_payloads( [ stored.InputPayload, '{"x": 1}', None ] ), 1 )
+        with self.assertRaises( FileNotFoundError ):
+            self.offloader.load( stored.InputPayload )
+
+    def test_defaults_are_read_at_construction(self) -> None:
+        """
+        Test that the container and threshold defaults follow the environment at the time the
+        offloader is created, not when the module was imported.
+        """
+        settings = { AppConstants.PayloadOffload.CONTAINER_NAME_ENV_KEY: "env-payloads",
+                     AppConstants.PayloadOffload.THRESHOLD_ENV_KEY: "42" }
+        with patch.dict( os.environ, settings ):
+            offloader: PayloadOffloader = PayloadOffloader( self.blob_store )
+
+        self.assertEqual( ( offloader.container_name, offloader.threshold ), ( "env-payloads", 42 ) )
+        self.assertEqual( PayloadOffloader( self.blob_store, "explicit", threshold = 0 ).threshold, 0 )
+
+
+if __name__ == "__main__":
+    unittest.main()
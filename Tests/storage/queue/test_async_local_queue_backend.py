@@ -0,0 +1,35 @@
+import unittest
+from typing import Any, Dict, List
+from background_workflows.storage.queue.async_local_queue_backend import AsyncLocalQueueBackend
+
+class TestAsyncLocalQueueBackend(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        """
+        Initialize a new AsyncLocalQueueBackend instance for each test.
+        """
+        self.queue: AsyncLocalQueueBackend = AsyncLocalQueueBackend()
+
+    async def test_send_receive_async(self) -> None:
+        """
+        Test that messages sent synchronously or asynchronously share one queue.
+        """
+        self.queue.send_message("msg1")
+        await self.queue.send_message_async("msg2")
+        msgs: List[Dict[str, Any]] = await self.queue.receive_messages_async(max_messages=5)
+        self.assertEqual([m["content"] for m in msgs], ["msg1", "msg2"])
+        await self.queue.delete_message_async(msgs[0])
+        self.assertEqual(await self.queue.receive_messages_async(), [])
+
+    async def test_update_message_release_async(self) -> None:
+        """
+        Test that a zero visibility timeout puts a received message back in the queue.
+        """
+        await self.queue.send_message_async("msg1")
+        msg: Dict[str, Any] = (await self.queue.receive_messages_async())[0]
+        await self.queue.update_message_async(msg, visibility_timeout=0)
+        msgs: List[Dict[str, Any]] = self.queue.receive_messages()
+        self.assertEqual([m["content"] for m in msgs], ["msg1"])
+        await self.queue.close_async()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,5 +35,29 @@ class TestLocalQueueBackend(unittest.TestCase):
         msgs: List[Dict[str, Any]] = self.queue.receive_messages()
         self.assertEqual(len(msgs), 0, "The queue should be empty after deletion.")
 
+    def test_update_message_release(self) -> None:
+        """
+        Test that a zero visibility timeout puts a received message back at the front of the queue.
+        """
+        self.queue.send_message("msg1")
+        self.queue.send_message("msg2")
+        msg: Dict[str, Any] = self.queue.receive_messages()[0]
+        self.queue.update_message(msg, visibility_timeout=0)
+        msgs: List[Dict[str, Any]] = self.queue.receive_messages(max_messages=2)
+        self.assertEqual([m["content"] for m in msgs], ["msg1", "msg2"])
+
+    def test_release_all_keeps_order(self) -> None:
+        """
+        Test that releasing several received messages puts them back in their original order,
+        ahead of messages that were never received.
+        """
+        for i in range(4):
+            self.queue.send_message(f"msg{i}")
+        received: List[Dict[str, Any]] = self.queue.receive_messages(max_messages=3)
+        for msg in received:
+            self.queue.update_message(msg, visibility_timeout=0)
+        msgs: List[Dict[str, Any]] = self.queue.receive_messages(max_messages=4)
+        self.assertEqual([m["content"] for m in msgs], ["msg0", "msg1", "msg2", "msg3"])
+
 if __name__ == "__main__":
     unittest.main()
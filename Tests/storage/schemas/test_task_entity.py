@@ -39,6 +39,70 @@ class TestTaskEntity( unittest.TestCase ):
         self.assertIn( "PartitionKey", d )
         self.assertIn( "InputPayload", d )
 
+    def test_from_row(self) -> None:
+        """
+        Test that from_row maps the storage columns, starting at the given offset, onto the entity.
+        """
+        row = ( "source", "res", "123", "T", "RUNNING", "inp", None, "2024-01-01T00:00:00", None,
+                "batch", None, "container", "blob" )
+        entity: TaskEntity = TaskEntity.from_row( row, 1 )
+        self.assertEqual( entity.ResourceId, "res" )
+        self.assertEqual( entity.RowKey, "123" )
+        self.assertEqual( entity.Status, "RUNNING" )
+        self.assertEqual( entity.StartTime, "2024-01-01T00:00:00" )
+        self.assertEqual( entity.BatchID, "batch" )
+        self.assertEqual( entity.BlobName, "blob" )
+        self.assertEqual( entity.to_dict(), TaskEntity.from_row( row[ 1: ] ).to_dict() )
+
+
+    def test_dirty_field_tracking(self) -> None:
+        """
+        Test that a new entity is fully dirty, that loaded entities start clean, and that only
+        changed fields (plus the keys) end up in to_partial_dict.
+        """
+        entity: TaskEntity = TaskEntity( PartitionKey = "res", RowKey = "123", InputPayload = "inp" )
+        self.assertIn( "InputPayload", entity.dirty_fields )
+        entity.mark_clean()
+        self.assertEqual( entity.dirty_fields, frozenset() )
+
+        loaded: TaskEntity = TaskEntity.from_dict( entity.to_dict() )
+        self.assertEqual( loaded.dirty_fields, frozenset() )
+        from_row: TaskEntity = TaskEntity.from_row( ( "res", "123", "T", "CREATED", "inp", None, None, None,
+                                                      None, None, None, None ) )
+        self.assertEqual( from_row.dirty_fields, frozenset() )
+
+        loaded.Status = loaded.Status
+        self.assertEqual( loaded.dirty_fields, frozenset() )
+        loaded.mark_running()
+        loaded.ErrorMessage = "boom"
+        self.assertEqual( loaded.to_partial_dict(), { "PartitionKey": "res", "RowKey": "123",
+                                                      "Status": "RUNNING", "ErrorMessage": "boom" } )
+
+    def test_deferred_field(self) -> None:
+        """
+        Test that a deferred field is loaded once on first access without becoming dirty, that
+        assigning it detaches the loader, and that copy_with leaves the original untouched.
+        """
+        calls = [ ]
+        entity: TaskEntity = TaskEntity.from_dict( { "PartitionKey": "res", "RowKey": "123" } )
+        entity.defer_field( "OutputPayload", lambda: calls.append( 1 ) or "loaded" )
+
+        copy: TaskEntity = entity.copy_with( { "OutputPayload": "ref" } )
+        self.assertEqual( copy.OutputPayload, "ref" )
+        self.assertEqual( calls, [ ] )
+
+        self.assertEqual( entity.OutputPayload, "loaded" )
+        self.assertEqual( entity.OutputPayload, "loaded" )
+        self.assertEqual( calls, [ 1 ] )
+        self.assertEqual( entity.dirty_fields, frozenset() )
+        self.assertIsNotNone( entity.field_loader( "OutputPayload" ) )
+
+        entity.OutputPayload = "changed"
+        self.assertIsNone( entity.field_loader( "OutputPayload" ) )
+        self.assertEqual( entity.dirty_fields, frozenset( { "OutputPayload" } ) )
+        with self.assertRaises( AttributeError ):
+            getattr( entity, "Missing" )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+import os
+import unittest
+from typing import Any
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.storage.tables.async_sqlite_task_store import AsyncSqliteTaskStore
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class TestAsyncSqliteTaskStore( unittest.IsolatedAsyncioTestCase ):
+    def setUp(self) -> None:
+        """
+        Set up an async SQLite task store backed by a temporary file.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+        self.task_store: AsyncSqliteTaskStore = AsyncSqliteTaskStore( db_path = self.db_path )
+        self.task_store.create_if_not_exists()
+
+    def tearDown(self) -> None:
+        """
+        Close the SQLite connection and remove the temporary database file.
+        """
+        self.task_store.close()
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+
+    async def test_lifecycle_async(self) -> None:
+        """
+        Test upsert, get, move_to_finished and delete through the coroutine methods, and that
+        the synchronous methods see the same data.
+        """
+        entity: TaskEntity = TaskEntity( PartitionKey = "res", RowKey = "123", TaskType = "TEST" )
+        self.assertTrue( await self.task_store.upsert_task_async( entity ) )
+        fetched: Any = await self.task_store.get_task_async( "res", "123" )
+        self.assertEqual( fetched.RowKey, "123" )
+        self.assertEqual( self.task_store.get_task( "res", "123" ).TaskType, "TEST" )
+
+        fetched.mark_completed()
+        await self.task_store.move_to_finished_async( fetched )
+        await self.task_store.delete_task_async( "res", "123" )
+        self.assertEqual( self.task_store.get_all_active_tasks( "res" ), [ ] )
+        finished: Any = await self.task_store.get_task_async( "res", "123" )
+        self.assertEqual( finished.Status, "COMPLETED" )
+
+    async def test_get_missing_task_async(self) -> None:
+        """
+        Test that a missing task yields None.
+        """
+        self.assertIsNone( await self.task_store.get_task_async( "res", "missing" ) )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ from azure.data.tables import TableServiceClient
 
 from Tests.tests_suites_helpers.test_helper import TestHelper
 from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_entity import TaskEntity
 from background_workflows.storage.tables.azure_task_store import AzureTaskStore
 
 
@@ -66,6 +67,62 @@ class TestAzureTaskStore(unittest.TestCase):
         # The creation is verified during setup. If no exception is raised, the test passes.
         self.assertTrue(True)
 
+    def test_status_update_merges_only_dirty_fields(self) -> None:
+        """
+        Test that a status change sends only the changed fields and keeps the stored payload.
+        """
+        self.store.upsert_task(TaskEntity(PartitionKey="res", RowKey="1", TaskType="T", InputPayload="payload"))
+        entity = self.store.get_task("res", "1")
+        self.assertEqual(entity.dirty_fields, frozenset())
+
+        entity.mark_running()
+        self.assertEqual(set(entity.to_partial_dict()), {"PartitionKey", "RowKey", "Status"})
+        self.store.upsert_task(entity)
+
+        self.assertEqual(entity.dirty_fields, frozenset())
+        stored = self.store.get_task("res", "1")
+        self.assertEqual(stored.Status, "RUNNING")
+        self.assertEqual(stored.InputPayload, "payload")
+
+
+
+class TestAzureTaskStoreTransactions(unittest.TestCase):
+    def test_transaction_chunks_group_by_partition(self) -> None:
+        """
+        Test that operations are grouped per partition and split at the operation limit.
+        """
+        operations = [ ( "upsert", { "PartitionKey": f"res-{i % 2}", "RowKey": str( i ) } ) for i in range( 250 ) ]
+
+        chunks = AzureTaskStore._transaction_chunks( operations )
+
+        self.assertEqual( [ len( chunk ) for chunk in chunks ], [ 100, 25, 100, 25 ] )
+        for chunk in chunks:
+            self.assertEqual( len( { data[ "PartitionKey" ] for _, data in chunk } ), 1 )
+
+    def test_transaction_chunks_respect_size_limit(self) -> None:
+        """
+        Test that large entities are split into several transactions below the request size limit.
+        """
+        payload: str = "x" * 1_000_000
+        operations = [ ( "upsert", { "PartitionKey": "res", "RowKey": str( i ), "OutputPayload": payload } )
+                       for i in range( 7 ) ]
+
+        chunks = AzureTaskStore._transaction_chunks( operations )
+
+        self.assertEqual( [ len( chunk ) for chunk in chunks ], [ 3, 3, 1 ] )
+
+    def test_latest_state_wins(self) -> None:
+        """
+        Test that repeated updates of one task are merged into a single write of its last state.
+        """
+        running = TaskEntity( PartitionKey = "res", RowKey = "1", Status = "RUNNING" )
+        completed = TaskEntity( PartitionKey = "res", RowKey = "1", Status = "COMPLETED" )
+
+        latest = AzureTaskStore._latest_by_key( [ running, completed ] )
+
+        self.assertEqual( list( latest ), [ ( "res", "1" ) ] )
+        self.assertEqual( latest[ ( "res", "1" ) ][ "Status" ], "COMPLETED" )
+
 
 if __name__ == "__main__":
     unittest.main()
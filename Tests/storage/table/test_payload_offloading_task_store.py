@@ -0,0 +1,147 @@
+import gzip
+import json
+import os
+import shutil
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from Tests.storage.blob.test_payload_offloader import CountingBlobStore
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.payload_offloader import PayloadOffloader
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.payload_offloading_task_store import PayloadOffloadingTaskStore
+from background_workflows.storage.tables.sqlite_task_maintenance import SqliteTaskMaintenance
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+
+
+class TestPayloadOffloadingTaskStore( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up an in-memory SQLite store wrapped with a 100-character offload threshold.
+        """
+        self.root: str = f"test_blobs_TestPayloadOffloadingTaskStore_{uuid.uuid4().hex[ :6 ]}"
+        self.blob_store: CountingBlobStore = CountingBlobStore( self.root )
+        self.inner: SqliteTaskStore = SqliteTaskStore( ":memory:" )
+        self.task_store: PayloadOffloadingTaskStore = PayloadOffloadingTaskStore(
+            self.inner, PayloadOffloader( self.blob_store, "payloads", threshold = 100 )
+        )
+        self.task_store.create_if_not_exists()
+        self.input_payload: str = '{"data": "' + "i" * 1000 + '"}'
+
+    def tearDown(self) -> None:
+        """
+        Close the store and remove the blob root directory.
+        """
+        self.task_store.close()
+        shutil.rmtree( self.root, ignore_errors = True )
+
+    def _blob_count(self) -> int:
+        """
+        Return the number of payload blobs on disk.
+        """
+        container: str = os.path.join( self.root, "payloads" )
+        return len( os.listdir( container ) ) if os.path.isdir( container ) else 0
+
+    def test_task_lifecycle(self) -> None:
+        """
+        Test that large payloads are kept out of the rows, loaded on first access, and that
+        completing a task reuses the input blob instead of uploading it again.
+        """
+        self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "row", InputPayload = self.input_payload ) )
+        self.assertTrue( PayloadOffloader.is_reference( self.inner.get_task( "res", "row" ).InputPayload ) )
+
+        entity: TaskEntity = self.task_store.get_task( "res", "row" )
+        self.assertEqual( self.blob_store.downloads, 0 )
+        self.assertEqual( entity.InputPayload, self.input_payload )
+        self.assertEqual( self.blob_store.downloads, 1 )
+
+        entity.OutputPayload = "o" * 1000
+        entity.mark_completed()
+        self.task_store.complete_task( entity )
+        self.assertEqual( self.blob_store.uploads, 2 )
+
+        finished: TaskEntity = self.task_store.get_task( "res", "row", AppConstants.TaskLocations.FINISHED )
+        self.assertEqual( finished.OutputPayload, "o" * 1000 )
+        self.assertEqual( finished.InputPayload, self.input_payload )
+
+    def test_queries_do_not_download(self) -> None:
+        """
+        Test that paging through tasks leaves their payloads in blob storage until accessed.
+        """
+        self.task_store.upsert_tasks(
+            [ TaskEntity( PartitionKey = "res", RowKey = f"row-{i}", Status = "CREATED", InputPayload = self.input_payload )
+              for i in range( 3 ) ]
+        )
+
+        page = self.task_store.query_tasks_by_status( "CREATED" )
+        self.assertEqual( len( page ), 3 )
+        self.assertEqual( self.blob_store.downloads, 0 )
+        self.assertEqual( page.items[ 0 ].InputPayload, self.input_payload )
+
+    def test_delete_task_removes_blobs(self) -> None:
+        """
+        Test that deleting an active task deletes its payload blobs.
+        """
+        self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "row", InputPayload = self.input_payload ) )
+        self.assertEqual( self._blob_count(), 1 )
+
+        self.task_store.delete_task( "res", "row" )
+        self.assertEqual( self._blob_count(), 0 )
+
+    def test_maintenance_purges_blobs(self) -> None:
+        """
+        Test that purging finished rows also deletes their payload blobs, and that the archive
+        holds the payloads themselves.
+        """
+        db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        archive_dir: str = f"test_archive_{uuid.uuid4().hex[ :6 ]}"
+        inner: SqliteTaskStore = SqliteTaskStore( db_path )
+        store = PayloadOffloadingTaskStore( inner, self.task_store.offloader )
+        store.create_if_not_exists()
+        try:
+            store.complete_task( TaskEntity( PartitionKey = "res", RowKey = "old", Status = "COMPLETED",
+                                             OutputPayload = "o" * 1000,
+                                             EndTime = datetime.utcnow() - timedelta( days = 2 ) ) )
+            self.assertEqual( self._blob_count(), 1 )
+
+            report = SqliteTaskMaintenance( inner, max_age = timedelta( days = 1 ), archive_dir = archive_dir,
+                                            payload_offloader = store.offloader ).run()
+            self.assertEqual( ( report.deleted, report.deleted_blobs ), ( 1, 1 ) )
+            self.assertEqual( self._blob_count(), 0 )
+            with gzip.open( report.archive_files[ 0 ], "rt", encoding = "utf-8" ) as archive:
+                self.assertEqual( json.loads( archive.readline() )[ "OutputPayload" ], "o" * 1000 )
+        finally:
+            store.close()
+            shutil.rmtree( archive_dir, ignore_errors = True )
+            if os.path.exists( db_path ):
+                os.remove( db_path )
+
+    def test_factory_wraps_store(self) -> None:
+        """
+        Test that a positive payload_offload_threshold makes the factory wrap the store, and that
+        from_task_store keeps the offload settings.
+        """
+        db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        factory = TaskStoreFactory( store_mode = AppConstants.TaskStoreFactory.StoreModes.SQLITE,
+                                    sqlite_db_path = db_path, payload_offload_threshold = 500,
+                                    payload_container_name = "factory-payloads" )
+        store = factory.get_task_store()
+        try:
+            self.assertIsInstance( store, PayloadOffloadingTaskStore )
+            derived = TaskStoreFactory.from_task_store( store )
+            self.assertEqual( ( derived.payload_offload_threshold, derived.payload_container_name ),
+                              ( 500, "factory-payloads" ) )
+        finally:
+            store.close()
+            shutil.rmtree( os.path.join( AppConstants.LocalBlob.ROOT_DIR, "factory-payloads" ), ignore_errors = True )
+            if not os.listdir( AppConstants.LocalBlob.ROOT_DIR ):
+                os.rmdir( AppConstants.LocalBlob.ROOT_DIR )
+            if os.path.exists( db_path ):
+                os.remove( db_path )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.tables.sharded_sqlite_task_store import ShardedSqliteTaskStore
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class TestShardedSqliteTaskStore( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up a three-shard file-backed store with running tasks for ten resources and
+        finished tasks for six of them.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        self.task_store: ShardedSqliteTaskStore = ShardedSqliteTaskStore( self.db_path, shard_count = 3 )
+        self.task_store.create_if_not_exists()
+        self.base_time: datetime = datetime( 2024, 1, 1, 12, 0, 0 )
+        for i in range( 10 ):
+            self.task_store.upsert_task(
+                TaskEntity( PartitionKey = f"res-{i}", RowKey = f"run-{i}", TaskType = "A", Status = "RUNNING" )
+            )
+        for i in range( 6 ):
+            self.task_store.complete_task(
+                TaskEntity( PartitionKey = f"res-{i}", RowKey = f"done-{i}", TaskType = "A", Status = "COMPLETED",
+                            EndTime = self.base_time + timedelta( minutes = 10 * i ) )
+            )
+
+    def tearDown(self) -> None:
+        """
+        Close every shard and remove the shard files.
+        """
+        self.task_store.close()
+        for index in range( self.task_store.shard_count ):
+            path: str = ShardedSqliteTaskStore.shard_path( self.db_path, index, self.task_store.shard_count )
+            if os.path.exists( path ):
+                os.remove( path )
+
+    def _read_all_pages(self, query: Any, **kwargs: Any) -> List[ TaskEntity ]:
+        """
+        Follow continuation tokens until the last page and return every item.
+        """
+        items: List[ TaskEntity ] = [ ]
+        token: Optional[ str ] = None
+        while True:
+            page = query( continuation_token = token, **kwargs )
+            items.extend( page.items )
+            if not page.has_more:
+                return items
+            token = page.continuation_token
+
+    def test_tasks_are_spread_over_shard_files(self) -> None:
+        """
+        Test that each resource's task is stored only in the shard chosen for it, and that more
+        than one shard file is used.
+        """
+        used = set()
+        for i in range( 10 ):
+            index: int = self.task_store.shard_index( f"res-{i}" )
+            used.add( index )
+            for other, shard in enumerate( self.task_store.shards ):
+                found = shard.get_task( f"res-{i}", f"run-{i}" )
+                self.assertEqual( found is not None, other == index )
+        self.assertGreater( len( used ), 1 )
+        self.assertTrue( os.path.exists( ShardedSqliteTaskStore.shard_path( self.db_path, 0, 3 ) ) )
+
+    def test_point_operations_are_routed(self) -> None:
+        """
+        Test get_task, get_tasks and delete_task through the sharded store.
+        """
+        self.assertEqual( self.task_store.get_task( "res-3", "run-3" ).Status, "RUNNING" )
+        self.assertEqual( self.task_store.get_task( "res-3", "done-3" ).Status, "COMPLETED" )
+
+        found = self.task_store.get_tasks( [ ( f"res-{i}", f"done-{i}" ) for i in range( 8 ) ] )
+        self.assertEqual( sorted( key[ 1 ] for key in found ), [ f"done-{i}" for i in range( 6 ) ] )
+
+        self.task_store.delete_task( "res-3", "run-3" )
+        self.assertIsNone( self.task_store.get_task( "res-3", "run-3" ) )
+
+    def test_batched_writes_are_routed(self) -> None:
+        """
+        Test that upsert_tasks and finish_tasks write each entity to its own shard.
+        """
+        entities = [ TaskEntity( PartitionKey = f"res-{i}", RowKey = f"new-{i}", TaskType = "B" ) for i in range( 10 ) ]
+        self.assertTrue( self.task_store.upsert_tasks( entities ) )
+        for entity in entities:
+            self.assertIsNotNone( self.task_store.shard_for( entity.ResourceId ).get_task( entity.ResourceId, entity.RowKey ) )
+
+        for entity in entities:
+            entity.mark_completed()
+        self.task_store.finish_tasks( entities )
+        found = self.task_store.get_tasks( [ ( e.ResourceId, e.RowKey ) for e in entities ],
+                                           location = AppConstants.TaskLocations.FINISHED )
+        self.assertEqual( len( found ), 10 )
+
+    def test_query_by_status_merges_shards(self) -> None:
+        """
+        Test that paging by status across shards returns every matching task exactly once.
+        """
+        items = self._read_all_pages( self.task_store.query_tasks_by_status, status = "RUNNING", page_size = 3 )
+
+        self.assertEqual( sorted( item.RowKey for item in items ), sorted( f"run-{i}" for i in range( 10 ) ) )
+
+    def test_query_by_end_time_is_globally_ordered(self) -> None:
+        """
+        Test that an end-time query across shards is ordered oldest first and honours the range.
+        """
+        items = self._read_all_pages(
+            self.task_store.query_tasks_by_end_time,
+            start = self.base_time + timedelta( minutes = 10 ),
+            end = self.base_time + timedelta( minutes = 50 ),
+            page_size = 2,
+        )
+
+        self.assertEqual( [ item.RowKey for item in items ], [ "done-1", "done-2", "done-3", "done-4" ] )
+
+    def test_foreign_token_is_rejected(self) -> None:
+        """
+        Test that a continuation token from a store with another shard count is rejected.
+        """
+        with self.assertRaises( ValueError ):
+            self.task_store.query_tasks_by_status( "RUNNING", continuation_token = "[null, null]" )
+
+    def test_factory_mode(self) -> None:
+        """
+        Test that the factory builds a sharded store and can recreate its configuration.
+        """
+        factory: TaskStoreFactory = TaskStoreFactory(
+            store_mode = AppConstants.TaskStoreFactory.StoreModes.SQLITE_SHARDED,
+            sqlite_db_path = self.db_path,
+            sqlite_shard_count = 3,
+        )
+        store = factory.get_task_store()
+        self.assertIsInstance( store, ShardedSqliteTaskStore )
+        self.assertEqual( store.get_task( "res-5", "run-5" ).Status, "RUNNING" )
+        self.assertEqual( TaskStoreFactory.from_task_store( store ).sqlite_shard_count, 3 )
+        store.close()
+
+
+class TestShardedSqliteTaskStoreWriteBehind( unittest.TestCase ):
+    def test_each_shard_has_its_own_writer(self) -> None:
+        """
+        Test that write-behind starts one writer per shard and that flush() covers all of them.
+        """
+        db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        store: ShardedSqliteTaskStore = ShardedSqliteTaskStore( db_path, shard_count = 2, write_behind = True )
+        store.create_if_not_exists()
+        try:
+            self.assertEqual( len( { id( shard._writer ) for shard in store.shards } ), 2 )
+            for i in range( 20 ):
+                store.upsert_task( TaskEntity( PartitionKey = f"res-{i}", RowKey = f"row-{i}", TaskType = "T" ) )
+            self.assertTrue( store.flush( timeout = 10 ) )
+            self.assertEqual( len( store.get_tasks( [ ( f"res-{i}", f"row-{i}" ) for i in range( 20 ) ] ) ), 20 )
+        finally:
+            store.close()
+            for index in range( 2 ):
+                for suffix in ( "", "-wal", "-shm" ):
+                    path: str = ShardedSqliteTaskStore.shard_path( db_path, index, 2 ) + suffix
+                    if os.path.exists( path ):
+                        os.remove( path )
+
+
+if __name__ == "__main__":
+    unittest.main()
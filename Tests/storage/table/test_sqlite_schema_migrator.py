@@ -0,0 +1,142 @@
+import os
+import sqlite3
+import unittest
+from datetime import datetime
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.storage.tables.sqlite_schema_migrator import SqliteSchemaMigrator, TASK_TABLE_COLUMNS
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class TestSqliteSchemaMigrator( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Use a fresh database file for every test.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary database file.
+        """
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+
+    def _index_names(self, conn: sqlite3.Connection, table: str) -> set:
+        """
+        Return the names of the explicit indexes of a table.
+        """
+        return { row[ 1 ] for row in conn.execute( f"PRAGMA index_list({table})" ).fetchall()
+                 if not row[ 1 ].startswith( "sqlite_autoindex" ) }
+
+    def test_new_database_is_created_at_latest_version(self) -> None:
+        """
+        Test that a new database gets its tables, indexes and the latest user_version.
+        """
+        store: SqliteTaskStore = SqliteTaskStore( self.db_path, "active", "finished" )
+        store.create_if_not_exists()
+        conn = store.connection()
+        migrator = SqliteSchemaMigrator( conn, "active", "finished" )
+
+        self.assertEqual( migrator.current_version(), migrator.latest_version )
+        self.assertEqual( len( self._index_names( conn, "active" ) ), 4 )
+        store.close()
+
+    def test_existing_database_is_upgraded_in_place(self) -> None:
+        """
+        Test that a database created before versioning (tables only, user_version 0) is
+        upgraded without losing rows.
+        """
+        conn = sqlite3.connect( self.db_path )
+        with conn:
+            for table in ( "active", "finished" ):
+                conn.execute( f"CREATE TABLE {table} ({TASK_TABLE_COLUMNS})" )
+            conn.execute( "INSERT INTO active (resource_id, row_key, status) VALUES ('res', 'old', 'RUNNING')" )
+        conn.close()
+
+        store: SqliteTaskStore = SqliteTaskStore( self.db_path, "active", "finished" )
+        store.create_if_not_exists()
+        conn = store.connection()
+
+        self.assertEqual( store.get_task( "res", "old" ).Status, "RUNNING" )
+        self.assertEqual( len( self._index_names( conn, "finished" ) ), 4 )
+        self.assertEqual( conn.execute( "PRAGMA user_version" ).fetchone()[ 0 ],
+                          SqliteSchemaMigrator( conn, "active", "finished" ).latest_version )
+        store.close()
+
+    def test_legacy_timestamps_are_normalized(self) -> None:
+        """
+        Test that timestamps written with a space separator by older versions are rewritten to
+        ISO-8601 "T" form, so end_time range queries find those rows.
+        """
+        conn = sqlite3.connect( self.db_path )
+        with conn:
+            for table in ( "active", "finished" ):
+                conn.execute( f"CREATE TABLE {table} ({TASK_TABLE_COLUMNS})" )
+            conn.execute( "INSERT INTO finished (resource_id, row_key, status, start_time, end_time) "
+                          "VALUES ('res', 'old', 'COMPLETED', '2026-10-01 11:00:00', '2026-10-01 12:00:00.5')" )
+            conn.execute( "PRAGMA user_version = 2" )
+        conn.close()
+
+        store: SqliteTaskStore = SqliteTaskStore( self.db_path, "active", "finished" )
+        store.create_if_not_exists()
+        row = store.connection().execute( "SELECT start_time, end_time FROM finished" ).fetchone()
+        page = store.query_tasks_by_end_time( datetime( 2026, 10, 1, 11, 30 ), datetime( 2026, 10, 1, 13 ) )
+
+        self.assertEqual( row, ( "2026-10-01T11:00:00", "2026-10-01T12:00:00.5" ) )
+        self.assertEqual( [ task.RowKey for task in page.items ], [ "old" ] )
+        store.close()
+
+    def test_new_table_pair_in_migrated_database(self) -> None:
+        """
+        Test that a store with different table names still gets its tables in an up-to-date file.
+        """
+        first: SqliteTaskStore = SqliteTaskStore( self.db_path, "active_a", "finished_a" )
+        first.create_if_not_exists()
+        second: SqliteTaskStore = SqliteTaskStore( self.db_path, "active_b", "finished_b" )
+        second.create_if_not_exists()
+
+        self.assertTrue( second.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "1", TaskType = "T" ) ) )
+        self.assertEqual( len( self._index_names( second.connection(), "active_b" ) ), 4 )
+        first.close()
+        second.close()
+
+    def test_failed_migration_rolls_back(self) -> None:
+        """
+        Test that a failing migration leaves neither partial DDL nor a bumped user_version.
+        """
+        class BrokenMigrator( SqliteSchemaMigrator ):
+            def migrations(self):
+                return super().migrations() + [ self._broken ]
+
+            def _broken(self) -> None:
+                self.add_column_if_missing( self.active_table_name, "extra", "TEXT" )
+                raise sqlite3.OperationalError( "boom" )
+
+        conn = sqlite3.connect( self.db_path )
+        SqliteSchemaMigrator( conn, "active", "finished" ).migrate()
+        with self.assertRaises( sqlite3.OperationalError ):
+            BrokenMigrator( conn, "active", "finished" ).migrate()
+
+        columns = { row[ 1 ] for row in conn.execute( "PRAGMA table_info(active)" ).fetchall() }
+        self.assertNotIn( "extra", columns )
+        self.assertEqual( conn.execute( "PRAGMA user_version" ).fetchone()[ 0 ],
+                          SqliteSchemaMigrator( conn, "active", "finished" ).latest_version )
+        conn.close()
+
+    def test_memory_database_is_migrated_once(self) -> None:
+        """
+        Test that ":memory:" databases are migrated like files and that calling
+        create_if_not_exists() again keeps the same database.
+        """
+        store: SqliteTaskStore = SqliteTaskStore( ":memory:" )
+        store.create_if_not_exists()
+        store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "mem", TaskType = "T" ) )
+        store.create_if_not_exists()
+
+        self.assertIsNotNone( store.get_task( "res", "mem" ) )
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
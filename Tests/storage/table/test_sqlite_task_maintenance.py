@@ -0,0 +1,135 @@
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import unittest
+from datetime import datetime, timedelta
+from typing import List
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.storage.tables.sqlite_task_maintenance import SqliteTaskMaintenance, main
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class TestSqliteTaskMaintenance( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up a file-backed store with ten finished tasks, one per day, ending today,
+        plus one active task.
+        """
+        guid: str = TestHelper.generate_guid_for_local_db()
+        self.db_path: str = f"test_tasks_{guid}.db"
+        self.archive_dir: str = f"test_archive_{guid}"
+        self.task_store: SqliteTaskStore = SqliteTaskStore( self.db_path, "active", "finished" )
+        self.task_store.create_if_not_exists()
+        now: datetime = datetime.utcnow()
+        for day in range( 10 ):
+            self.task_store.complete_task(
+                TaskEntity( PartitionKey = "res", RowKey = f"done-{day}", TaskType = "T", Status = "COMPLETED",
+                            OutputPayload = "x" * 4096, EndTime = now - timedelta( days = day, minutes = 1 ) )
+            )
+        self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "running", Status = "RUNNING" ) )
+
+    def tearDown(self) -> None:
+        """
+        Close the store and remove the database file and archive directory.
+        """
+        self.task_store.close()
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+        shutil.rmtree( self.archive_dir, ignore_errors = True )
+
+    def _finished_keys(self) -> List[ str ]:
+        """
+        Return the row keys left in the finished table.
+        """
+        rows = self.task_store.connection().execute( "SELECT row_key FROM finished ORDER BY row_key" ).fetchall()
+        return [ row[ 0 ] for row in rows ]
+
+    def _archived_keys(self) -> List[ str ]:
+        """
+        Return the row keys stored in every archive file.
+        """
+        keys: List[ str ] = [ ]
+        for root, _, files in os.walk( self.archive_dir ):
+            for name in files:
+                with gzip.open( os.path.join( root, name ), "rt", encoding = "utf-8" ) as archive:
+                    keys.extend( json.loads( line )[ "RowKey" ] for line in archive if line.strip() )
+        return sorted( keys )
+
+    def test_age_retention_archives_then_deletes_in_batches(self) -> None:
+        """
+        Test that rows older than max_age are archived by day and deleted, in several batches.
+        """
+        report = SqliteTaskMaintenance(
+            self.task_store, max_age = timedelta( days = 3 ), archive_dir = self.archive_dir, batch_size = 2
+        ).run()
+
+        expired = sorted( f"done-{day}" for day in range( 3, 10 ) )
+        self.assertEqual( report.deleted, 7 )
+        self.assertEqual( report.archived, 7 )
+        self.assertEqual( len( report.archive_files ), 7 )
+        self.assertEqual( self._archived_keys(), expired )
+        self.assertEqual( self._finished_keys(), [ "done-0", "done-1", "done-2" ] )
+        self.assertIsNotNone( self.task_store.get_task( "res", "running" ) )
+
+    def test_count_retention_keeps_most_recent(self) -> None:
+        """
+        Test that only the max_rows most recent finished rows are kept.
+        """
+        report = SqliteTaskMaintenance( self.task_store, max_rows = 4, batch_size = 3 ).run()
+
+        self.assertEqual( report.deleted, 6 )
+        self.assertEqual( report.archive_files, [ ] )
+        self.assertEqual( self._finished_keys(), [ "done-0", "done-1", "done-2", "done-3" ] )
+
+    def test_incremental_vacuum_releases_pages(self) -> None:
+        """
+        Test that new databases use incremental auto-vacuum and that purged pages are released.
+        """
+        conn = self.task_store.connection()
+        self.assertEqual( conn.execute( "PRAGMA auto_vacuum" ).fetchone()[ 0 ], 2 )
+        pages_before: int = conn.execute( "PRAGMA page_count" ).fetchone()[ 0 ]
+
+        report = SqliteTaskMaintenance( self.task_store, max_rows = 0 ).run()
+
+        self.assertGreater( report.vacuumed_pages, 0 )
+        self.assertLess( conn.execute( "PRAGMA page_count" ).fetchone()[ 0 ], pages_before )
+
+    def test_full_vacuum_enables_incremental_mode(self) -> None:
+        """
+        Test that a legacy database (auto_vacuum off) is only converted when full_vacuum is requested.
+        """
+        conn = sqlite3.connect( self.db_path )
+        conn.execute( "PRAGMA auto_vacuum = 0" )
+        conn.execute( "VACUUM" )
+        conn.close()
+        maintenance = SqliteTaskMaintenance( self.task_store, max_rows = 100 )
+
+        self.assertEqual( maintenance.compact(), 0 )
+        maintenance.compact( full_vacuum = True )
+        self.assertEqual( self.task_store.connection().execute( "PRAGMA auto_vacuum" ).fetchone()[ 0 ], 2 )
+
+    def test_requires_a_policy(self) -> None:
+        """
+        Test that a retention policy must be given.
+        """
+        with self.assertRaises( ValueError ):
+            SqliteTaskMaintenance( self.task_store )
+
+    def test_entry_point(self) -> None:
+        """
+        Test the command-line entry point against the same database.
+        """
+        report = main( [
+            "--db-path", self.db_path, "--active-table", "active", "--finished-table", "finished",
+            "--max-age-days", "5", "--archive-dir", self.archive_dir,
+        ] )
+
+        self.assertEqual( report.deleted, 5 )
+        self.assertEqual( len( self._archived_keys() ), 5 )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 import os
+import sqlite3
+import threading
+import time
 import unittest
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
 from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.constants.app_constants import AppConstants
 from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
 from background_workflows.storage.schemas.task_entity import TaskEntity
 
@@ -72,6 +77,428 @@ class TestSqliteTaskStore( unittest.TestCase ):
         still_exists: Optional[ TaskEntity ] = self.task_store.get_task( "res", "123" )
         self.assertIsNotNone( still_exists, "Task should exist in finished tasks after move." )
 
+    def test_get_task_single_probe_and_location_hint(self) -> None:
+        """
+        Test that get_task finds active and finished tasks in one statement, prefers the active
+        row when a task is in both tables, and only reads the hinted table when given a location.
+        """
+        active: TaskEntity = TaskEntity( PartitionKey = "res", RowKey = "both", Status = "RUNNING" )
+        self.task_store.upsert_task( active )
+        self.task_store.move_to_finished( TaskEntity( PartitionKey = "res", RowKey = "both", Status = "COMPLETED" ) )
+        self.task_store.complete_task( TaskEntity( PartitionKey = "res", RowKey = "done", Status = "COMPLETED" ) )
+
+        statements: List[ str ] = [ ]
+        self.task_store._conn.set_trace_callback( statements.append )
+        self.assertEqual( self.task_store.get_task( "res", "done" ).Status, "COMPLETED" )
+        self.task_store._conn.set_trace_callback( None )
+        self.assertEqual( len( statements ), 1 )
+
+        self.assertEqual( self.task_store.get_task( "res", "both" ).Status, "RUNNING" )
+        finished = AppConstants.TaskLocations.FINISHED
+        self.assertEqual( self.task_store.get_task( "res", "both", location = finished ).Status, "COMPLETED" )
+        self.assertIsNone( self.task_store.get_task( "res", "done", location = AppConstants.TaskLocations.ACTIVE ) )
+        self.assertIsNone( self.task_store.get_task( "res", "missing" ) )
+
+    def test_get_tasks_bulk(self) -> None:
+        """
+        Test that get_tasks returns active and finished tasks across statement chunks, skips
+        missing keys and honours the location hint.
+        """
+        keys = [ ( f"res-{i % 3}", f"row-{i}" ) for i in range( 1200 ) ]
+        for resource_id, row_key in keys[ :600 ]:
+            self.task_store.upsert_task( TaskEntity( PartitionKey = resource_id, RowKey = row_key, Status = "RUNNING" ) )
+        for resource_id, row_key in keys[ 600:1100 ]:
+            self.task_store.complete_task( TaskEntity( PartitionKey = resource_id, RowKey = row_key, Status = "COMPLETED" ) )
+
+        found = self.task_store.get_tasks( keys + [ keys[ 0 ] ] )
+        self.assertEqual( len( found ), 1100 )
+        self.assertEqual( found[ keys[ 0 ] ].Status, "RUNNING" )
+        self.assertEqual( found[ keys[ 700 ] ].Status, "COMPLETED" )
+        self.assertNotIn( keys[ 1150 ], found )
+
+        finished_only = self.task_store.get_tasks( keys, location = AppConstants.TaskLocations.FINISHED )
+        self.assertEqual( len( finished_only ), 500 )
+        self.assertEqual( self.task_store.get_tasks( [ ] ), { } )
+
+    def test_get_tasks_within_legacy_variable_limit(self) -> None:
+        """
+        Test that get_tasks works on connections limited to 999 bound variables (SQLite builds
+        before 3.32), fetching more keys than fit in one statement.
+        """
+        conn = self.task_store.connection()
+        conn.setlimit( sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, AppConstants.TaskQueries.SQLITE_LEGACY_MAX_VARIABLES )
+        count: int = AppConstants.TaskQueries.MAX_KEYS_PER_STATEMENT * 2 + 1
+        keys = [ ( "res", f"row-{i}" ) for i in range( count ) ]
+        self.task_store.upsert_tasks( [ TaskEntity( PartitionKey = rid, RowKey = rk ) for rid, rk in keys ] )
+
+        self.assertEqual( len( self.task_store.get_tasks( keys ) ), count )
+
+    def test_complete_task_is_atomic_and_idempotent(self) -> None:
+        """
+        Test that complete_task moves the task to the finished table and removes it from the
+        active table in one commit, and that repeating it (e.g., for a redelivered message) is harmless.
+        """
+        entity: TaskEntity = TaskEntity( PartitionKey = "res", RowKey = "123", TaskType = "TEST" )
+        self.task_store.upsert_task( entity )
+        entity.mark_completed()
+
+        changes_before: int = self.task_store._conn.total_changes
+        self.task_store.complete_task( entity )
+        self.assertEqual( self.task_store._conn.total_changes - changes_before, 2 )
+        self.assertEqual( self.task_store.get_all_active_tasks( "res" ), [ ] )
+        self.assertEqual( self.task_store.get_task( "res", "123" ).Status, "COMPLETED" )
+
+        self.task_store.complete_task( entity )
+        self.assertEqual( self.task_store.get_task( "res", "123" ).Status, "COMPLETED" )
+
+    def test_upsert_and_finish_tasks_in_one_transaction(self) -> None:
+        """
+        Test that upsert_tasks and finish_tasks each apply all their rows in one commit, and that
+        a repeated key keeps its last state.
+        """
+        entities = [ TaskEntity( PartitionKey = "res", RowKey = f"row-{i}", TaskType = "T", Status = "RUNNING" )
+                     for i in range( 5 ) ]
+        self.assertTrue( self.task_store.upsert_tasks( entities + [
+            TaskEntity( PartitionKey = "res", RowKey = "row-0", Status = "COMPLETED" ) ] ) )
+        self.assertEqual( len( self.task_store.get_all_active_tasks( "res" ) ), 5 )
+        self.assertEqual( self.task_store.get_task( "res", "row-0" ).Status, "COMPLETED" )
+
+        for entity in entities:
+            entity.mark_completed()
+        entities[ 1 ].mark_error()
+        self.task_store.finish_tasks( entities[ :3 ] )
+
+        self.assertEqual( len( self.task_store.get_all_active_tasks( "res" ) ), 2 )
+        finished = self.task_store.get_tasks( [ ( "res", f"row-{i}" ) for i in range( 3 ) ],
+                                              location = AppConstants.TaskLocations.FINISHED )
+        self.assertEqual( [ finished[ ( "res", f"row-{i}" ) ].Status for i in range( 3 ) ],
+                          [ "COMPLETED", "ERROR", "COMPLETED" ] )
+
+    def test_fail_task_rolls_back_on_error(self) -> None:
+        """
+        Test that a failure inside fail_task (here, the DELETE hitting a missing table) rolls back
+        the finished-table INSERT and leaves the active row untouched.
+        """
+        entity: TaskEntity = TaskEntity( PartitionKey = "res", RowKey = "123", TaskType = "TEST" )
+        self.task_store.upsert_task( entity )
+        entity.mark_error()
+        original_table: str = self.task_store.active_table_name
+        self.task_store.active_table_name = "NoSuchTable"
+        with self.assertRaises( Exception ):
+            self.task_store.fail_task( entity )
+        self.task_store.active_table_name = original_table
+
+        self.assertEqual( len( self.task_store.get_all_active_tasks( "res" ) ), 1 )
+        finished_rows: int = self.task_store._conn.execute(
+            f"SELECT COUNT(*) FROM {self.task_store.finished_table_name}"
+        ).fetchone()[ 0 ]
+        self.assertEqual( finished_rows, 0 )
+
+
+class TestSqliteTaskStoreQueries( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up a file-backed SQLite task store with a mix of active and finished tasks.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        self.task_store: SqliteTaskStore = SqliteTaskStore( db_path = self.db_path )
+        self.task_store.create_if_not_exists()
+        self.base_time: datetime = datetime( 2024, 1, 1, 12, 0, 0 )
+        for i in range( 7 ):
+            self.task_store.upsert_task(
+                TaskEntity( PartitionKey = f"res-{i % 2}", RowKey = f"run-{i}", TaskType = "A" if i % 2 else "B", Status = "RUNNING" )
+            )
+        for i in range( 5 ):
+            self.task_store.complete_task(
+                TaskEntity( PartitionKey = "res", RowKey = f"done-{i}", TaskType = "A", Status = "COMPLETED",
+                            EndTime = self.base_time + timedelta( minutes = 10 * i ) )
+            )
+
+    def tearDown(self) -> None:
+        """
+        Close the SQLite connection and remove the temporary database file.
+        """
+        self.task_store.close()
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+
+    def _read_all_pages(self, query: Any, **kwargs: Any) -> List[ TaskEntity ]:
+        """
+        Follow continuation tokens until the last page and return every item.
+        """
+        items: List[ TaskEntity ] = [ ]
+        token: Optional[ str ] = None
+        while True:
+            page = query( continuation_token = token, **kwargs )
+            items.extend( page.items )
+            if not page.has_more:
+                return items
+            token = page.continuation_token
+
+    def test_indexes_created(self) -> None:
+        """
+        Test that both tables have indexes on status, task_type, batch_id and end_time.
+        """
+        conn = self.task_store.connection()
+        for table in ( self.task_store.active_table_name, self.task_store.finished_table_name ):
+            indexed = { row[ 0 ] for row in conn.execute( f"SELECT ii.name FROM pragma_index_list('{table}') il, "
+                                                           "pragma_index_info(il.name) ii" ).fetchall() }
+            self.assertTrue( { "status", "task_type", "batch_id", "end_time" } <= indexed )
+
+    def test_status_query_uses_index(self) -> None:
+        """
+        Test that a status query is an index search rather than a full table scan.
+        """
+        plan = self.task_store.connection().execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {self.task_store.active_table_name} WHERE status = ? ORDER BY rowid",
+            ( "RUNNING", ),
+        ).fetchall()
+        self.assertIn( "USING INDEX", " ".join( str( row[ -1 ] ) for row in plan ) )
+
+    def test_query_by_status_paginates(self) -> None:
+        """
+        Test that pages of a status query cover every match exactly once.
+        """
+        first = self.task_store.query_tasks_by_status( "RUNNING", page_size = 3 )
+        self.assertEqual( len( first ), 3 )
+        self.assertTrue( first.has_more )
+
+        items = self._read_all_pages( self.task_store.query_tasks_by_status, status = "RUNNING", page_size = 3 )
+        self.assertEqual( sorted( t.RowKey for t in items ), sorted( f"run-{i}" for i in range( 7 ) ) )
+
+    def test_query_by_type_and_location(self) -> None:
+        """
+        Test that type queries are scoped to the requested location.
+        """
+        active = self._read_all_pages( self.task_store.query_tasks_by_type, task_type = "A", page_size = 2 )
+        finished = self.task_store.query_tasks_by_type( "A", location = AppConstants.TaskLocations.FINISHED )
+        self.assertEqual( len( active ), 3 )
+        self.assertEqual( len( finished ), 5 )
+        self.assertFalse( finished.has_more )
+
+    def test_query_by_end_time_range(self) -> None:
+        """
+        Test that the time-range query is half-open, ordered by EndTime and paginated.
+        """
+        start = self.base_time + timedelta( minutes = 10 )
+        end = self.base_time + timedelta( minutes = 40 )
+        items = self._read_all_pages(
+            self.task_store.query_tasks_by_end_time, start = start, end = end, page_size = 2
+        )
+        self.assertEqual( [ t.RowKey for t in items ], [ "done-1", "done-2", "done-3" ] )
+
+        aware = self.task_store.query_tasks_by_end_time(
+            start.replace( tzinfo = timezone.utc ), end.replace( tzinfo = timezone.utc )
+        )
+        self.assertEqual( len( aware ), 3 )
+
+    def test_invalid_query_arguments(self) -> None:
+        """
+        Test that unknown locations and out-of-range page sizes are rejected.
+        """
+        with self.assertRaises( ValueError ):
+            self.task_store.query_tasks_by_status( "RUNNING", location = "elsewhere" )
+        with self.assertRaises( ValueError ):
+            self.task_store.query_tasks_by_status( "RUNNING", page_size = 0 )
+
+
+class TestSqliteTaskStorePerThread( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up a file-backed SQLite task store with one connection per thread.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        self.task_store: SqliteTaskStore = SqliteTaskStore(
+            db_path = self.db_path,
+            connection_mode = AppConstants.SqliteTaskStore.ConnectionModes.PER_THREAD,
+            cache_size_kib = 4096,
+        )
+        self.task_store.create_if_not_exists()
+
+    def tearDown(self) -> None:
+        """
+        Close every connection and remove the database file (and its WAL side files).
+        """
+        self.task_store.close()
+        for suffix in ( "", "-wal", "-shm" ):
+            if os.path.exists( self.db_path + suffix ):
+                os.remove( self.db_path + suffix )
+
+    def test_pragmas(self) -> None:
+        """
+        Test that per-thread connections use WAL, synchronous=NORMAL and the configured page cache.
+        """
+        conn = self.task_store.connection()
+        self.assertEqual( conn.execute( "PRAGMA journal_mode" ).fetchone()[ 0 ].lower(), "wal" )
+        self.assertEqual( conn.execute( "PRAGMA synchronous" ).fetchone()[ 0 ], 1 )  # 1 == NORMAL
+        self.assertEqual( conn.execute( "PRAGMA cache_size" ).fetchone()[ 0 ], -4096 )
+
+    def test_concurrent_writers(self) -> None:
+        """
+        Test that several threads can write concurrently, each through its own connection.
+        """
+        errors: List[ BaseException ] = [ ]
+
+        def writer(worker: int) -> None:
+            try:
+                for i in range( 20 ):
+                    self.task_store.upsert_task(
+                        TaskEntity( PartitionKey = "res", RowKey = f"{worker}-{i}", TaskType = "TEST" )
+                    )
+            except BaseException as ex:
+                errors.append( ex )
+
+        threads = [ threading.Thread( target = writer, args = ( w, ) ) for w in range( 8 ) ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual( errors, [ ] )
+        self.assertEqual( len( self.task_store.get_all_active_tasks( "res" ) ), 160 )
+        self.assertGreaterEqual( len( self.task_store._all_conns ), 2 )
+
+    def test_memory_db_falls_back_to_shared(self) -> None:
+        """
+        Test that an in-memory database always uses a single shared connection.
+        """
+        store: SqliteTaskStore = SqliteTaskStore(
+            ":memory:", connection_mode = AppConstants.SqliteTaskStore.ConnectionModes.PER_THREAD
+        )
+        self.assertEqual( store.connection_mode, AppConstants.SqliteTaskStore.ConnectionModes.SHARED )
+
+    def test_invalid_connection_mode(self) -> None:
+        """
+        Test that an unknown connection mode is rejected.
+        """
+        with self.assertRaises( ValueError ):
+            SqliteTaskStore( self.db_path, connection_mode = "bogus" )
+
+
+
+class TestSqliteTaskStoreWriteBehind( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Set up a file-backed SQLite task store in write-behind mode with a long commit interval,
+        so only flush(), the row limit or close() commit queued writes.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+        self.task_store: SqliteTaskStore = SqliteTaskStore(
+            db_path = self.db_path,
+            write_behind = True,
+            group_commit_interval_ms = 60_000,
+            group_commit_max_rows = 1000,
+        )
+        self.task_store.create_if_not_exists()
+
+    def tearDown(self) -> None:
+        """
+        Close the store and remove the database file (and its WAL side files).
+        """
+        self.task_store.close()
+        for suffix in ( "", "-wal", "-shm" ):
+            if os.path.exists( self.db_path + suffix ):
+                os.remove( self.db_path + suffix )
+
+    def _count_rows(self, table: str) -> int:
+        """
+        Count the committed rows of a table through an independent connection.
+        """
+        conn = sqlite3.connect( self.db_path )
+        try:
+            return conn.execute( f"SELECT COUNT(*) FROM {table}" ).fetchone()[ 0 ]
+        finally:
+            conn.close()
+
+    def test_flush_makes_queued_writes_durable(self) -> None:
+        """
+        Test that writes from many threads are queued, then committed together by flush().
+        """
+        def writer(worker: int) -> None:
+            for i in range( 10 ):
+                self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = f"{worker}-{i}", TaskType = "TEST" ) )
+
+        threads = [ threading.Thread( target = writer, args = ( w, ) ) for w in range( 4 ) ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertTrue( self.task_store.is_per_thread )
+        self.assertEqual( self._count_rows( self.task_store.active_table_name ), 0 )
+        self.assertTrue( self.task_store.flush( timeout = 10 ) )
+        self.assertEqual( self._count_rows( self.task_store.active_table_name ), 40 )
+
+    def test_writes_are_applied_in_order(self) -> None:
+        """
+        Test that an upsert followed by complete_task leaves the task only in the finished table.
+        """
+        entity = TaskEntity( PartitionKey = "res", RowKey = "ordered", TaskType = "TEST", Status = "RUNNING" )
+        self.task_store.upsert_task( entity )
+        entity.Status = "COMPLETED"
+        self.task_store.complete_task( entity )
+        self.task_store.flush()
+
+        self.assertEqual( self._count_rows( self.task_store.active_table_name ), 0 )
+        self.assertEqual( self.task_store.get_task( "res", "ordered" ).Status, "COMPLETED" )
+
+    def test_max_rows_triggers_commit(self) -> None:
+        """
+        Test that a full batch is committed without waiting for the interval.
+        """
+        store: SqliteTaskStore = SqliteTaskStore(
+            db_path = self.db_path, write_behind = True, group_commit_interval_ms = 60_000, group_commit_max_rows = 5
+        )
+        store.create_if_not_exists()
+        try:
+            for i in range( 5 ):
+                store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = f"batch-{i}", TaskType = "TEST" ) )
+            deadline = time.monotonic() + 10
+            while self._count_rows( store.active_table_name ) < 5 and time.monotonic() < deadline:
+                time.sleep( 0.01 )
+            self.assertEqual( self._count_rows( store.active_table_name ), 5 )
+        finally:
+            store.close()
+
+    def test_close_flushes_pending_writes(self) -> None:
+        """
+        Test that close() commits queued writes before releasing the connections.
+        """
+        self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "last", TaskType = "TEST" ) )
+        self.task_store.close()
+
+        self.assertEqual( self._count_rows( self.task_store.active_table_name ), 1 )
+
+    def test_failed_write_is_reported_to_its_thread(self) -> None:
+        """
+        Test that a write which cannot be committed makes the submitting thread's next flush()
+        return False, without affecting flushes on other threads.
+        """
+        conn = sqlite3.connect( self.db_path )
+        conn.execute( f"DROP TABLE {self.task_store.active_table_name}" )
+        conn.commit()
+        conn.close()
+        results: List[ bool ] = [ ]
+
+        def writer() -> None:
+            self.task_store.upsert_task( TaskEntity( PartitionKey = "res", RowKey = "lost", TaskType = "TEST" ) )
+            results.append( self.task_store.flush( timeout = 10 ) )
+            results.append( self.task_store.flush( timeout = 10 ) )
+
+        thread = threading.Thread( target = writer )
+        thread.start()
+        thread.join()
+
+        self.assertEqual( results, [ False, True ] )
+        self.assertTrue( self.task_store.flush( timeout = 10 ) )
+
+    def test_memory_db_rejected(self) -> None:
+        """
+        Test that write-behind mode requires a file database.
+        """
+        with self.assertRaises( ValueError ):
+            SqliteTaskStore( ":memory:", write_behind = True )
+
 
 if __name__ == "__main__":
     unittest.main()
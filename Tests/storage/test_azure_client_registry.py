@@ -0,0 +1,70 @@
+import os
+import unittest
+from unittest.mock import patch
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.azure_client_registry import AzureClientRegistry
+
+
+class TestAzureClientRegistry( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Use a private registry and the Azurite connection string (no request is sent).
+        """
+        self.registry: AzureClientRegistry = AzureClientRegistry( pool_maxsize = 4 )
+        self.conn_str: str = AppConstants.TaskStoreFactory.AZURE_STORAGE_CONNECTION_STRING_DEFAULT
+
+    def tearDown(self) -> None:
+        """
+        Close the registry's HTTP session.
+        """
+        self.registry.close()
+
+    def test_clients_are_cached_and_share_one_transport(self) -> None:
+        """
+        Test that each client is created once and that table, queue and blob clients use the
+        registry's transport and connection pool.
+        """
+        table = self.registry.table_service_client( self.conn_str )
+        blob = self.registry.blob_service_client( self.conn_str )
+        queue = self.registry.queue_client( self.conn_str, "q1" )
+
+        self.assertIs( table, self.registry.table_service_client( self.conn_str ) )
+        self.assertIs( queue, self.registry.queue_client( self.conn_str, "q1" ) )
+        self.assertIsNot( queue, self.registry.queue_client( self.conn_str, "q2" ) )
+        self.assertIs( blob._pipeline._transport, self.registry.transport )
+        self.assertIs( queue._pipeline._transport, self.registry.transport )
+        self.assertEqual( self.registry.session.get_adapter( "http://127.0.0.1" )._pool_maxsize, 4 )
+
+    def test_keep_alive_can_be_disabled(self) -> None:
+        """
+        Test that keep_alive=False asks the server to close every connection.
+        """
+        registry: AzureClientRegistry = AzureClientRegistry( keep_alive = False )
+        self.assertEqual( registry.session.headers[ "Connection" ], "close" )
+        registry.close()
+
+    def test_shared_registry_is_per_process(self) -> None:
+        """
+        Test that shared() returns one registry per process and a new one after a fork.
+        """
+        shared: AzureClientRegistry = AzureClientRegistry.shared()
+        self.assertIs( shared, AzureClientRegistry.shared() )
+
+        with patch( "background_workflows.storage.azure_client_registry.os.getpid", return_value = os.getpid() + 1 ):
+            self.assertIsNot( AzureClientRegistry.shared(), shared )
+        AzureClientRegistry.reset_shared()
+
+    def test_reset_shared_reads_current_environment(self) -> None:
+        """
+        Test that settings changed in the environment apply to the registry built after
+        reset_shared().
+        """
+        AzureClientRegistry.reset_shared()
+        with patch.dict( os.environ, { AppConstants.AzureClients.POOL_MAXSIZE_ENV_KEY: "7" } ):
+            registry: AzureClientRegistry = AzureClientRegistry.shared()
+            self.assertEqual( registry.pool_maxsize, 7 )
+        AzureClientRegistry.reset_shared()
+
+
+if __name__ == "__main__":
+    unittest.main()
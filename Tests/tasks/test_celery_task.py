@@ -0,0 +1,51 @@
+import json
+import os
+import unittest
+from Tests.tests_suites_helpers.test_helper import TestHelper
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.tasks.celery import celery_task
+
+
+class TestCeleryTaskStoreCache( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Point messages at a temporary SQLite database.
+        """
+        self.db_path: str = f"test_tasks_{TestHelper.generate_guid_for_local_db()}.db"
+
+    def tearDown(self) -> None:
+        """
+        Close the cached stores and remove the database file.
+        """
+        for key in [ key for key in celery_task._task_stores if self.db_path in key ]:
+            celery_task._task_stores.pop( key ).close()
+        if os.path.exists( self.db_path ):
+            os.remove( self.db_path )
+
+    def _message(self, row_key: str) -> TaskMessage:
+        """
+        Build a task message for the temporary database.
+        """
+        return TaskMessage( { "content": json.dumps( {
+            AppConstants.MessageKeys.RESOURCE_ID: "res",
+            AppConstants.MessageKeys.ROW_KEY: row_key,
+            AppConstants.MessageKeys.TASK_TYPE: "T",
+            AppConstants.MessageKeys.STORE_MODE: AppConstants.TaskStoreFactory.StoreModes.SQLITE,
+            AppConstants.MessageKeys.ACTIVE_TABLE_NAME: "active",
+            AppConstants.MessageKeys.FINISHED_TABLE_NAME: "finished",
+            AppConstants.MessageKeys.DATABASE_NAME: self.db_path,
+        } ) } )
+
+    def test_store_is_reused_across_messages(self) -> None:
+        """
+        Test that messages with the same store configuration share one task store.
+        """
+        first = celery_task._get_task_store( self._message( "1" ) )
+        second = celery_task._get_task_store( self._message( "2" ) )
+
+        self.assertIs( first, second )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import asyncio
+import threading
 import unittest
 import json
-from typing import Any
+from typing import Any, List
 from background_workflows.tasks.process_single_queue import ProcessSingleQueue
+from background_workflows.storage.tables.async_sqlite_task_store import AsyncSqliteTaskStore
 from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
 from background_workflows.storage.schemas.task_entity import TaskEntity
 
@@ -16,6 +19,16 @@ class MockProcessSingleQueue(ProcessSingleQueue):
         """
         return json.dumps({"status": "worked"})
 
+    async def do_work_on_single_async(self, payload: dict) -> str:
+        """
+        A dummy async implementation that yields to the event loop once.
+
+        :param payload: The parsed input payload.
+        :return: A JSON string with the result.
+        """
+        await asyncio.sleep(0)
+        return json.dumps({"status": "worked async"})
+
 
 class TestProcessSingleQueue(unittest.TestCase):
     def setUp(self) -> None:
@@ -57,5 +70,36 @@ class TestProcessSingleQueue(unittest.TestCase):
         self.assertIsNotNone(finished, "Task should be found in the store after execution.")
         self.assertEqual(finished.Status, "COMPLETED", "Task should be marked as COMPLETED.")
 
+    def test_execute_single_async_uses_async_store(self) -> None:
+        """
+        Test that execute_single_async awaits an IAsyncTaskStore, so store calls run off the
+        event loop thread, and that the task ends up COMPLETED.
+        """
+        store = AsyncSqliteTaskStore(":memory:")
+        store.create_if_not_exists()
+        store.upsert_task(TaskEntity(PartitionKey="res", RowKey="456", TaskType="TEST", InputPayload="{}"))
+
+        store_threads: List[str] = []
+        original_upsert = store.upsert_task
+
+        def recording_upsert(entity: TaskEntity) -> bool:
+            store_threads.append(threading.current_thread().name)
+            return original_upsert(entity)
+
+        store.upsert_task = recording_upsert
+
+        class Msg:
+            resource_id: str = "res"
+            row_key: str = "456"
+
+        asyncio.run(MockProcessSingleQueue(store).execute_single_async(Msg()))
+
+        finished: Any = store.get_task("res", "456")
+        self.assertEqual(finished.Status, "COMPLETED")
+        self.assertEqual(json.loads(finished.OutputPayload), {"status": "worked async"})
+        self.assertTrue(store_threads, "The async store should have been used.")
+        self.assertNotIn(threading.current_thread().name, store_threads)
+        store.close()
+
 if __name__ == "__main__":
     unittest.main()
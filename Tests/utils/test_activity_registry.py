@@ -26,5 +26,20 @@ class TestActivityRegistry(unittest.TestCase):
         retrieved_class: Optional[Type] = ActivityRegistry.get("NONEXISTENT")
         self.assertIsNone(retrieved_class)
 
+    def test_execution_mode(self) -> None:
+        """
+        Test that the execution mode defaults to "thread", can be set to "process" or "async",
+        and that unknown modes are rejected.
+        """
+        ActivityRegistry.register("TEST_THREAD", MockTask)
+        ActivityRegistry.register("TEST_PROCESS", MockTask, execution_mode="process")
+        ActivityRegistry.register("TEST_ASYNC", MockTask, execution_mode="async")
+        self.assertEqual(ActivityRegistry.get_execution_mode("TEST_THREAD"), "thread")
+        self.assertEqual(ActivityRegistry.get_execution_mode("TEST_PROCESS"), "process")
+        self.assertEqual(ActivityRegistry.get_execution_mode("TEST_ASYNC"), "async")
+        self.assertEqual(ActivityRegistry.get_execution_mode("NONEXISTENT"), "thread")
+        with self.assertRaises(ValueError):
+            ActivityRegistry.register("TEST_BAD", MockTask, execution_mode="gpu")
+
 if __name__ == "__main__":
     unittest.main()
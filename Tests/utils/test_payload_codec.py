@@ -0,0 +1,129 @@
+import json
+import tempfile
+import unittest
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.local_blob_store import LocalBlobStore
+from background_workflows.storage.queue.local_queue_backend import LocalQueueBackend
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.utils.payload_codec import GzipPayloadCodec, PayloadCodecs, ZstdPayloadCodec
+from background_workflows.utils.workflow_client import WorkflowClient
+
+
+class TestPayloadCodecs( unittest.TestCase ):
+    def setUp(self) -> None:
+        """
+        Enable gzip for values of at least 100 characters.
+        """
+        PayloadCodecs.configure( AppConstants.PayloadCodec.Names.GZIP, threshold = 100 )
+        self.text: str = json.dumps( { "items": [ "value" ] * 200 } )
+
+    def tearDown(self) -> None:
+        """
+        Restore the configuration from the environment.
+        """
+        PayloadCodecs.configure( AppConstants.PayloadCodec.get_codec_name(), AppConstants.PayloadCodec.get_threshold() )
+
+    def test_round_trip(self) -> None:
+        """
+        Test that a long value is compressed behind a marker and decoded back.
+        """
+        encoded: str = PayloadCodecs.encode( self.text )
+
+        self.assertTrue( encoded.startswith( "@gzip:" ) )
+        self.assertLess( len( encoded ), len( self.text ) )
+        self.assertEqual( PayloadCodecs.decode( encoded ), self.text )
+
+    def test_short_and_plain_values_pass_through(self) -> None:
+        """
+        Test that short values stay plain, and that unmarked values (older writers, blob
+        references, non-strings) are returned as they are.
+        """
+        self.assertEqual( PayloadCodecs.encode( '{"x": 1}' ), '{"x": 1}' )
+        for value in ( self.text, "@blob:payloads/row.InputPayload", "", None ):
+            self.assertEqual( PayloadCodecs.decode( value ), value )
+
+    def test_plain_values_that_look_encoded(self) -> None:
+        """
+        Test that plain values starting with a codec marker are escaped on encode and read back
+        unchanged, with or without a codec configured, and that such values written unescaped
+        (by an older writer) decode to themselves instead of raising.
+        """
+        for value in ( "@gzip:hello", "@zstd:", "@plain:x", "@gzip:" + "a" * 200 ):
+            self.assertEqual( PayloadCodecs.decode( PayloadCodecs.encode( value ) ), value )
+        self.assertEqual( PayloadCodecs.encode( "@gzip:hello" ), "@plain:@gzip:hello" )
+        self.assertEqual( PayloadCodecs.encode( "@other:hello" ), "@other:hello" )
+
+        PayloadCodecs.configure( AppConstants.PayloadCodec.Names.NONE )
+        self.assertEqual( PayloadCodecs.decode( PayloadCodecs.encode( "@gzip:hello" ) ), "@gzip:hello" )
+        for value in ( "@gzip:hello", "@gzip:aGVsbG8=", "@gzip:" ):
+            self.assertEqual( PayloadCodecs.decode( value ), value )
+
+    def test_decoding_does_not_depend_on_configuration(self) -> None:
+        """
+        Test that a reader configured without a codec still decodes compressed values, so
+        workers with different settings interoperate.
+        """
+        encoded: str = PayloadCodecs.encode( self.text )
+        PayloadCodecs.configure( AppConstants.PayloadCodec.Names.NONE )
+
+        self.assertEqual( PayloadCodecs.encode( self.text ), self.text )
+        self.assertEqual( PayloadCodecs.decode( encoded ), self.text )
+
+    def test_zstd_falls_back_without_zstandard(self) -> None:
+        """
+        Test that zstd is used when available and otherwise replaced by gzip.
+        """
+        PayloadCodecs.configure( AppConstants.PayloadCodec.Names.ZSTD, threshold = 100 )
+        expected: str = "zstd" if ZstdPayloadCodec().is_available() else "gzip"
+
+        self.assertEqual( PayloadCodecs.active_codec_name(), expected )
+        self.assertEqual( PayloadCodecs.decode( PayloadCodecs.encode( self.text ) ), self.text )
+
+    def test_register_rejects_invalid_names(self) -> None:
+        """
+        Test that codec names that would break marker parsing are rejected.
+        """
+        codec = GzipPayloadCodec()
+        codec.name = "bad:name"
+        with self.assertRaises( ValueError ):
+            PayloadCodecs.register( codec )
+        codec.name = AppConstants.PayloadCodec.Names.PLAIN
+        with self.assertRaises( ValueError ):
+            PayloadCodecs.register( codec )
+        with self.assertRaises( ValueError ):
+            PayloadCodecs.configure( "unknown" )
+
+    def test_task_message_and_payloads(self) -> None:
+        """
+        Test that start_activity compresses the stored input and the queued message, that
+        TaskMessage decodes the message, and that get_result decodes a compressed output.
+        """
+        store: SqliteTaskStore = SqliteTaskStore( ":memory:" )
+        store.create_if_not_exists()
+        queue: LocalQueueBackend = LocalQueueBackend()
+        blob_root = tempfile.TemporaryDirectory()
+        self.addCleanup( blob_root.cleanup )
+        client: WorkflowClient = WorkflowClient( store, queue, LocalBlobStore( blob_root.name ) )
+        items = [ "value" ] * 200
+
+        row_key: str = client.start_activity( "TEST_ACTIVITY", "res", items = items )
+        stored: TaskEntity = store.get_task( "res", row_key )
+        self.assertTrue( stored.InputPayload.startswith( "@gzip:" ) )
+        self.assertEqual( json.loads( PayloadCodecs.decode( stored.InputPayload ) ), { "items": items } )
+
+        raw_msg = queue.receive_messages()[ 0 ]
+        self.assertTrue( raw_msg[ AppConstants.MessageKeys.CONTENT ].startswith( "@gzip:" ) )
+        self.assertEqual( TaskMessage( raw_msg ).payload, { "items": items } )
+
+        stored.OutputPayload = PayloadCodecs.encode( self.text )
+        stored.mark_completed()
+        store.complete_task( stored )
+        self.assertEqual( client.get_result( row_key, "res" ), json.loads( self.text ) )
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
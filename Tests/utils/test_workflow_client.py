@@ -5,6 +5,7 @@ import uuid
 
 from Tests.tests_suites_helpers.test_helper import TestHelper
 from background_workflows.storage.blobs.local_blob_store import LocalBlobStore
+from background_workflows.storage.schemas.task_entity import TaskEntity
 from background_workflows.utils.workflow_client import WorkflowClient
 from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
 from background_workflows.storage.queue.local_queue_backend import LocalQueueBackend
@@ -55,6 +56,19 @@ class TestWorkflowClient(unittest.TestCase):
         """
         result = self.client.get_result("nonexistent_rowkey", "resource_123")
         self.assertIsNone(result)
+    def test_get_statuses_and_results(self) -> None:
+        """
+        Test that the bulk lookups report active, finished and missing tasks by row key.
+        """
+        running_key = self.client.start_activity("TEST_ACTIVITY", "resource_123", x=1)
+        done = TaskEntity(PartitionKey="resource_123", RowKey="done", Status="COMPLETED", OutputPayload='{"answer": 42}')
+        self.store.complete_task(done)
+
+        statuses = self.client.get_statuses([running_key, "done", "missing"], "resource_123")
+        self.assertEqual(statuses, {running_key: "CREATED", "done": "COMPLETED", "missing": None})
+
+        results = self.client.get_results([running_key, "done", "missing"], "resource_123")
+        self.assertEqual(results, {running_key: None, "done": {"answer": 42}, "missing": None})
 
 if __name__ == "__main__":
     unittest.main()
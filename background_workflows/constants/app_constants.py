@@ -19,6 +19,8 @@ class AppConstants:
         class StoreModes:
             AZURE: Final[str] = "azure"
             SQLITE: Final[str] = "sqlite"
+            # SQLite split across several database files by resource_id (ShardedSqliteTaskStore).
+            SQLITE_SHARDED: Final[str] = "sqlite_sharded"
 
         # Environment keys and their default values for store configuration
         STORE_MODE_ENV_KEY: Final[str] = "STORE_MODE"
@@ -31,6 +33,8 @@ class AppConstants:
 
         SQLITE_DB_PATH_ENV_KEY: Final[str] = "SQLITE_DB_PATH"
         SQLITE_DB_PATH_DEFAULT: Final[str] = "local_tasks.db"
+        SQLITE_CONNECTION_MODE_ENV_KEY: Final[str] = "SQLITE_CONNECTION_MODE"
+        SQLITE_SHARD_COUNT_ENV_KEY: Final[str] = "SQLITE_SHARD_COUNT"
 
         ACTIVE_TABLE_NAME_ENV_KEY: Final[str] = "ACTIVE_TABLE_NAME"
         ACTIVE_TABLE_NAME_DEFAULT: Final[str] = "ActiveTasks"
@@ -85,6 +89,24 @@ class AppConstants:
             """
             return os.getenv(cls.SQLITE_DB_PATH_ENV_KEY, cls.SQLITE_DB_PATH_DEFAULT)
 
+        @classmethod
+        def get_sqlite_connection_mode(cls) -> str:
+            """
+            Retrieves the SQLite connection mode from the environment.
+
+            :return: The connection mode, either "shared" or "per_thread".
+            """
+            return os.getenv(cls.SQLITE_CONNECTION_MODE_ENV_KEY, AppConstants.SqliteTaskStore.DEFAULT_CONNECTION_MODE)
+
+        @classmethod
+        def get_sqlite_shard_count(cls) -> int:
+            """
+            Retrieves the number of SQLite shards from the environment ("sqlite_sharded" mode).
+
+            :return: The shard count.
+            """
+            return int(os.getenv(cls.SQLITE_SHARD_COUNT_ENV_KEY, AppConstants.ShardedSqliteTaskStore.DEFAULT_SHARD_COUNT))
+
     class Logging:
         # Logging configuration constants
         FORMAT: Final[str] = "[%(asctime)s] %(levelname)s in %(module)s: %(message)s"
@@ -97,7 +119,29 @@ class AppConstants:
         COMPLETED: Final[str] = "COMPLETED"
         ERROR: Final[str] = "ERROR"
 
+    class TaskLocations:
+        # The two areas of a task store: in-progress tasks and their historical record.
+        ACTIVE: Final[str] = "active"
+        FINISHED: Final[str] = "finished"
+        ALL: Final[tuple] = (ACTIVE, FINISHED)
+
+    class TaskQueries:
+        DEFAULT_PAGE_SIZE: Final[int] = 100
+        # Azure Table Storage returns at most 1000 entities per page.
+        MAX_PAGE_SIZE: Final[int] = 1000
+        # SQLITE_MAX_VARIABLE_NUMBER of SQLite builds before 3.32, still shipped by many distributions.
+        SQLITE_LEGACY_MAX_VARIABLES: Final[int] = 999
+        # Keys per SQLite statement in get_tasks(): two bound variables per key, within the legacy limit.
+        MAX_KEYS_PER_STATEMENT: Final[int] = SQLITE_LEGACY_MAX_VARIABLES // 2
+
     class MainController:
+        class DispatchModes:
+            # Poll, dispatch, then sleep MAIN_LOOP_SLEEP_SECS.
+            POLLING: Final[str] = "polling"
+            # Pull as many messages as there are free slots; back off only when the queue is empty.
+            CONTINUOUS: Final[str] = "continuous"
+
+        DEFAULT_DISPATCH_MODE: Final[str] = DispatchModes.POLLING
         DEFAULT_MAX_THREADS: Final[int] = 10
         DEFAULT_CPU_THRESHOLD: Final[float] = 0.80
         MAIN_LOOP_SLEEP_SECS: Final[int] = 10
@@ -105,11 +149,219 @@ class AppConstants:
         RUN_ONCE_MAX_MESSAGES_DEFAULT: Final[int] = 10
         POLL_AND_HANDLE_DEFAULT_MESSAGES: Final[int] = 10
         DEFAULT_VISIBILITY_TIMEOUT: Final[int] = 1800
-        VISIBILITY_TIMEOUT_FOR_DEFER: Final[int] = 60
+        # The prefetch buffer holds up to max_threads * PREFETCH_MULTIPLIER leased messages.
+        PREFETCH_MULTIPLIER_DEFAULT: Final[int] = 2
+        PREFETCH_LEASE_RENEW_MARGIN_SECS: Final[int] = 300
+        # Exponential idle backoff used by the continuous dispatch mode.
+        IDLE_BACKOFF_INITIAL_SECS: Final[float] = 0.1
+        IDLE_BACKOFF_MAX_SECS: Final[float] = 10.0
+        IDLE_BACKOFF_MULTIPLIER: Final[float] = 2.0
+
+    class MainAsyncController:
+        DEFAULT_MAX_CONCURRENT_TASKS: Final[int] = 300
+        DEFAULT_POLL_INTERVAL_SECS: Final[float] = 3.0
+        # Upper bound of a single receive call (Azure Storage Queues return at most 32 messages).
+        MAX_MESSAGES_PER_POLL: Final[int] = 32
+        VISIBILITY_TIMEOUT: Final[int] = 60 * 60 * 6
+        CPU_RECHECK_SECS: Final[float] = 2.0
+        # How long shutdown waits for in-flight jobs before cancelling them (None waits indefinitely).
+        DEFAULT_DRAIN_TIMEOUT_SECS: Final[float] = 30.0
 
     class ThreadPoolManager:
         DEFAULT_MAX: Final[int] = 10
 
+    class ProcessPoolManager:
+        DEFAULT_MAX: Final[int] = os.cpu_count() or 1
+
+    class AsyncPoolManager:
+        DEFAULT_MAX: Final[int] = 100
+        THREAD_NAME: Final[str] = "bgworkflows-async-lane"
+
+    class HybridController:
+        DEFAULT_MAX_THREADS: Final[int] = 10
+        # The process lane is opt-in: worker processes need a task store they can reopen
+        # (not an in-memory database), so pass max_processes explicitly to enable it.
+        DEFAULT_MAX_PROCESSES: Final[int] = 0
+        DEFAULT_MAX_ASYNC_TASKS: Final[int] = 100
+
+    class ExecutionModes:
+        # Where a registered activity runs inside MainController / HybridController.
+        THREAD: Final[str] = "thread"
+        PROCESS: Final[str] = "process"
+        ASYNC: Final[str] = "async"
+        ALL: Final[tuple] = (THREAD, PROCESS, ASYNC)
+
+    class SqliteTaskStore:
+        class ConnectionModes:
+            # One connection shared by every thread, default rollback journal.
+            SHARED: Final[str] = "shared"
+            # One connection per thread in WAL mode, so readers never block the writer.
+            PER_THREAD: Final[str] = "per_thread"
+
+        DEFAULT_CONNECTION_MODE: Final[str] = ConnectionModes.SHARED
+        # How long a statement waits on a locked database before raising "database is locked".
+        BUSY_TIMEOUT_SECS: Final[float] = 5.0
+        # Extra attempts (with exponential backoff) for writes that still hit a locked database.
+        BUSY_RETRY_ATTEMPTS: Final[int] = 5
+        BUSY_RETRY_BACKOFF_SECS: Final[float] = 0.05
+        # Page cache per connection, in KiB (SQLite's own default is 2000 KiB).
+        DEFAULT_CACHE_SIZE_KIB: Final[int] = 8192
+        JOURNAL_MODE_WAL: Final[str] = "WAL"
+        SYNCHRONOUS_NORMAL: Final[str] = "NORMAL"
+        MEMORY_DB_PATH: Final[str] = ":memory:"
+        # Write-behind mode: a batch is committed after this many milliseconds or rows, whichever comes first.
+        GROUP_COMMIT_INTERVAL_MS: Final[int] = 50
+        GROUP_COMMIT_MAX_ROWS: Final[int] = 500
+        WRITER_THREAD_NAME: Final[str] = "bgworkflows-sqlite-writer"
+
+    class ShardedSqliteTaskStore:
+        DEFAULT_SHARD_COUNT: Final[int] = 4
+        # Shard i of n for "tasks.db" is "tasks.<i>-of-<n>.db"; the count in the name keeps a
+        # store opened with a different shard count from reading the wrong files.
+        SHARD_PATH_FORMAT: Final[str] = "{base}.{index}-of-{count}{ext}"
+
+    class SqliteTaskMaintenance:
+        # Finished rows archived and deleted per transaction, so writers are never blocked for long.
+        DEFAULT_BATCH_SIZE: Final[int] = 500
+        # Free pages returned to the OS per maintenance run (0 = all of them).
+        DEFAULT_VACUUM_PAGES: Final[int] = 0
+        ARCHIVE_FILE_SUFFIX: Final[str] = ".jsonl.gz"
+        # PRAGMA auto_vacuum values.
+        AUTO_VACUUM_INCREMENTAL: Final[int] = 2
+
+    class AzureClients:
+        # Shared HTTP transport of AzureClientRegistry, used by every table, queue and blob client.
+        POOL_CONNECTIONS_ENV_KEY: Final[str] = "AZURE_HTTP_POOL_CONNECTIONS"
+        # Number of hosts with a cached connection pool.
+        POOL_CONNECTIONS_DEFAULT: Final[int] = 10
+        POOL_MAXSIZE_ENV_KEY: Final[str] = "AZURE_HTTP_POOL_MAXSIZE"
+        # Connections kept alive per host; match it to the number of worker threads.
+        POOL_MAXSIZE_DEFAULT: Final[int] = 32
+        CONNECTION_TIMEOUT_SECS_ENV_KEY: Final[str] = "AZURE_HTTP_CONNECTION_TIMEOUT_SECS"
+        CONNECTION_TIMEOUT_SECS_DEFAULT: Final[float] = 10.0
+        READ_TIMEOUT_SECS_ENV_KEY: Final[str] = "AZURE_HTTP_READ_TIMEOUT_SECS"
+        READ_TIMEOUT_SECS_DEFAULT: Final[float] = 60.0
+        KEEP_ALIVE_ENV_KEY: Final[str] = "AZURE_HTTP_KEEP_ALIVE"
+        KEEP_ALIVE_DEFAULT: Final[str] = "true"
+
+        @classmethod
+        def get_pool_connections(cls) -> int:
+            """
+            :return: The number of per-host connection pools to cache.
+            """
+            return int(os.getenv(cls.POOL_CONNECTIONS_ENV_KEY, cls.POOL_CONNECTIONS_DEFAULT))
+
+        @classmethod
+        def get_pool_maxsize(cls) -> int:
+            """
+            :return: The maximum number of pooled connections per host.
+            """
+            return int(os.getenv(cls.POOL_MAXSIZE_ENV_KEY, cls.POOL_MAXSIZE_DEFAULT))
+
+        @classmethod
+        def get_connection_timeout_secs(cls) -> float:
+            """
+            :return: The TCP connect timeout, in seconds.
+            """
+            return float(os.getenv(cls.CONNECTION_TIMEOUT_SECS_ENV_KEY, cls.CONNECTION_TIMEOUT_SECS_DEFAULT))
+
+        @classmethod
+        def get_read_timeout_secs(cls) -> float:
+            """
+            :return: The socket read timeout, in seconds.
+            """
+            return float(os.getenv(cls.READ_TIMEOUT_SECS_ENV_KEY, cls.READ_TIMEOUT_SECS_DEFAULT))
+
+        @classmethod
+        def get_keep_alive(cls) -> bool:
+            """
+            :return: True if connections are reused between requests.
+            """
+            return os.getenv(cls.KEEP_ALIVE_ENV_KEY, cls.KEEP_ALIVE_DEFAULT).lower() in ("1", "true", "yes")
+
+    class AzureTaskStore:
+        # Threads issuing the parallel active/finished point reads of get_task().
+        READ_MAX_WORKERS: Final[int] = 16
+        READ_THREAD_NAME_PREFIX: Final[str] = "bgworkflows-azure-read"
+        # Entity group transactions: at most 100 operations and a 4 MiB request per transaction.
+        MAX_TRANSACTION_OPERATIONS: Final[int] = 100
+        # Estimated entity bytes per transaction, leaving headroom under 4 MiB for the batch envelope.
+        MAX_TRANSACTION_BYTES: Final[int] = 3_500_000
+
+    class PayloadOffload:
+        # Payloads longer than this many characters are moved to blob storage (0 = never).
+        # An Azure Table string property holds at most 32K characters (64 KiB of UTF-16).
+        THRESHOLD_ENV_KEY: Final[str] = "PAYLOAD_OFFLOAD_THRESHOLD"
+        THRESHOLD_DEFAULT: Final[str] = "0"
+        CONTAINER_NAME_ENV_KEY: Final[str] = "PAYLOAD_OFFLOAD_CONTAINER"
+        CONTAINER_NAME_DEFAULT: Final[str] = "task-payloads"
+        # A stored payload starting with this prefix is a reference "<prefix><container>/<blob>".
+        # JSON text never starts with "@", so references cannot be mistaken for payloads.
+        REFERENCE_PREFIX: Final[str] = "@blob:"
+        # Blob of payload field <field> of task <row_key>.
+        BLOB_NAME_FORMAT: Final[str] = "{row_key}.{field}"
+
+        @classmethod
+        def get_threshold(cls) -> int:
+            """
+            :return: The payload length (in characters) above which payloads are offloaded; 0 disables offloading.
+            """
+            return int(os.getenv(cls.THRESHOLD_ENV_KEY, cls.THRESHOLD_DEFAULT))
+
+        @classmethod
+        def get_container_name(cls) -> str:
+            """
+            :return: The blob container that holds offloaded payloads.
+            """
+            return os.getenv(cls.CONTAINER_NAME_ENV_KEY, cls.CONTAINER_NAME_DEFAULT)
+
+    class PayloadCodec:
+        class Names:
+            NONE: Final[str] = "none"
+            GZIP: Final[str] = "gzip"
+            ZSTD: Final[str] = "zstd"
+            # Reserved marker for plain values that would otherwise look encoded.
+            PLAIN: Final[str] = "plain"
+
+        # Codec applied to new payloads and queue messages. Readers detect the codec of each value
+        # from its marker, so enable compression only once every worker can decode it.
+        CODEC_ENV_KEY: Final[str] = "PAYLOAD_CODEC"
+        CODEC_DEFAULT: Final[str] = Names.NONE
+        # Values shorter than this many characters are never compressed.
+        THRESHOLD_ENV_KEY: Final[str] = "PAYLOAD_COMPRESSION_THRESHOLD"
+        THRESHOLD_DEFAULT: Final[str] = "1024"
+        # An encoded value is "<marker><base64 of the compressed UTF-8 text>", e.g. "@gzip:H4sI...".
+        # JSON text never starts with "@", so plain values are read as they are; a plain value that
+        # does start with a marker is written as "@plain:<value>".
+        MARKER_FORMAT: Final[str] = "@{name}:"
+        GZIP_LEVEL: Final[int] = 6
+        ZSTD_LEVEL: Final[int] = 3
+
+        @classmethod
+        def get_codec_name(cls) -> str:
+            """
+            :return: The name of the codec applied to new values ("none", "gzip" or "zstd").
+            """
+            return os.getenv(cls.CODEC_ENV_KEY, cls.CODEC_DEFAULT).lower()
+
+        @classmethod
+        def get_threshold(cls) -> int:
+            """
+            :return: The value length (in characters) from which values are compressed.
+            """
+            return int(os.getenv(cls.THRESHOLD_ENV_KEY, cls.THRESHOLD_DEFAULT))
+
+    class AsyncSqliteTaskStore:
+        # Name prefix of the dedicated thread that runs SQLite statements for coroutines.
+        THREAD_NAME_PREFIX: Final[str] = "bgworkflows-sqlite"
+
+    class CpuSampler:
+        # Length of each measurement window, in seconds.
+        DEFAULT_SAMPLE_INTERVAL_SECS: Final[float] = 1.0
+        # Weight of the newest sample in the exponential moving average (1.0 = no smoothing).
+        DEFAULT_SMOOTHING_FACTOR: Final[float] = 0.5
+        THREAD_NAME: Final[str] = "bgworkflows-cpu-sampler"
+
     class Celery:
         CELERY_BROKER_URL_ENV_KEY: Final[str] = "CELERY_BROKER_URL"
         CELERY_BROKER_URL_DEFAULT: Final[str] = "redis://localhost:6379/0"
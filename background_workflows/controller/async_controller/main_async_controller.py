@@ -1,7 +1,11 @@
 import asyncio
 import logging
-from typing import Any, List
+from functools import partial
+from typing import Any, Iterable, List, Optional, Set
 
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+from background_workflows.storage.queue.i_async_queue_backend import IAsyncQueueBackend
 from background_workflows.storage.schemas.task_message import TaskMessage
 from background_workflows.utils.dynamic_task_creator import DynamicTaskCreator
 
@@ -14,121 +18,213 @@ class MainAsyncController:
 
     Features:
       - Single event loop
-      - A concurrency semaphore for controlling total tasks in flight
-      - Periodic polling of a queue for new messages
+      - Slot-aware polling: each poll asks for at most as many messages as there are free
+        concurrency slots, so messages are never leased beyond capacity
+      - Immediate re-poll as soon as a running job frees a slot
       - Execution of tasks as async coroutines
+      - Graceful drain on shutdown: leasing stops, in-flight jobs get a deadline to finish,
+        and un-started or abandoned messages are made visible again for other nodes
     """
 
     def __init__(
             self,
             task_store: Any,
             queue_backend: Any,
-            max_concurrent_tasks: int = 300,
-            poll_interval_secs: float = 3.0,
+            max_concurrent_tasks: int = AppConstants.MainAsyncController.DEFAULT_MAX_CONCURRENT_TASKS,
+            poll_interval_secs: float = AppConstants.MainAsyncController.DEFAULT_POLL_INTERVAL_SECS,
             cpu_threshold: float = 1.0,  # 1.0 means 100%, effectively no CPU gating
+            drain_timeout_secs: Optional[ float ] = AppConstants.MainAsyncController.DEFAULT_DRAIN_TIMEOUT_SECS,
     ) -> None:
         """
         :param task_store: The storage (ITaskStore) for persisting task states if needed.
-        :param queue_backend: An async-friendly queue client or a wrapper for synchronous calls.
+        :param queue_backend: An IAsyncQueueBackend (awaited directly) or a synchronous IQueueBackend
+                              (its calls are run in the default executor).
         :param max_concurrent_tasks: The max number of concurrent tasks allowed at once.
-        :param poll_interval_secs: How often we poll the queue in seconds.
+        :param poll_interval_secs: How long to wait before polling again when the queue is empty.
         :param cpu_threshold: Optional CPU usage fraction (0.0-1.0). If usage exceeds, we pause polling.
+        :param drain_timeout_secs: How long `run()` waits for in-flight jobs after shutdown before
+                                   cancelling them and releasing their messages (None waits indefinitely).
         """
         self.task_store = task_store
         self.queue_backend = queue_backend
+        # Native async queue operations, when the backend provides them.
+        self.async_queue_backend: Optional[ IAsyncQueueBackend ] = (
+            queue_backend if isinstance( queue_backend, IAsyncQueueBackend ) else None
+        )
         self.max_concurrent_tasks = max_concurrent_tasks
         self.poll_interval_secs = poll_interval_secs
         self.cpu_threshold = cpu_threshold
+        self.drain_timeout_secs = drain_timeout_secs
 
-        # Semaphore to limit concurrency
+        # Semaphore to limit concurrency; a permit is taken before a message is scheduled.
         self.semaphore = asyncio.Semaphore( self.max_concurrent_tasks )
+        self._in_flight: int = 0
+        # Strong references to running jobs, so they are not garbage collected mid-flight.
+        self._tasks: Set[ asyncio.Task ] = set()
+        # Set when a job frees a slot (or shutdown is requested), to wake the polling loop.
+        self._slot_freed = asyncio.Event()
+        self._shutdown_event = asyncio.Event()
+
+        # Non-blocking CPU readings for the admission check.
+        self.cpu_sampler: CpuSampler = CpuSampler()
 
         # DynamicTaskCreator that knows how to instantiate tasks by type
         self.task_creator = DynamicTaskCreator( self.task_store )
 
         self._shutdown_flag = False
 
+    def free_slots(self) -> int:
+        """
+        :return: The number of additional jobs that can start right now.
+        """
+        return max( 0, self.max_concurrent_tasks - self._in_flight )
+
     async def run(self) -> None:
         """
         Continuously polls the queue for new messages and schedules them as async tasks,
         respecting the concurrency limit and optional CPU threshold.
 
-        This method never returns unless an external condition calls `shutdown()`.
+        Each poll requests at most `free_slots()` messages. When every slot is busy, the loop
+        sleeps until a job finishes; when the queue is empty, it waits `poll_interval_secs`
+        (or less, if a job finishes first).
+
+        This method never returns unless an external condition calls `shutdown()`; it then
+        drains in-flight jobs (see `_drain()`) before returning.
         """
         logger.info( "MainAsyncController starting the main loop." )
-        while not self._shutdown_flag:
-            # Optionally enforce CPU usage check if desired
-            if not await self._check_cpu_usage():
-                # If CPU usage is too high, skip this poll cycle
-                await asyncio.sleep( 2.0 )
-                continue
-
-            # Poll the queue for messages
-            msgs = await self._receive_messages_async(
-                max_messages = 20,
-                visibility_timeout = 60 * 60 * 6
-            )
+        self.cpu_sampler.start()
+        try:
+            while not self._shutdown_flag:
+                # Optionally enforce CPU usage check if desired
+                if not self._check_cpu_usage():
+                    # If CPU usage is too high, skip this poll cycle
+                    await self._wait_for( self._shutdown_event, AppConstants.MainAsyncController.CPU_RECHECK_SECS )
+                    continue
 
-            if not msgs:
-                # If no messages, sleep before next poll
-                await asyncio.sleep( self.poll_interval_secs )
-                continue
+                free: int = self.free_slots()
+                if free == 0:
+                    # Every slot is busy: wait until a job completes instead of leasing more messages.
+                    await self._wait_for( self._slot_freed, None )
+                    continue
 
-            # Process each message
-            for raw_msg in msgs:
-                # Convert raw_msg to a known format
-                tmsg = TaskMessage( raw_msg )
-                task_obj = self.task_creator.create_task( tmsg )
+                # Poll the queue for no more messages than we can start right away
+                msgs = await self._receive_messages_async(
+                    max_messages = min( free, AppConstants.MainAsyncController.MAX_MESSAGES_PER_POLL ),
+                    visibility_timeout = AppConstants.MainAsyncController.VISIBILITY_TIMEOUT
+                )
 
-                if not task_obj:
-                    logger.warning( f"Unknown task_type={tmsg.task_type}; deleting msg." )
-                    await self._delete_message_async( raw_msg )
+                if not msgs:
+                    # If no messages, sleep before next poll
+                    await self._wait_for( self._shutdown_event, self.poll_interval_secs )
                     continue
 
-                # Schedule the async task to run
-                await self._schedule_task( task_obj, tmsg, raw_msg )
+                # Process each message
+                for index, raw_msg in enumerate( msgs ):
+                    if self._shutdown_flag:
+                        # Shutdown arrived mid-batch: hand the rest of the batch back right away.
+                        await self._release_messages_async( msgs[ index: ] )
+                        break
+
+                    # Convert raw_msg to a known format
+                    tmsg = TaskMessage( raw_msg )
+                    task_obj = self.task_creator.create_task( tmsg )
+
+                    if not task_obj:
+                        logger.warning( f"Unknown task_type={tmsg.task_type}; deleting msg." )
+                        await self._delete_message_async( raw_msg )
+                        continue
 
-            # Short pause before next poll
-            await asyncio.sleep( self.poll_interval_secs )
+                    # Schedule the async task to run
+                    await self._schedule_task( task_obj, tmsg, raw_msg )
 
-        logger.info( "MainAsyncController main loop exiting (shutdown requested)." )
+            logger.info( "MainAsyncController main loop exiting (shutdown requested)." )
+            await self._drain()
+        finally:
+            self.cpu_sampler.stop()
 
     async def shutdown(self):
         """
-        Signal the controller to stop after finishing current loop iteration.
+        Signal the controller to stop leasing messages. `run()` then drains in-flight jobs
+        and returns.
         """
         logger.info( "Shutdown signal received; stopping main loop." )
         self._shutdown_flag = True
+        self._shutdown_event.set()
+        self._slot_freed.set()
+
+    async def _wait_for(self, event: asyncio.Event, timeout: Optional[ float ]) -> None:
+        """
+        Sleep until the event is set or the timeout expires, then clear the event.
+
+        :param event: The event to wait on (`_slot_freed` or `_shutdown_event`).
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        """
+        try:
+            await asyncio.wait_for( event.wait(), timeout )
+        except asyncio.TimeoutError:
+            pass
+        if event is not self._shutdown_event:
+            event.clear()
+
+    async def _drain(self) -> None:
+        """
+        Wait up to `drain_timeout_secs` for in-flight jobs to finish. Jobs still running after
+        the deadline are cancelled; their messages are released so other nodes pick them up
+        immediately instead of after the visibility timeout.
+        """
+        if not self._tasks:
+            return
+        logger.info( f"Draining {len( self._tasks )} in-flight job(s) (timeout={self.drain_timeout_secs}s)." )
+        _, pending = await asyncio.wait( set( self._tasks ), timeout = self.drain_timeout_secs )
+        if pending:
+            logger.warning( f"{len( pending )} job(s) still running after the drain deadline; cancelling." )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather( *pending, return_exceptions = True )
+        logger.info( "MainAsyncController drained." )
 
     async def _schedule_task(self, task_obj: Any, tmsg: TaskMessage, raw_msg: Any) -> None:
         """
         Schedule a single message as an async crawling job.
-        We use a semaphore to limit concurrency.
+
+        The concurrency permit is taken here, before the job is created, so a scheduled job
+        starts immediately instead of queueing on the semaphore while its message stays leased.
         """
+        await self.semaphore.acquire()
+        self._in_flight += 1
 
         # Create a coroutine that wraps the entire job
         async def job_wrapper():
-            async with self.semaphore:
-                logger.info( f"Starting async job for row_key={tmsg.row_key}" )
-                try:
-                    # The assumption: task_obj.execute_single_async(...) is truly async
-                    await task_obj.execute_single_async( tmsg )
-                    # On success, remove the message from the queue
-                    await self._delete_message_async( raw_msg )
-                except Exception as ex:
-                    logger.exception(
-                        f"Exception in async job (row_key={tmsg.row_key}): {ex}"
-                    )
-
-        # Spawn a background task to run the job
-        asyncio.create_task( job_wrapper() )
-
-    async def _check_cpu_usage(self) -> bool:
+            logger.info( f"Starting async job for row_key={tmsg.row_key}" )
+            try:
+                # The assumption: task_obj.execute_single_async(...) is truly async
+                await task_obj.execute_single_async( tmsg )
+                # On success, remove the message from the queue
+                await self._delete_message_async( raw_msg )
+            except asyncio.CancelledError:
+                logger.warning( f"Async job cancelled (row_key={tmsg.row_key}); releasing its message." )
+                await self._release_messages_async( [ raw_msg ] )
+                raise
+            except Exception as ex:
+                logger.exception(
+                    f"Exception in async job (row_key={tmsg.row_key}): {ex}"
+                )
+            finally:
+                self._in_flight -= 1
+                self.semaphore.release()
+                self._slot_freed.set()
+
+        # Spawn a background task to run the job, keeping a reference until it finishes
+        task = asyncio.create_task( job_wrapper() )
+        self._tasks.add( task )
+        task.add_done_callback( self._tasks.discard )
+
+    def _check_cpu_usage(self) -> bool:
         """
-        By default, we do a 0.5s sample; if usage > cpu_threshold, we return False.
-        With I/O, this might not be critical.
+        Reads the latest CPU usage from the background sampler; if usage > cpu_threshold,
+        we return False. With I/O, this might not be critical.
         """
-        usage = await self._cpu_percent_async( interval = 0.5 )
+        usage = self.cpu_sampler.get_usage()
         if usage > self.cpu_threshold:
             logger.warning(
                 f"CPU usage {usage:.2f} is above threshold {self.cpu_threshold:.2f}."
@@ -136,20 +232,14 @@ class MainAsyncController:
             return False
         return True
 
-    async def _cpu_percent_async(self, interval: float) -> float:
-        """
-        Because psutil.cpu_percent is synchronous, we run it in a threadpool
-        to avoid blocking the async loop.
-        """
-        loop = asyncio.get_running_loop()
-        import psutil
-
-        def blocking_cpu():
-            return psutil.cpu_percent( interval = interval ) / 100.0
-
-        return await loop.run_in_executor( None, blocking_cpu )
-
     async def _receive_messages_async(self, max_messages: int, visibility_timeout: int) -> List[ Any ]:
+        if self.async_queue_backend is not None:
+            msgs = await self.async_queue_backend.receive_messages_async(
+                max_messages = max_messages,
+                visibility_timeout = visibility_timeout
+            )
+            return msgs or [ ]
+
         loop = asyncio.get_running_loop()
 
         def sync_receive():
@@ -162,9 +252,31 @@ class MainAsyncController:
         return msgs or [ ]
 
     async def _delete_message_async(self, raw_msg: Any) -> None:
+        if self.async_queue_backend is not None:
+            await self.async_queue_backend.delete_message_async( raw_msg )
+            return
+
         loop = asyncio.get_running_loop()
 
         def sync_delete():
             self.queue_backend.delete_message( raw_msg )
 
         await loop.run_in_executor( None, sync_delete )
+
+    async def _release_messages_async(self, raw_msgs: Iterable[ Any ]) -> None:
+        """
+        Make messages visible again immediately (visibility timeout 0), logging failures.
+
+        :param raw_msgs: The leased messages to release.
+        """
+        loop = asyncio.get_running_loop()
+        for raw_msg in raw_msgs:
+            try:
+                if self.async_queue_backend is not None:
+                    await self.async_queue_backend.update_message_async( raw_msg, visibility_timeout = 0 )
+                else:
+                    await loop.run_in_executor(
+                        None, partial( self.queue_backend.update_message, raw_msg, visibility_timeout = 0 )
+                    )
+            except Exception as ex:
+                logger.warning( f"Failed to release message: {ex}" )
@@ -0,0 +1,91 @@
+# background_workflows/controller/hybrid/hybrid_controller.py
+
+import logging
+from typing import Any, Dict, Optional
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.main_controller import MainController
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+
+logger = logging.getLogger(__name__)
+
+
+class HybridController(MainController):
+    """
+    HybridController consumes a single IQueueBackend and routes every message, by the
+    execution mode registered for its task_type, to one of three lanes (the thread and
+    async lanes are enabled by default, the process lane when max_processes > 0):
+
+      - "thread":  a ThreadPoolManager running `execute_single()` (blocking I/O, the default).
+      - "process": a ProcessPoolManager for CPU-bound activities that would hold the GIL.
+      - "async":   an AsyncPoolManager awaiting `execute_single_async()` on a dedicated
+                   event loop, for high-fan-out I/O-bound activities.
+
+    Each lane has its own concurrency limit; all lanes share one prefetch buffer, one
+    CpuSampler and one slot condition, so the dispatcher wakes whenever any lane frees
+    a slot. A lane configured with a limit of 0 is disabled: "process" activities then
+    run on the thread lane, while "async" activities are left in the queue for a
+    consumer with an asyncio lane.
+    """
+
+    def __init__(
+        self,
+        task_store: Any,
+        queue_backend: Any,
+        max_threads: int = AppConstants.HybridController.DEFAULT_MAX_THREADS,
+        max_processes: int = AppConstants.HybridController.DEFAULT_MAX_PROCESSES,
+        max_async_tasks: int = AppConstants.HybridController.DEFAULT_MAX_ASYNC_TASKS,
+        cpu_threshold: float = AppConstants.MainController.DEFAULT_CPU_THRESHOLD,
+        dispatch_mode: str = AppConstants.MainController.DispatchModes.CONTINUOUS,
+        prefetch_multiplier: int = AppConstants.MainController.PREFETCH_MULTIPLIER_DEFAULT,
+        process_store_factory: Optional[TaskStoreFactory] = None,
+    ) -> None:
+        """
+        Initialize the HybridController with a task store, queue backend, and per-lane limits.
+
+        :param task_store: An instance of ITaskStore for persisting task state.
+        :param queue_backend: An instance of IQueueBackend for message operations.
+        :param max_threads: Concurrency limit of the thread lane.
+        :param max_processes: Concurrency limit of the process lane (0, the default, disables it).
+        :param max_async_tasks: Concurrency limit of the asyncio lane (0 disables it).
+        :param cpu_threshold: Maximum CPU usage (as a fraction) at which new tasks are scheduled.
+        :param dispatch_mode: "continuous" (default) or "polling"; see MainController.
+        :param prefetch_multiplier: Size of the local prefetch buffer, as a multiple of the total lane capacity.
+        :param process_store_factory: TaskStoreFactory used by worker processes to open their own store.
+                                      Derived from task_store when omitted.
+        :raises ValueError: If dispatch_mode is not recognized, or the task store cannot be shared
+                            with worker processes.
+        """
+        super().__init__(
+            task_store,
+            queue_backend,
+            max_threads=max_threads,
+            cpu_threshold=cpu_threshold,
+            dispatch_mode=dispatch_mode,
+            prefetch_multiplier=prefetch_multiplier,
+            max_processes=max_processes,
+            process_store_factory=process_store_factory,
+            max_async_tasks=max_async_tasks,
+        )
+        logger.info(f"HybridController lanes: {self.lane_limits()}")
+
+    def lane_limits(self) -> Dict[str, int]:
+        """
+        :return: The concurrency limit of every configured lane, keyed by execution mode.
+        """
+        return {lane: pool.max_workers for lane, pool in self._pools.items()}
+
+    def lane_in_flight(self) -> Dict[str, int]:
+        """
+        :return: The number of in-flight tasks of every configured lane, keyed by execution mode.
+        """
+        return {lane: pool.current_thread_count() for lane, pool in self._pools.items()}
+
+    def shutdown_lanes(self, wait: bool = True) -> None:
+        """
+        Shut down every lane's pool. Call after the run loop has exited.
+
+        :param wait: If True, block until the tasks running in each lane are complete.
+        """
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
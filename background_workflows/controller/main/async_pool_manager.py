@@ -0,0 +1,90 @@
+# background_workflows/controller/main/async_pool_manager.py
+
+import asyncio
+import logging
+import threading
+from typing import Any, Optional
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.base_pool_manager import BasePoolManager
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPoolManager(BasePoolManager):
+    """
+    Runs I/O-bound tasks as coroutines on a dedicated asyncio event loop thread.
+
+    Exposes the same interface as ThreadPoolManager, so a synchronous dispatcher can mix
+    it with thread and process pools. Each submitted task awaits `execute_single_async()`;
+    concurrency is bounded by `max_tasks` through the shared slot accounting.
+    """
+
+    def __init__(
+        self,
+        max_tasks: int = AppConstants.AsyncPoolManager.DEFAULT_MAX,
+        cpu_sampler: Optional[CpuSampler] = None,
+        slot_condition: Optional[threading.Condition] = None,
+    ) -> None:
+        """
+        Initialize the AsyncPoolManager and start its event loop thread.
+
+        :param max_tasks: Maximum number of coroutines allowed in flight.
+        :param cpu_sampler: Optional CpuSampler to read CPU usage from. If omitted, a sampler
+                            with the default window and smoothing factor is created.
+        :param slot_condition: Optional condition variable shared with other pools.
+        """
+        super().__init__(max_tasks, cpu_sampler=cpu_sampler, slot_condition=slot_condition)
+        self.max_tasks: int = max_tasks
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._loop_thread: threading.Thread = threading.Thread(
+            target=self.loop.run_forever, name=AppConstants.AsyncPoolManager.THREAD_NAME, daemon=True
+        )
+        self._loop_thread.start()
+
+    def submit_task(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
+        """
+        Schedules a task on the event loop.
+
+        :param task_obj: The task object (must implement an `execute_single_async` coroutine).
+        :param msg: The parsed message to be processed.
+        :param raw_msg: The original message object (used for deletion upon successful execution).
+        :param queue_backend: The queue backend to interact with (e.g., for deleting or updating the message).
+        """
+        self._track(
+            self._task_type_of(msg),
+            lambda: asyncio.run_coroutine_threadsafe(
+                self._task_runner(task_obj, msg, raw_msg, queue_backend), self.loop
+            ),
+        )
+
+    async def _task_runner(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
+        """
+        Awaits a single task and then deletes its message without blocking the event loop.
+
+        :param task_obj: The task object.
+        :param msg: The parsed message.
+        :param raw_msg: The original message object.
+        :param queue_backend: The queue backend used for message deletion.
+        """
+        try:
+            logger.info(f"Starting async job for row_key={getattr(msg, 'row_key', None)}")
+            await task_obj.execute_single_async(msg)
+            await asyncio.get_running_loop().run_in_executor(None, queue_backend.delete_message, raw_msg)
+        except Exception as ex:
+            logger.exception(f"Exception in async job (row_key={getattr(msg, 'row_key', None)}): {ex}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the event loop, optionally waiting for in-flight coroutines to complete first.
+
+        :param wait: If True, block until all in-flight tasks are complete.
+        """
+        if wait:
+            with self._slot_condition:
+                self._slot_condition.wait_for(lambda: self._in_flight == 0)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+        self.cpu_sampler.stop()
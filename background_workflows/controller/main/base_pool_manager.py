@@ -0,0 +1,205 @@
+# background_workflows/controller/main/base_pool_manager.py
+
+import abc
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Dict, Optional
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+
+
+class BasePoolManager(abc.ABC):
+    """
+    Common base for worker pools used by MainController (threads or processes).
+
+    Features:
+      - Monitors CPU usage via `get_cpu_usage()`, backed by a non-blocking CpuSampler.
+      - Tracks in-flight tasks (total and per task type) with a counter maintained by
+        Future completion callbacks, so load checks are O(1).
+      - Lets dispatchers block on a condition variable until a slot frees up
+        (`wait_for_free_slot()`) or any running task completes (`wait_for_completion()`).
+
+    Subclasses must implement `submit_task()` and `shutdown()`.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        cpu_sampler: Optional[CpuSampler] = None,
+        slot_condition: Optional[threading.Condition] = None,
+    ) -> None:
+        """
+        Initialize the pool accounting.
+
+        :param max_workers: Maximum number of tasks allowed in flight.
+        :param cpu_sampler: Optional CpuSampler to read CPU usage from. If omitted, a sampler
+                            with the default window and smoothing factor is created.
+        :param slot_condition: Optional condition variable to notify when a slot is released.
+                               Share one between pools to wait on several of them at once.
+        """
+        self.max_workers: int = max_workers
+
+        # In-flight accounting; every field below is guarded by _slot_condition.
+        self._slot_condition: threading.Condition = slot_condition or threading.Condition()
+        self._in_flight: int = 0
+        self._in_flight_by_type: Dict[str, int] = {}
+        # Set when a task finishes and cleared by wait_for_completion(), so completions are never missed.
+        self._completion_pending: bool = False
+
+        self.cpu_sampler: CpuSampler = cpu_sampler or CpuSampler()
+        self.cpu_sampler.start()
+
+    @property
+    def slot_condition(self) -> threading.Condition:
+        """
+        :return: The condition variable notified whenever a slot is released.
+        """
+        return self._slot_condition
+
+    def get_cpu_usage(self) -> float:
+        """
+        Returns the current CPU usage as a fraction between 0.0 and 1.0.
+
+        Reads the latest smoothed value maintained by the background CpuSampler,
+        so this call never blocks.
+
+        :return: CPU usage fraction (e.g., 0.25 for 25% usage).
+        """
+        return self.cpu_sampler.get_usage()
+
+    def current_thread_count(self) -> int:
+        """
+        Returns the current number of in-flight (submitted but not completed) tasks.
+
+        :return: The number of active tasks.
+        """
+        with self._slot_condition:
+            return self._in_flight
+
+    def in_flight_by_type(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of in-flight task counts keyed by task type.
+
+        :return: A dictionary mapping task_type to its number of in-flight tasks.
+        """
+        with self._slot_condition:
+            return dict(self._in_flight_by_type)
+
+    def in_flight_count(self, task_type: str) -> int:
+        """
+        Returns the number of in-flight tasks of the given type.
+
+        :param task_type: The task type to look up.
+        :return: The number of in-flight tasks of that type.
+        """
+        with self._slot_condition:
+            return self._in_flight_by_type.get(task_type, 0)
+
+    def available_slots(self) -> int:
+        """
+        Returns the number of worker slots that can accept a new task right now.
+
+        :return: max_workers minus the number of active tasks (never negative).
+        """
+        with self._slot_condition:
+            return max(0, self.max_workers - self._in_flight)
+
+    def wait_for_free_slot(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until at least one worker slot is free or the timeout expires.
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if a slot is free, False if the timeout expired.
+        """
+        with self._slot_condition:
+            return self._slot_condition.wait_for(lambda: self._in_flight < self.max_workers, timeout)
+
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until a submitted task completes or the timeout expires.
+
+        Completions that happened since the previous call are not lost: the call
+        returns immediately in that case.
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if a task completed, False if the timeout expired.
+        """
+        with self._slot_condition:
+            completed: bool = self._slot_condition.wait_for(lambda: self._completion_pending, timeout)
+            self._completion_pending = False
+            return completed
+
+    @abc.abstractmethod
+    def submit_task(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
+        """
+        Submits a task for execution. The queue message is deleted once the task has run.
+
+        :param task_obj: The task object (must implement an `execute_single` method).
+        :param msg: The parsed message to be processed.
+        :param raw_msg: The original message object (used for deletion upon successful execution).
+        :param queue_backend: The queue backend to interact with (e.g., for deleting or updating the message).
+        """
+        raise NotImplementedError("Subclasses must implement submit_task()")
+
+    @abc.abstractmethod
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the pool, optionally waiting for running tasks to complete.
+
+        :param wait: If True, block until all pending tasks are complete.
+        """
+        raise NotImplementedError("Subclasses must implement shutdown()")
+
+    def _task_type_of(self, msg: Any) -> str:
+        """
+        :param msg: The parsed message.
+        :return: The message's task type, or an empty string if it has none.
+        """
+        return getattr(msg, AppConstants.MessageKeys.TASK_TYPE, None) or ""
+
+    def _track(self, task_type: str, submit: Any) -> Future:
+        """
+        Accounts for one in-flight task, submits it, and registers the completion callback.
+
+        :param task_type: The task type to account the slot under.
+        :param submit: A zero-argument callable that submits the work and returns its Future.
+        :return: The Future returned by `submit`.
+        """
+        with self._slot_condition:
+            self._in_flight += 1
+            self._in_flight_by_type[task_type] = self._in_flight_by_type.get(task_type, 0) + 1
+
+        try:
+            future: Future = submit()
+        except Exception:
+            self._release_slot(task_type)
+            raise
+        future.add_done_callback(partial(self._on_task_done, task_type))
+        return future
+
+    def _on_task_done(self, task_type: str, future: Future) -> None:
+        """
+        Future callback that releases the task's slot and wakes waiting dispatchers.
+
+        :param task_type: The task type the slot was accounted under.
+        :param future: The completed future.
+        """
+        self._release_slot(task_type)
+
+    def _release_slot(self, task_type: str) -> None:
+        """
+        Decrements the in-flight counters for one task and notifies waiters.
+
+        :param task_type: The task type the slot was accounted under.
+        """
+        with self._slot_condition:
+            self._in_flight -= 1
+            remaining: int = self._in_flight_by_type.get(task_type, 0) - 1
+            if remaining > 0:
+                self._in_flight_by_type[task_type] = remaining
+            else:
+                self._in_flight_by_type.pop(task_type, None)
+            self._completion_pending = True
+            self._slot_condition.notify_all()
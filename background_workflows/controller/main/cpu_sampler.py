@@ -0,0 +1,147 @@
+# background_workflows/controller/main/cpu_sampler.py
+
+import logging
+import threading
+from typing import Any, Optional
+
+import psutil
+
+from background_workflows.constants.app_constants import AppConstants
+
+logger = logging.getLogger(__name__)
+
+
+class CpuSampler:
+    """
+    Samples system CPU utilization on a background daemon thread.
+
+    Each window of `sample_interval` seconds produces a raw utilization figure which is
+    folded into an exponential moving average. Readers call `get_usage()`, which returns
+    the latest smoothed value immediately and never sleeps.
+    """
+
+    def __init__(
+        self,
+        sample_interval: float = AppConstants.CpuSampler.DEFAULT_SAMPLE_INTERVAL_SECS,
+        smoothing_factor: float = AppConstants.CpuSampler.DEFAULT_SMOOTHING_FACTOR,
+    ) -> None:
+        """
+        Initialize the CpuSampler.
+
+        :param sample_interval: Length (in seconds) of each measurement window.
+        :param smoothing_factor: Weight (0.0 < factor <= 1.0) given to the newest sample.
+                                 1.0 disables smoothing.
+        :raises ValueError: If either parameter is out of range.
+        """
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be greater than 0.")
+        if not 0.0 < smoothing_factor <= 1.0:
+            raise ValueError("smoothing_factor must be in the range (0.0, 1.0].")
+
+        self.sample_interval: float = sample_interval
+        self.smoothing_factor: float = smoothing_factor
+
+        self._usage: float = 0.0
+        self._has_sample: bool = False
+        self._last_times: Optional[Any] = None
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Start the background sampling thread. Calling start() on a running sampler is a no-op.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._last_times = psutil.cpu_times()
+            self._thread = threading.Thread(
+                target=self._run, name=AppConstants.CpuSampler.THREAD_NAME, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background sampling thread.
+
+        :param timeout: Maximum number of seconds to wait for the thread to exit.
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        """
+        :return: True if the sampling thread is alive.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_usage(self) -> float:
+        """
+        Returns the latest smoothed CPU usage as a fraction between 0.0 and 1.0.
+
+        This call never blocks. Until the first window completes, 0.0 is returned.
+
+        :return: CPU usage fraction (e.g., 0.25 for 25% usage).
+        """
+        return self._usage
+
+    def sample_once(self) -> float:
+        """
+        Takes a single measurement against the previous snapshot and folds it into the average.
+
+        :return: The updated smoothed usage fraction.
+        """
+        current = psutil.cpu_times()
+        previous = self._last_times if self._last_times is not None else current
+        self._last_times = current
+
+        raw: float = self._busy_fraction(previous, current)
+        if self._has_sample:
+            self._usage = self.smoothing_factor * raw + (1.0 - self.smoothing_factor) * self._usage
+        else:
+            self._usage = raw
+            self._has_sample = True
+        return self._usage
+
+    def _run(self) -> None:
+        """
+        Sampling loop executed on the background thread.
+        """
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                self.sample_once()
+            except Exception as ex:
+                logger.exception(f"CPU sampling failed: {ex}")
+
+    @staticmethod
+    def _busy_fraction(previous: Any, current: Any) -> float:
+        """
+        Computes the busy fraction between two psutil.cpu_times() snapshots.
+
+        :param previous: The earlier snapshot.
+        :param current: The later snapshot.
+        :return: Busy time divided by total time, clamped to [0.0, 1.0].
+        """
+        total: float = CpuSampler._total_time(current) - CpuSampler._total_time(previous)
+        if total <= 0:
+            return 0.0
+        idle: float = (current.idle - previous.idle) + (
+            getattr(current, "iowait", 0.0) - getattr(previous, "iowait", 0.0)
+        )
+        return min(1.0, max(0.0, (total - idle) / total))
+
+    @staticmethod
+    def _total_time(times: Any) -> float:
+        """
+        Sums a psutil.cpu_times() snapshot. On Linux, guest time is already included
+        in user/nice time, so it is subtracted to avoid double counting.
+
+        :param times: A psutil.cpu_times() snapshot.
+        :return: Total CPU time in seconds.
+        """
+        return sum(times) - getattr(times, "guest", 0.0) - getattr(times, "guest_nice", 0.0)
@@ -1,13 +1,20 @@
 # backgorund_workflows/controller/main/main_controller.py
 
-import time
 import logging
-from typing import Any
+import threading
+from typing import Any, Dict, Optional
 
 from background_workflows.constants.app_constants import AppConstants
 from background_workflows.controller.base_controller import BaseController
+from background_workflows.controller.main.async_pool_manager import AsyncPoolManager
+from background_workflows.controller.main.base_pool_manager import BasePoolManager
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+from background_workflows.controller.main.prefetch_buffer import PrefetchBuffer
+from background_workflows.controller.main.process_pool_manager import ProcessPoolManager
 from background_workflows.controller.main.thread_pool_manager import ThreadPoolManager
 from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+from background_workflows.utils.activity_registry import ActivityRegistry
 from background_workflows.utils.dynamic_task_creator import DynamicTaskCreator
 
 logger = logging.getLogger(__name__)
@@ -16,11 +23,14 @@ logger = logging.getLogger(__name__)
 class MainController(BaseController):
     """
     MainController orchestrates task processing by:
-      - Polling messages from an IQueueBackend.
-      - Delegating tasks to a ThreadPoolManager.
+      - Polling messages from an IQueueBackend into a bounded PrefetchBuffer.
+      - Delegating tasks to a ThreadPoolManager, to a ProcessPoolManager for activities
+        registered with execution_mode="process", or to an AsyncPoolManager for activities
+        registered with execution_mode="async" (each lane has its own concurrency limit).
       - Instantiating the proper task via DynamicTaskCreator.
 
-    It continuously monitors system CPU usage and dispatches tasks when safe.
+    It continuously monitors system CPU usage (sampled on a background thread, so
+    admission checks never block) and dispatches tasks when safe.
     """
 
     def __init__(
@@ -29,6 +39,13 @@ class MainController(BaseController):
         queue_backend: Any,
         max_threads: int = AppConstants.MainController.DEFAULT_MAX_THREADS,
         cpu_threshold: float = AppConstants.MainController.DEFAULT_CPU_THRESHOLD,
+        cpu_sample_interval: float = AppConstants.CpuSampler.DEFAULT_SAMPLE_INTERVAL_SECS,
+        cpu_smoothing_factor: float = AppConstants.CpuSampler.DEFAULT_SMOOTHING_FACTOR,
+        dispatch_mode: str = AppConstants.MainController.DEFAULT_DISPATCH_MODE,
+        prefetch_multiplier: int = AppConstants.MainController.PREFETCH_MULTIPLIER_DEFAULT,
+        max_processes: int = 0,
+        process_store_factory: Optional[TaskStoreFactory] = None,
+        max_async_tasks: int = 0,
     ) -> None:
         """
         Initialize the MainController with a task store, queue backend, and resource limits.
@@ -37,102 +54,326 @@ class MainController(BaseController):
         :param queue_backend: An instance of IQueueBackend for message operations.
         :param max_threads: Maximum number of concurrent worker tasks.
         :param cpu_threshold: Maximum CPU usage (as a fraction) at which new tasks are scheduled.
+        :param cpu_sample_interval: Length (in seconds) of each background CPU measurement window.
+        :param cpu_smoothing_factor: Weight (0.0-1.0] of the newest CPU sample in the moving average.
+        :param dispatch_mode: "polling" (poll, dispatch, sleep) or "continuous" (pull one message per
+                              free worker slot, wake on task completion, back off only when idle).
+        :param prefetch_multiplier: Size of the local prefetch buffer, as a multiple of the total worker count.
+        :param max_processes: Number of worker processes for "process" activities. With 0 (default),
+                              no process pool is created and those activities run on threads.
+        :param process_store_factory: TaskStoreFactory used by worker processes to open their own store.
+                                      Derived from task_store when omitted.
+        :param max_async_tasks: Number of concurrent coroutines for "async" activities. With 0 (default),
+                                no asyncio lane is created and those activities' messages are released
+                                back to the queue for a consumer that has one.
+        :raises ValueError: If dispatch_mode is not recognized, or the task store cannot be shared
+                            with worker processes.
         """
+        if dispatch_mode not in (
+            AppConstants.MainController.DispatchModes.POLLING,
+            AppConstants.MainController.DispatchModes.CONTINUOUS,
+        ):
+            raise ValueError(f"Unknown dispatch_mode: {dispatch_mode}")
+
         super().__init__(task_store, queue_backend)
         self.max_threads: int = max_threads
         self.cpu_threshold: float = cpu_threshold
+        self.dispatch_mode: str = dispatch_mode
+
+        self.cpu_sampler: CpuSampler = CpuSampler(
+            sample_interval=cpu_sample_interval,
+            smoothing_factor=cpu_smoothing_factor,
+        )
+        # One condition shared by every pool, so the dispatcher can wait for a slot in any of them.
+        self._slot_condition: threading.Condition = threading.Condition()
+        self.thread_pool: ThreadPoolManager = ThreadPoolManager(
+            max_threads, cpu_sampler=self.cpu_sampler, slot_condition=self._slot_condition
+        )
+        self.max_processes: int = max_processes
+        self.process_pool: Optional[ProcessPoolManager] = None
+        if max_processes > 0:
+            self.process_pool = ProcessPoolManager(
+                store_factory=process_store_factory or TaskStoreFactory.from_task_store(task_store),
+                max_processes=max_processes,
+                cpu_sampler=self.cpu_sampler,
+                slot_condition=self._slot_condition,
+            )
+        self.max_async_tasks: int = max_async_tasks
+        self.async_pool: Optional[AsyncPoolManager] = None
+        if max_async_tasks > 0:
+            self.async_pool = AsyncPoolManager(
+                max_tasks=max_async_tasks,
+                cpu_sampler=self.cpu_sampler,
+                slot_condition=self._slot_condition,
+            )
+
+        # Execution mode -> pool; "process" activities without a process pool fall back to the
+        # thread pool, "async" activities without an asyncio lane are not taken (see _lane_for).
+        self._pools: Dict[str, BasePoolManager] = {AppConstants.ExecutionModes.THREAD: self.thread_pool}
+        if self.process_pool is not None:
+            self._pools[AppConstants.ExecutionModes.PROCESS] = self.process_pool
+        if self.async_pool is not None:
+            self._pools[AppConstants.ExecutionModes.ASYNC] = self.async_pool
 
-        self.thread_pool: ThreadPoolManager = ThreadPoolManager(max_threads)
         self.task_creator: DynamicTaskCreator = DynamicTaskCreator(self.task_store)
+        self.prefetch_buffer: PrefetchBuffer = PrefetchBuffer(
+            capacity=max(1, sum(pool.max_workers for pool in self._pools.values()) * prefetch_multiplier),
+            visibility_timeout=AppConstants.MainController.DEFAULT_VISIBILITY_TIMEOUT,
+        )
+
+        self._shutdown_event: threading.Event = threading.Event()
 
     def run(self) -> None:
         """
-        Continuously poll the queue and dispatch tasks when system resources allow.
+        Continuously poll the queue and dispatch tasks when system resources allow,
+        until `shutdown()` is called.
 
         The loop performs the following steps:
           1. Wait until CPU usage is below the defined threshold.
           2. Poll the queue for messages.
           3. Dispatch each message to the thread pool for execution.
+
+        In "continuous" dispatch mode, see `_run_continuous()`.
         """
-        logger.info("MainController run loop started.")
-        while True:
+        logger.info(f"MainController run loop started (dispatch_mode={self.dispatch_mode}).")
+        if self.dispatch_mode == AppConstants.MainController.DispatchModes.CONTINUOUS:
+            self._run_continuous()
+            return
+
+        while not self._shutdown_event.is_set():
             self._wait_for_safe_cpu()
             self._poll_and_handle_messages(self.queue_backend)
-            time.sleep(AppConstants.MainController.MAIN_LOOP_SLEEP_SECS)
+            self._shutdown_event.wait(AppConstants.MainController.MAIN_LOOP_SLEEP_SECS)
+        self._release_prefetched()
+        logger.info("MainController run loop exiting (shutdown requested).")
+
+    def shutdown(self) -> None:
+        """
+        Signal the run loop to stop after its current iteration.
+
+        Tasks already submitted to the thread pool keep running; messages still held in
+        the prefetch buffer are released back to the queue when the loop exits.
+        """
+        logger.info("MainController shutdown requested.")
+        self._shutdown_event.set()
+        # Wake a continuous run loop that is waiting for a free slot.
+        with self._slot_condition:
+            self._slot_condition.notify_all()
+
+    def _run_continuous(self) -> None:
+        """
+        Backpressure-driven dispatch loop.
+
+          1. Wait until CPU usage is below the defined threshold.
+          2. Top up the prefetch buffer (never beyond its capacity) and dispatch
+             buffered messages into every free worker slot.
+          3. If messages are still waiting for a slot, block until one frees up (or shutdown
+             is requested).
+          4. If the queue was empty, sleep with exponential backoff; any received
+             message resets the backoff.
+        """
+        backoff: float = AppConstants.MainController.IDLE_BACKOFF_INITIAL_SECS
+        while not self._shutdown_event.is_set():
+            self._wait_for_safe_cpu()
+
+            received: int = self._poll_and_handle_messages(
+                self.queue_backend, max_messages=self.prefetch_buffer.capacity
+            )
+            if len(self.prefetch_buffer):
+                if not self._has_slot_for_prefetched():
+                    with self._slot_condition:
+                        self._slot_condition.wait_for(
+                            lambda: self._shutdown_event.is_set() or self._has_slot_for_prefetched(),
+                            timeout=AppConstants.MainController.MAIN_LOOP_SLEEP_SECS,
+                        )
+                else:
+                    # Slots are free but CPU usage is above the threshold; re-check shortly.
+                    self._shutdown_event.wait(AppConstants.MainController.MAIN_LOOP_CPU_RECHECK_SECS)
+                backoff = AppConstants.MainController.IDLE_BACKOFF_INITIAL_SECS
+                continue
+            if received:
+                backoff = AppConstants.MainController.IDLE_BACKOFF_INITIAL_SECS
+                continue
+
+            logger.debug(f"Queue empty; backing off for {backoff:.2f}s.")
+            self._shutdown_event.wait(backoff)
+            backoff = min(
+                backoff * AppConstants.MainController.IDLE_BACKOFF_MULTIPLIER,
+                AppConstants.MainController.IDLE_BACKOFF_MAX_SECS,
+            )
+        self._release_prefetched()
+        logger.info("MainController run loop exiting (shutdown requested).")
 
     def run_once(self, max_messages: int = AppConstants.MainController.RUN_ONCE_MAX_MESSAGES_DEFAULT) -> None:
         """
         Executes a single pass to poll and dispatch tasks.
 
-        Useful for testing or ad-hoc runs.
+        Useful for testing or ad-hoc runs. Messages received but not dispatched in this pass
+        (no free slot, or CPU above the threshold) are released back to the queue, so they are
+        not held under the prefetch lease after the pass.
 
         :param max_messages: Maximum number of messages to process in this pass.
         """
         logger.info("MainController single-pass started.")
         self._wait_for_safe_cpu()
         self._poll_and_handle_messages(self.queue_backend, max_messages=max_messages)
+        self._release_prefetched()
 
     def _wait_for_safe_cpu(self) -> None:
         """
-        Wait until the current CPU usage falls below the defined threshold.
+        Wait until the current CPU usage falls below the defined threshold,
+        or until shutdown is requested.
         """
-        while True:
+        while not self._shutdown_event.is_set():
             usage: float = self.thread_pool.get_cpu_usage()
             if usage < self.cpu_threshold:
                 break
             logger.warning(
                 f"CPU usage {usage:.2f} >= threshold {self.cpu_threshold:.2f}, sleeping."
             )
-            time.sleep(AppConstants.MainController.MAIN_LOOP_CPU_RECHECK_SECS)
+            self._shutdown_event.wait(AppConstants.MainController.MAIN_LOOP_CPU_RECHECK_SECS)
 
     def _poll_and_handle_messages(
         self, queue_backend: Any, max_messages: int = AppConstants.MainController.POLL_AND_HANDLE_DEFAULT_MESSAGES
-    ) -> None:
+    ) -> int:
         """
-        Poll the queue for messages and dispatch each to the worker pool.
+        Top up the prefetch buffer from the queue, dispatch buffered messages to the worker
+        pool, and renew the leases of messages that are still waiting.
 
         :param queue_backend: The queue backend from which to receive messages.
         :param max_messages: Maximum number of messages to fetch from the queue.
+        :return: The number of messages received.
         """
+        received: int = self._fill_prefetch_buffer(queue_backend, max_messages)
+        self._dispatch_prefetched(queue_backend)
+        self.prefetch_buffer.renew_expiring(queue_backend)
+        return received
+
+    def _fill_prefetch_buffer(self, queue_backend: Any, max_messages: int) -> int:
+        """
+        Receive up to the buffer's free capacity and stage each message in the prefetch buffer.
+        Messages with an unknown task type are deleted immediately; messages no lane of this
+        controller can run are released back to the queue.
+
+        :param queue_backend: The queue backend from which to receive messages.
+        :param max_messages: Maximum number of messages to fetch from the queue.
+        :return: The number of messages received, not counting released ones (so a queue holding
+                 only messages this controller cannot run still backs off like an empty one).
+        """
+        to_fetch: int = min(max_messages, self.prefetch_buffer.free_capacity())
+        if to_fetch <= 0:
+            return 0
+
         msgs = queue_backend.receive_messages(
-            max_messages=max_messages,
-            visibility_timeout=AppConstants.MainController.DEFAULT_VISIBILITY_TIMEOUT,
+            max_messages=to_fetch,
+            visibility_timeout=self.prefetch_buffer.visibility_timeout,
         )
         if not msgs:
-            return
+            return 0
 
+        received: int = 0
         for raw_msg in msgs:
-            self._handle_single(raw_msg, queue_backend)
+            received += 1
+            # Parse the message into a TaskMessage object
+            tmsg = TaskMessage(raw_msg)
+            task_obj = self.task_creator.create_task(tmsg)
+            if not task_obj:
+                logger.warning(f"Unknown task_type={tmsg.task_type}, removing message.")
+                queue_backend.delete_message(raw_msg)
+                continue
+            if self._lane_for(tmsg) is None:
+                received -= 1
+                self._release_unserved(queue_backend, raw_msg, tmsg)
+                continue
+            self.prefetch_buffer.put(raw_msg, tmsg, task_obj)
+        return received
 
-    def _handle_single(self, raw_msg: Any, queue_backend: Any) -> None:
+    def _dispatch_prefetched(self, queue_backend: Any) -> int:
         """
-        Handle a single queued message: parse the message, create the corresponding task,
-        and submit the task for execution if resource constraints allow.
+        Submit buffered messages to the thread pool while resource constraints allow.
+        Messages that cannot be scheduled stay in the buffer (their lease is kept alive
+        by `PrefetchBuffer.renew_expiring()`).
 
-        :param raw_msg: The raw message from the queue.
         :param queue_backend: The queue backend for updating or deleting messages.
+        :return: The number of messages dispatched.
         """
-        # Parse the message into a TaskMessage object
-        tmsg = TaskMessage(raw_msg)
-        task_obj = self.task_creator.create_task(tmsg)
-        if not task_obj:
-            logger.warning(f"Unknown task_type={tmsg.task_type}, removing message.")
-            queue_backend.delete_message(raw_msg)
-            return
-
-        # Check current CPU usage and thread pool load
-        cpu_usage: float = self.thread_pool.get_cpu_usage()
-        active_count: int = self.thread_pool.current_thread_count()
+        dispatched: int = 0
+        while len(self.prefetch_buffer):
+            cpu_usage: float = self.thread_pool.get_cpu_usage()
+            if cpu_usage >= self.cpu_threshold:
+                logger.info(
+                    f"Holding {len(self.prefetch_buffer)} prefetched message(s); CPU usage {cpu_usage:.2f} "
+                    f">= threshold {self.cpu_threshold:.2f}."
+                )
+                break
 
-        if cpu_usage < self.cpu_threshold and active_count < self.max_threads:
+            # Oldest message whose pool has room; messages for a saturated pool keep their place.
+            item = self.prefetch_buffer.take(lambda m: self._pool_for(m.task_message).available_slots() > 0)
+            if item is None:
+                break
+            tmsg = item.task_message
+            lane: str = self._lane_for(tmsg)
             logger.info(
-                f"Scheduling task {tmsg.task_type} for resource_id={tmsg.resource_id}, row_key={tmsg.row_key}"
+                f"Scheduling task {tmsg.task_type} for resource_id={tmsg.resource_id}, row_key={tmsg.row_key} "
+                f"on the {lane} pool"
             )
-            self.thread_pool.submit_task(task_obj, tmsg, raw_msg, queue_backend)
-        else:
-            # Defer processing if resources are limited
-            queue_backend.update_message(
-                raw_msg,
-                visibility_timeout=AppConstants.MainController.VISIBILITY_TIMEOUT_FOR_DEFER,
-            )
-            logger.info(f"Deferring task; high CPU/threads for row_key={tmsg.row_key}")
+            self._pools[lane].submit_task(item.task_obj, tmsg, item.raw_msg, queue_backend)
+            dispatched += 1
+        return dispatched
+
+    def _lane_for(self, tmsg: TaskMessage) -> Optional[str]:
+        """
+        Select the lane (execution mode) for a message based on its activity's registration.
+
+        :param tmsg: The parsed task message.
+        :return: The registered execution mode if that lane is configured; "thread" for a "process"
+                 activity without a process pool; None for an "async" activity without an asyncio
+                 lane, since it has no synchronous entry point.
+        """
+        mode: str = ActivityRegistry.get_execution_mode(tmsg.task_type)
+        if mode in self._pools:
+            return mode
+        if mode == AppConstants.ExecutionModes.ASYNC:
+            return None
+        return AppConstants.ExecutionModes.THREAD
+
+    def _release_unserved(self, queue_backend: Any, raw_msg: Any, tmsg: TaskMessage) -> None:
+        """
+        Release a message this controller cannot run back to the queue, untouched, so a consumer
+        with the right lane can take it.
+
+        :param queue_backend: The queue backend that issued the lease.
+        :param raw_msg: The raw queue message.
+        :param tmsg: The parsed task message.
+        """
+        logger.warning(
+            f"No lane for task_type={tmsg.task_type} (row_key={tmsg.row_key}); "
+            f"returning it to the queue. Enable the asyncio lane with max_async_tasks > 0."
+        )
+        try:
+            queue_backend.update_message(raw_msg, visibility_timeout=0)
+        except Exception as ex:
+            logger.warning(f"Failed to release row_key={tmsg.row_key}: {ex}")
+
+    def _pool_for(self, tmsg: TaskMessage) -> BasePoolManager:
+        """
+        Select the pool for a message based on its activity's registered execution mode.
+
+        :param tmsg: The parsed task message.
+        :return: The pool serving the message's lane.
+        """
+        return self._pools[self._lane_for(tmsg)]
+
+    def _has_slot_for_prefetched(self) -> bool:
+        """
+        :return: True if at least one buffered message has a free slot in its pool.
+        """
+        return any(self._pool_for(item.task_message).available_slots() > 0 for item in self.prefetch_buffer)
+
+    def _release_prefetched(self) -> None:
+        """
+        Make every message still held in the prefetch buffer visible to other consumers.
+        """
+        released: int = self.prefetch_buffer.release_all(self.queue_backend)
+        if released:
+            logger.info(f"Released {released} prefetched message(s) back to the queue.")
@@ -0,0 +1,160 @@
+# background_workflows/controller/main/prefetch_buffer.py
+
+import time
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, Optional
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_message import TaskMessage
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchedMessage:
+    """
+    A leased queue message held locally until a worker slot becomes available.
+    """
+
+    __slots__ = ("raw_msg", "task_message", "task_obj", "lease_expires_at")
+
+    def __init__(self, raw_msg: Any, task_message: TaskMessage, task_obj: Any, lease_expires_at: float) -> None:
+        """
+        :param raw_msg: The original message object returned by the queue backend.
+        :param task_message: The parsed TaskMessage.
+        :param task_obj: The task instance that will process the message.
+        :param lease_expires_at: time.monotonic() value at which the message becomes visible again.
+        """
+        self.raw_msg: Any = raw_msg
+        self.task_message: TaskMessage = task_message
+        self.task_obj: Any = task_obj
+        self.lease_expires_at: float = lease_expires_at
+
+
+class PrefetchBuffer:
+    """
+    A bounded FIFO of leased messages sitting between queue receive and the worker pool.
+
+    Messages that cannot be dispatched immediately stay here instead of being pushed back
+    to the broker. Their leases are renewed in a single pass by `renew_expiring()`, and
+    `release_all()` makes any undispatched message visible again (e.g., on shutdown).
+
+    The buffer is meant to be driven by a single dispatcher thread and is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        visibility_timeout: int = AppConstants.MainController.DEFAULT_VISIBILITY_TIMEOUT,
+        renew_margin_secs: float = AppConstants.MainController.PREFETCH_LEASE_RENEW_MARGIN_SECS,
+    ) -> None:
+        """
+        Initialize the PrefetchBuffer.
+
+        :param capacity: Maximum number of messages held at once.
+        :param visibility_timeout: Lease length (in seconds) applied on receive and on every renewal.
+        :param renew_margin_secs: Leases expiring within this many seconds are renewed.
+        :raises ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity: int = capacity
+        self.visibility_timeout: int = visibility_timeout
+        self.renew_margin_secs: float = min(renew_margin_secs, visibility_timeout / 2)
+        self._items: Deque[PrefetchedMessage] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[PrefetchedMessage]:
+        return iter(self._items)
+
+    def free_capacity(self) -> int:
+        """
+        :return: The number of additional messages the buffer can accept.
+        """
+        return self.capacity - len(self._items)
+
+    def put(self, raw_msg: Any, task_message: TaskMessage, task_obj: Any) -> None:
+        """
+        Adds a freshly received message. Its lease is assumed to start now.
+
+        :param raw_msg: The original message object returned by the queue backend.
+        :param task_message: The parsed TaskMessage.
+        :param task_obj: The task instance that will process the message.
+        :raises OverflowError: If the buffer is full.
+        """
+        if not self.free_capacity():
+            raise OverflowError("Prefetch buffer is full.")
+        self._items.append(
+            PrefetchedMessage(raw_msg, task_message, task_obj, time.monotonic() + self.visibility_timeout)
+        )
+
+    def pop(self) -> Optional[PrefetchedMessage]:
+        """
+        Removes and returns the oldest buffered message.
+
+        :return: The oldest PrefetchedMessage, or None if the buffer is empty.
+        """
+        return self._items.popleft() if self._items else None
+
+    def take(self, predicate: Callable[[PrefetchedMessage], bool]) -> Optional[PrefetchedMessage]:
+        """
+        Removes and returns the oldest buffered message that satisfies the predicate.
+
+        :param predicate: Called with each buffered message, oldest first.
+        :return: The first matching PrefetchedMessage, or None if none matches.
+        """
+        for index, item in enumerate(self._items):
+            if predicate(item):
+                del self._items[index]
+                return item
+        return None
+
+    def renew_expiring(self, queue_backend: Any) -> int:
+        """
+        Extends the lease of every buffered message that is close to becoming visible again.
+
+        Messages whose renewal fails are dropped from the buffer, since another consumer
+        may already own them.
+
+        :param queue_backend: The queue backend that issued the leases.
+        :return: The number of leases renewed.
+        """
+        now: float = time.monotonic()
+        if not any(item.lease_expires_at - now <= self.renew_margin_secs for item in self._items):
+            return 0
+
+        renewed: int = 0
+        kept: Deque[PrefetchedMessage] = deque()
+        for item in self._items:
+            if item.lease_expires_at - now > self.renew_margin_secs:
+                kept.append(item)
+                continue
+            try:
+                queue_backend.update_message(item.raw_msg, visibility_timeout=self.visibility_timeout)
+                item.lease_expires_at = now + self.visibility_timeout
+                kept.append(item)
+                renewed += 1
+            except Exception as ex:
+                logger.warning(f"Dropping prefetched row_key={item.task_message.row_key}; lease renewal failed: {ex}")
+        self._items = kept
+        logger.debug(f"Renewed {renewed} prefetched message lease(s).")
+        return renewed
+
+    def release_all(self, queue_backend: Any) -> int:
+        """
+        Empties the buffer, making every held message immediately visible to other consumers.
+
+        :param queue_backend: The queue backend that issued the leases.
+        :return: The number of messages released.
+        """
+        released: int = 0
+        while self._items:
+            item = self._items.popleft()
+            try:
+                queue_backend.update_message(item.raw_msg, visibility_timeout=0)
+                released += 1
+            except Exception as ex:
+                logger.warning(f"Failed to release prefetched row_key={item.task_message.row_key}: {ex}")
+        return released
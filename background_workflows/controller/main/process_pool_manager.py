@@ -0,0 +1,120 @@
+# background_workflows/controller/main/process_pool_manager.py
+
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional, Type
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.base_pool_manager import BasePoolManager
+from background_workflows.controller.main.cpu_sampler import CpuSampler
+from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.storage.tables.i_task_storage import ITaskStore
+from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
+
+logger = logging.getLogger(__name__)
+
+# Long-lived task store owned by each worker process, created once by _initialize_worker().
+_worker_task_store: Optional[ITaskStore] = None
+
+
+def _initialize_worker(store_factory: TaskStoreFactory) -> None:
+    """
+    ProcessPoolExecutor initializer: opens the worker process's own task store connection.
+
+    :param store_factory: A TaskStoreFactory describing the store to connect to.
+    """
+    global _worker_task_store
+    _worker_task_store = store_factory.get_task_store()
+
+
+def _execute_in_worker(task_class: Type[Any], msg_json: str) -> None:
+    """
+    Runs a single task inside a worker process.
+
+    The task class is pickled by reference, so importing it in the worker also runs
+    its `@register_activity` registration.
+
+    :param task_class: The task class to instantiate.
+    :param msg_json: The TaskMessage serialized with `to_json()`.
+    """
+    tmsg: TaskMessage = TaskMessage({AppConstants.MessageKeys.CONTENT: msg_json})
+    task_class(_worker_task_store).execute_single(tmsg)
+
+
+class ProcessPoolManager(BasePoolManager):
+    """
+    Manages a pool of worker processes for CPU-bound tasks using a ProcessPoolExecutor.
+
+    Exposes the same interface as ThreadPoolManager. Each submitted TaskMessage is shipped
+    to a worker process as JSON; every worker holds its own long-lived task store built
+    from `store_factory`. Queue messages stay in the parent process and are deleted there
+    once the worker has finished.
+    """
+
+    def __init__(
+        self,
+        store_factory: TaskStoreFactory,
+        max_processes: int = AppConstants.ProcessPoolManager.DEFAULT_MAX,
+        cpu_sampler: Optional[CpuSampler] = None,
+        slot_condition: Optional[threading.Condition] = None,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the ProcessPoolManager.
+
+        :param store_factory: TaskStoreFactory used by each worker process to open its task store.
+        :param max_processes: Maximum number of worker processes allowed.
+        :param cpu_sampler: Optional CpuSampler to read CPU usage from. If omitted, a sampler
+                            with the default window and smoothing factor is created.
+        :param slot_condition: Optional condition variable shared with other pools.
+        :param mp_context: Optional multiprocessing context (e.g., multiprocessing.get_context("spawn")).
+        """
+        super().__init__(max_processes, cpu_sampler=cpu_sampler, slot_condition=slot_condition)
+        self.max_processes: int = max_processes
+        self.store_factory: TaskStoreFactory = store_factory
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=max_processes,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(store_factory,),
+        )
+
+    def submit_task(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
+        """
+        Submits a task to a worker process.
+
+        :param task_obj: The task object; only its class is sent to the worker.
+        :param msg: The TaskMessage to be processed.
+        :param raw_msg: The original message object (used for deletion upon successful execution).
+        :param queue_backend: The queue backend used to delete the message once the task has run.
+        """
+        future: Future = self._track(
+            self._task_type_of(msg),
+            lambda: self.executor.submit(_execute_in_worker, type(task_obj), msg.to_json()),
+        )
+        future.add_done_callback(lambda f: self._on_worker_finished(f, msg, raw_msg, queue_backend))
+
+    def _on_worker_finished(self, future: Future, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
+        """
+        Deletes the queue message if the worker ran the task, otherwise logs the failure.
+
+        :param future: The completed future.
+        :param msg: The parsed message.
+        :param raw_msg: The original message object.
+        :param queue_backend: The queue backend used for message deletion.
+        """
+        try:
+            future.result()
+            queue_backend.delete_message(raw_msg)
+        except Exception as ex:
+            logger.exception(f"Error in process task execution (row_key={getattr(msg, 'row_key', None)}): {ex}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the ProcessPoolExecutor, optionally waiting for running tasks to complete.
+
+        :param wait: If True, block until all pending tasks are complete.
+        """
+        self.executor.shutdown(wait=wait)
+        self.cpu_sampler.stop()
@@ -1,54 +1,45 @@
 # background_workflows/controller/main/thread_pool_manager.py
 
-import psutil
 import logging
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 from background_workflows.constants.app_constants import AppConstants
+from background_workflows.controller.main.base_pool_manager import BasePoolManager
+from background_workflows.controller.main.cpu_sampler import CpuSampler
 
 logger = logging.getLogger(__name__)
 
-class ThreadPoolManager:
+class ThreadPoolManager(BasePoolManager):
     """
     Manages a pool of worker threads for executing tasks using a ThreadPoolExecutor.
 
     Features:
-      - Monitors CPU usage via `get_cpu_usage()`.
-      - Tracks the number of active (non-completed) tasks.
+      - Monitors CPU usage via `get_cpu_usage()`, backed by a non-blocking CpuSampler.
+      - Tracks in-flight tasks (total and per task type) with a counter maintained by
+        Future completion callbacks, so load checks are O(1).
+      - Lets dispatchers block on a condition variable until a slot frees up
+        (`wait_for_free_slot()`) or any running task completes (`wait_for_completion()`).
       - Submits tasks to a ThreadPoolExecutor instead of manually managing threads.
     """
 
-    def __init__(self, max_threads: int = AppConstants.ThreadPoolManager.DEFAULT_MAX) -> None:
+    def __init__(
+        self,
+        max_threads: int = AppConstants.ThreadPoolManager.DEFAULT_MAX,
+        cpu_sampler: Optional[CpuSampler] = None,
+        slot_condition: Optional[threading.Condition] = None,
+    ) -> None:
         """
         Initialize the ThreadPoolManager.
 
         :param max_threads: Maximum number of worker threads allowed.
+        :param cpu_sampler: Optional CpuSampler to read CPU usage from. If omitted, a sampler
+                            with the default window and smoothing factor is created.
+        :param slot_condition: Optional condition variable shared with other pools.
         """
+        super().__init__(max_threads, cpu_sampler=cpu_sampler, slot_condition=slot_condition)
         self.max_threads: int = max_threads
         self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_threads)
-        self.futures: List[Future[Any]] = []
-
-    def get_cpu_usage(self) -> float:
-        """
-        Returns the current CPU usage as a fraction between 0.0 and 1.0.
-
-        Uses psutil.cpu_percent() with a one-second interval. Note that using interval=1
-        will block for one second to measure CPU usage.
-
-        :return: CPU usage fraction (e.g., 0.25 for 25% usage).
-        """
-        return psutil.cpu_percent(interval=1) / 100.0
-
-    def current_thread_count(self) -> int:
-        """
-        Returns the current number of active (non-completed) futures.
-
-        Cleans up the list of futures by filtering out completed tasks.
-
-        :return: The number of active tasks.
-        """
-        self.futures = [f for f in self.futures if not f.done()]
-        return len(self.futures)
 
     def submit_task(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
         """
@@ -59,8 +50,10 @@ class ThreadPoolManager:
         :param raw_msg: The original message object (used for deletion upon successful execution).
         :param queue_backend: The queue backend to interact with (e.g., for deleting or updating the message).
         """
-        future: Future[Any] = self.executor.submit(self._task_runner, task_obj, msg, raw_msg, queue_backend)
-        self.futures.append(future)
+        self._track(
+            self._task_type_of(msg),
+            lambda: self.executor.submit(self._task_runner, task_obj, msg, raw_msg, queue_backend),
+        )
 
     def _task_runner(self, task_obj: Any, msg: Any, raw_msg: Any, queue_backend: Any) -> None:
         """
@@ -88,3 +81,4 @@ class ThreadPoolManager:
         :param wait: If True, block until all pending tasks are complete.
         """
         self.executor.shutdown(wait=wait)
+        self.cpu_sampler.stop()
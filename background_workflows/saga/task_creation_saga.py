@@ -8,6 +8,7 @@ from background_workflows.storage.queue.i_queue_backend import IQueueBackend
 from background_workflows.storage.tables.i_task_storage import ITaskStore
 from background_workflows.storage.schemas.task_entity import TaskEntity
 from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.utils.payload_codec import PayloadCodecs
 from background_workflows.utils.task_logger import logger
 
 
@@ -69,7 +70,7 @@ class TaskCreationSaga:
             PartitionKey=self.resource_id,
             RowKey=self.row_key,
             TaskType=self.activity_type,
-            InputPayload=json.dumps(kwargs),
+            InputPayload=PayloadCodecs.encode(json.dumps(kwargs)),
             OutputPayload="",
             Status=AppConstants.TaskStatus.CREATED,
             ContainerName = self.container_name,
@@ -113,10 +114,15 @@ class TaskCreationSaga:
 
     def _step_upsert_task(self) -> None:
         """
-        Insert (or update) the task record in the 'active' store.
+        Insert (or update) the task record in the 'active' store, and wait until it is durable
+        so a worker never receives the message before the row exists.
+
+        :raises SagaFailure: If the store reports that the write was not committed.
         """
         logger.debug(f"[TaskCreationSaga] Upserting TaskEntity with RowKey={self.row_key}")
         self.task_store.upsert_task(self.entity)
+        if not self.task_store.flush():
+            raise SagaFailure(f"Task row {self.row_key} was not committed.")
 
     def _step_enqueue_message(self) -> None:
         """
@@ -0,0 +1,184 @@
+# background_workflows/storage/azure_client_registry.py
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from azure.core.pipeline.transport import RequestsTransport
+from azure.data.tables import TableServiceClient
+from azure.storage.blob import BlobServiceClient
+from azure.storage.queue import QueueClient
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.utils.task_logger import logger
+
+
+class AzureClientRegistry:
+    """
+    Process-wide cache of Azure Storage clients that share one pooled HTTP transport.
+
+    Building a client from a connection string is cheap, but each client normally opens its own
+    requests.Session, so a process with a table store, a queue backend and a blob store (or one
+    store per message) keeps several connection pools and repeats TCP/TLS handshakes. The
+    registry creates each client once per connection string (and queue name). It hands every
+    client the same RequestsTransport, whose session keeps up to `pool_maxsize` connections
+    alive per host.
+
+    The transport is never owned by a client, so closing a client does not close the shared
+    session; call `close()` on the registry instead. `shared()` returns the registry of the
+    current process and builds a new one after a fork, because pooled sockets cannot be shared
+    between processes.
+
+    Only the synchronous clients are covered; the asyncio clients use an aiohttp session bound
+    to their event loop.
+    """
+
+    _shared: Optional["AzureClientRegistry"] = None
+    _shared_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        connection_timeout_secs: Optional[float] = None,
+        read_timeout_secs: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize the registry and its HTTP session. Settings left as None are read from the
+        environment (AppConstants.AzureClients) when the registry is created.
+
+        :param pool_connections: Number of per-host connection pools to cache.
+        :param pool_maxsize: Maximum number of connections kept per host.
+        :param connection_timeout_secs: TCP connect timeout, in seconds.
+        :param read_timeout_secs: Socket read timeout, in seconds.
+        :param keep_alive: If False, every request closes its connection ("Connection: close").
+        """
+        if pool_connections is None:
+            pool_connections = AppConstants.AzureClients.get_pool_connections()
+        if pool_maxsize is None:
+            pool_maxsize = AppConstants.AzureClients.get_pool_maxsize()
+        if connection_timeout_secs is None:
+            connection_timeout_secs = AppConstants.AzureClients.get_connection_timeout_secs()
+        if read_timeout_secs is None:
+            read_timeout_secs = AppConstants.AzureClients.get_read_timeout_secs()
+        if keep_alive is None:
+            keep_alive = AppConstants.AzureClients.get_keep_alive()
+        self.pool_connections: int = pool_connections
+        self.pool_maxsize: int = pool_maxsize
+        self.connection_timeout_secs: float = connection_timeout_secs
+        self.read_timeout_secs: float = read_timeout_secs
+        self.keep_alive: bool = keep_alive
+        self.pid: int = os.getpid()
+
+        self.session: requests.Session = requests.Session()
+        # The Azure pipeline retries on its own, so urllib3 must not (as in RequestsTransport).
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.transport: RequestsTransport = RequestsTransport(
+            session=self.session,
+            session_owner=False,
+            connection_timeout=connection_timeout_secs,
+            read_timeout=read_timeout_secs,
+        )
+
+        self._clients: Dict[Tuple[Any, ...], Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "AzureClientRegistry":
+        """
+        Returns the registry of the current process, creating it on first use (or after a fork).
+
+        :return: The process-wide AzureClientRegistry.
+        """
+        registry: Optional[AzureClientRegistry] = cls._shared
+        if registry is None or registry.pid != os.getpid():
+            with cls._shared_lock:
+                registry = cls._shared
+                if registry is None or registry.pid != os.getpid():
+                    registry = cls()
+                    cls._shared = registry
+        return registry
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """
+        Closes and forgets the process-wide registry, including its pooled transport. The next
+        `shared()` call builds a new one from the current environment, e.g. after changing the
+        AZURE_HTTP_* settings.
+        """
+        with cls._shared_lock:
+            registry: Optional[AzureClientRegistry] = cls._shared
+            cls._shared = None
+        if registry is not None and registry.pid == os.getpid():
+            registry.close()
+
+    def _get_or_create(self, key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+        """
+        Returns the cached client for key, creating it with factory on first use.
+
+        :param key: Cache key (client kind plus its identifying arguments).
+        :param factory: Builds the client.
+        :return: The client.
+        """
+        client: Any = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = factory()
+                    self._clients[key] = client
+                    logger.debug(f"Created shared Azure {key[0]} client.")
+        return client
+
+    def table_service_client(self, connection_string: str) -> TableServiceClient:
+        """
+        :param connection_string: Azure Storage connection string.
+        :return: The shared TableServiceClient for the account.
+        """
+        return self._get_or_create(
+            ("table", connection_string),
+            lambda: TableServiceClient.from_connection_string(connection_string, transport=self.transport),
+        )
+
+    def blob_service_client(self, connection_string: str) -> BlobServiceClient:
+        """
+        :param connection_string: Azure Storage connection string.
+        :return: The shared BlobServiceClient for the account.
+        """
+        return self._get_or_create(
+            ("blob", connection_string),
+            lambda: BlobServiceClient.from_connection_string(connection_string, transport=self.transport),
+        )
+
+    def queue_client(self, connection_string: str, queue_name: str) -> QueueClient:
+        """
+        :param connection_string: Azure Storage connection string.
+        :param queue_name: Name of the queue.
+        :return: The shared QueueClient for the queue.
+        """
+        return self._get_or_create(
+            ("queue", connection_string, queue_name),
+            lambda: QueueClient.from_connection_string(
+                conn_str=connection_string, queue_name=queue_name, transport=self.transport
+            ),
+        )
+
+    def close(self) -> None:
+        """
+        Forgets every cached client and closes the shared HTTP session.
+        """
+        with self._lock:
+            self._clients.clear()
+        self.session.close()
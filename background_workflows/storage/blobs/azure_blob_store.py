@@ -2,6 +2,7 @@
 
 from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob import BlobServiceClient
+from background_workflows.storage.azure_client_registry import AzureClientRegistry
 from .i_blob_store import IBlobStore
 from typing import Any
 
@@ -23,7 +24,8 @@ class AzureBlobStore(IBlobStore):
         :param connection_string: An Azure Storage connection string.
         """
         self.connection_string: str = connection_string
-        self.blob_service_client: BlobServiceClient = BlobServiceClient.from_connection_string(connection_string)
+        # Shared process-wide through AzureClientRegistry (one pooled HTTP transport).
+        self.blob_service_client: BlobServiceClient = AzureClientRegistry.shared().blob_service_client(connection_string)
 
     def create_container_if_not_exists(self, container_name: str) -> None:
         """
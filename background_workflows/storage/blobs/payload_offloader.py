@@ -0,0 +1,171 @@
+# background_workflows/storage/blobs/payload_offloader.py
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.i_blob_store import IBlobStore
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.utils.task_logger import logger
+
+# Task fields that may be offloaded.
+PAYLOAD_FIELDS: Tuple[str, ...] = (
+    AppConstants.TaskTableFields.INPUT_PAYLOAD,
+    AppConstants.TaskTableFields.OUTPUT_PAYLOAD,
+)
+
+
+class PayloadReference:
+    """
+    Loader of a payload kept in blob storage, attached to a TaskEntity field with
+    `TaskEntity.defer_field()`. The blob is downloaded on the first call and cached.
+    """
+
+    def __init__(self, offloader: "PayloadOffloader", reference: str, value: Optional[str] = None) -> None:
+        """
+        :param offloader: The PayloadOffloader that resolves the reference.
+        :param reference: The reference stored in the row.
+        :param value: The payload, if already known (e.g., it has just been uploaded).
+        """
+        self.offloader: PayloadOffloader = offloader
+        self.reference: str = reference
+        self.value: Optional[str] = value
+
+    def __call__(self) -> str:
+        """
+        :return: The payload.
+        """
+        if self.value is None:
+            self.value = self.offloader.load(self.reference)
+        return self.value
+
+
+class PayloadOffloader:
+    """
+    Moves large task payloads (InputPayload, OutputPayload) to an IBlobStore, leaving only a
+    short reference ("@blob:<container>/<blob>") in the task row.
+
+    - `offload()` runs before a write: payloads longer than `threshold` characters are uploaded
+      and the returned entity (a copy) carries their references. Each payload of a task has one
+      blob, overwritten when the payload changes, and a payload that has not changed since it
+      was loaded or uploaded is not uploaded again.
+    - `attach()` runs after a read: references are replaced by PayloadReference loaders, so a
+      blob is only downloaded when its field is first accessed.
+    - `delete_payloads()` removes the blobs of purged rows.
+
+    The blob is always written before the row that references it, so readers never see a
+    reference to a missing blob.
+    """
+
+    def __init__(
+        self,
+        blob_store: IBlobStore,
+        container_name: Optional[str] = None,
+        threshold: Optional[int] = None,
+    ) -> None:
+        """
+        :param blob_store: Store that holds the payload blobs.
+        :param container_name: Container of the payload blobs (default: PAYLOAD_OFFLOAD_CONTAINER).
+        :param threshold: Payloads longer than this many characters are offloaded (0 = never;
+                          default: PAYLOAD_OFFLOAD_THRESHOLD).
+        """
+        self.blob_store: IBlobStore = blob_store
+        self.container_name: str = (
+            container_name if container_name is not None else AppConstants.PayloadOffload.get_container_name()
+        )
+        self.threshold: int = threshold if threshold is not None else AppConstants.PayloadOffload.get_threshold()
+
+    def create_if_not_exists(self) -> None:
+        """
+        Creates the payload container.
+        """
+        self.blob_store.create_container_if_not_exists(self.container_name)
+
+    @staticmethod
+    def is_reference(value: Any) -> bool:
+        """
+        :param value: A stored payload value.
+        :return: True if value is a blob reference rather than a payload.
+        """
+        return isinstance(value, str) and value.startswith(AppConstants.PayloadOffload.REFERENCE_PREFIX)
+
+    @staticmethod
+    def parse_reference(reference: str) -> Tuple[str, str]:
+        """
+        :param reference: A blob reference.
+        :return: (container_name, blob_name).
+        """
+        container_name, _, blob_name = reference[len(AppConstants.PayloadOffload.REFERENCE_PREFIX):].partition("/")
+        return container_name, blob_name
+
+    def offload(self, entity: TaskEntity) -> TaskEntity:
+        """
+        Uploads the entity's large payloads and returns the entity to write.
+
+        Offloaded fields of `entity` are deferred to a PayloadReference that caches the
+        payload, so the caller keeps reading the payload without a download.
+
+        :param entity: The entity about to be written.
+        :return: entity itself if nothing is offloaded, otherwise a copy with references
+                 instead of the large payloads.
+        """
+        references: Dict[str, str] = {}
+        for field in PAYLOAD_FIELDS:
+            loader: Any = entity.field_loader(field)
+            if isinstance(loader, PayloadReference):
+                # Unchanged since it was loaded or uploaded: the blob is up to date.
+                references[field] = loader.reference
+                continue
+            value: Any = getattr(entity, field)
+            if self.threshold <= 0 or not isinstance(value, str) or len(value) <= self.threshold:
+                continue
+            blob_name: str = AppConstants.PayloadOffload.BLOB_NAME_FORMAT.format(row_key=entity.RowKey, field=field)
+            self.blob_store.upload_blob(self.container_name, blob_name, value.encode("utf-8"))
+            reference: str = f"{AppConstants.PayloadOffload.REFERENCE_PREFIX}{self.container_name}/{blob_name}"
+            entity.defer_field(field, PayloadReference(self, reference, value))
+            references[field] = reference
+        if not references:
+            return entity
+        return entity.copy_with(references)
+
+    def attach(self, entity: TaskEntity) -> TaskEntity:
+        """
+        Defers the referenced payloads of an entity read from storage.
+
+        :param entity: The entity as stored.
+        :return: The same entity.
+        """
+        for field in PAYLOAD_FIELDS:
+            value: Any = getattr(entity, field)
+            if self.is_reference(value):
+                entity.defer_field(field, PayloadReference(self, value))
+        return entity
+
+    def load(self, reference: str) -> str:
+        """
+        Downloads a referenced payload.
+
+        :param reference: A blob reference.
+        :return: The payload.
+        """
+        container_name, blob_name = self.parse_reference(reference)
+        return self.blob_store.download_blob(container_name, blob_name).decode("utf-8")
+
+    def delete_payloads(self, values: Iterable[Any]) -> int:
+        """
+        Deletes the blobs referenced by stored payload values; other values are ignored.
+        Failures are logged, so a missing blob never stops a purge.
+
+        :param values: Payload values of deleted rows.
+        :return: The number of blobs deleted.
+        """
+        deleted: int = 0
+        for value in values:
+            if not self.is_reference(value):
+                continue
+            container_name, blob_name = self.parse_reference(value)
+            try:
+                self.blob_store.delete_blob(container_name, blob_name)
+                deleted += 1
+            except Exception as ex:
+                logger.warning(f"Could not delete payload blob {value}: {ex}")
+        return deleted
@@ -0,0 +1,98 @@
+# background_workflows/storage/queue/async_azure_queue_backend.py
+from azure.core.exceptions import ResourceExistsError
+from azure.storage.queue import QueueMessage
+from azure.storage.queue.aio import QueueClient as AsyncQueueClient
+from typing import Any, List
+from .azure_queue_backend import AzureQueueBackend
+from .i_async_queue_backend import IAsyncQueueBackend
+
+
+class AsyncAzureQueueBackend( AzureQueueBackend, IAsyncQueueBackend ):
+    """
+    An Azure Storage Queue backend with native asyncio support.
+
+    The synchronous IQueueBackend methods are inherited from AzureQueueBackend; the
+    coroutine methods use `azure.storage.queue.aio.QueueClient`, so receive/delete/update
+    calls are awaited on the event loop instead of occupying executor threads.
+    The async client is created lazily on first use and must be closed with `close_async()`.
+    """
+
+    def __init__(self, connection_string: str, queue_name: str) -> None:
+        """
+        Initialize the AsyncAzureQueueBackend with the given connection string and queue name.
+
+        :param connection_string: The Azure Storage connection string.
+        :param queue_name: The name of the Azure queue.
+        """
+        super().__init__( connection_string, queue_name )
+        self.async_queue_client: Any = None
+
+    def _get_async_client(self) -> AsyncQueueClient:
+        """
+        :return: The async QueueClient, creating it on first use.
+        """
+        if self.async_queue_client is None:
+            self.async_queue_client = AsyncQueueClient.from_connection_string(
+                conn_str = self.connection_string, queue_name = self.queue_name
+            )
+        return self.async_queue_client
+
+    async def create_queue_async(self) -> None:
+        """
+        Creates the queue if it doesn't already exist.
+        """
+        try:
+            await self._get_async_client().create_queue()
+        except ResourceExistsError:
+            # The queue already exists, so no further action is needed.
+            pass
+
+    async def send_message_async(self, msg_str: str) -> None:
+        """
+        Sends a message string to the Azure queue.
+
+        :param msg_str: The message content to send.
+        """
+        await self._get_async_client().send_message( msg_str )
+
+    async def receive_messages_async(self, max_messages: int = 1, visibility_timeout: int = 60) -> List[ QueueMessage ]:
+        """
+        Receives messages from the queue.
+
+        :param max_messages: Maximum number of messages to retrieve.
+        :param visibility_timeout: The visibility timeout (in seconds) for the messages.
+        :return: A list of QueueMessage objects.
+        """
+        pager = self._get_async_client().receive_messages(
+            max_messages = max_messages, visibility_timeout = visibility_timeout
+        )
+        return [ msg async for msg in pager ]
+
+    async def delete_message_async(self, msg: QueueMessage) -> None:
+        """
+        Deletes the specified message from the queue.
+
+        :param msg: The QueueMessage object to delete.
+        """
+        await self._get_async_client().delete_message( msg )
+
+    async def update_message_async(self, msg: QueueMessage, visibility_timeout: int = 60) -> None:
+        """
+        Updates the visibility timeout of the specified message, refreshing its pop receipt in place.
+
+        :param msg: The QueueMessage object to update.
+        :param visibility_timeout: The new visibility timeout (in seconds).
+        """
+        updated: QueueMessage = await self._get_async_client().update_message(
+            msg.id, msg.pop_receipt, visibility_timeout = visibility_timeout
+        )
+        msg.pop_receipt = updated.pop_receipt
+        msg.next_visible_on = updated.next_visible_on
+
+    async def close_async(self) -> None:
+        """
+        Closes the async QueueClient and its HTTP session.
+        """
+        if self.async_queue_client is not None:
+            await self.async_queue_client.close()
+            self.async_queue_client = None
@@ -0,0 +1,62 @@
+# background_workflows/storage/queue/async_local_queue_backend.py
+
+from typing import Any, Dict, List
+from .i_async_queue_backend import IAsyncQueueBackend
+from .local_queue_backend import LocalQueueBackend
+
+
+class AsyncLocalQueueBackend(LocalQueueBackend, IAsyncQueueBackend):
+    """
+    An in-memory queue usable from both synchronous and asyncio code.
+
+    The coroutine methods operate on the same deque as the synchronous LocalQueueBackend
+    methods. Every operation is a non-blocking in-memory call, so the coroutines run
+    directly on the event loop instead of hopping through a thread pool.
+    """
+
+    async def create_queue_async(self) -> None:
+        """
+        Create the queue if necessary. For the local in-memory queue, this is a no-op.
+        """
+        self.create_queue()
+
+    async def send_message_async(self, msg_str: str) -> None:
+        """
+        Append a message to the local in-memory queue.
+
+        :param msg_str: The message content to enqueue.
+        """
+        self.send_message(msg_str)
+
+    async def receive_messages_async(self, max_messages: int = 1, visibility_timeout: int = 60) -> List[Dict[str, Any]]:
+        """
+        Retrieve up to 'max_messages' messages from the in-memory queue.
+
+        :param max_messages: The maximum number of messages to retrieve.
+        :param visibility_timeout: Not used in this local implementation.
+        :return: A list of message dictionaries (see LocalQueueBackend.receive_messages).
+        """
+        return self.receive_messages(max_messages=max_messages, visibility_timeout=visibility_timeout)
+
+    async def delete_message_async(self, msg: Dict[str, Any]) -> None:
+        """
+        Delete the specified message. Messages are removed during retrieval, so this is a no-op.
+
+        :param msg: The message dictionary to delete.
+        """
+        self.delete_message(msg)
+
+    async def update_message_async(self, msg: Dict[str, Any], visibility_timeout: int = 60) -> None:
+        """
+        Update the specified message's visibility timeout; zero (or less) releases it.
+
+        :param msg: The message dictionary to update.
+        :param visibility_timeout: The new visibility timeout, in seconds.
+        """
+        self.update_message(msg, visibility_timeout=visibility_timeout)
+
+    async def close_async(self) -> None:
+        """
+        Nothing to release for the local in-memory queue.
+        """
+        pass
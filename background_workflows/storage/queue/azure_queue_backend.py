@@ -1,7 +1,8 @@
 # background_workflows/storage/queue/azure_queue_backend.py
 from azure.core.exceptions import ResourceExistsError
-from azure.storage.queue import QueueClient, QueueMessage
+from azure.storage.queue import QueueMessage
 from typing import Any, Iterable
+from background_workflows.storage.azure_client_registry import AzureClientRegistry
 from .i_queue_backend import IQueueBackend
 
 
@@ -28,12 +29,11 @@ class AzureQueueBackend( IQueueBackend ):
         """
         Creates the queue if it doesn't already exist.
 
-        Initializes the queue client using the provided connection string and queue name.
+        Initializes the queue client using the provided connection string and queue name; the
+        client is shared process-wide through AzureClientRegistry.
         """
         try:
-            self.queue_client = QueueClient.from_connection_string(
-                conn_str = self.connection_string, queue_name = self.queue_name
-            )
+            self.queue_client = AzureClientRegistry.shared().queue_client( self.connection_string, self.queue_name )
             self.queue_client.create_queue()
         except ResourceExistsError:
             # The container already exists, so no further action is needed.
@@ -71,9 +71,14 @@ class AzureQueueBackend( IQueueBackend ):
         """
         Updates the visibility timeout of the specified message.
 
+        Azure issues a new pop receipt on every update, so the message is refreshed in place
+        to keep later updates and deletes valid.
+
         :param msg: The QueueMessage object to update.
         :param visibility_timeout: The new visibility timeout (in seconds).
         """
-        self.queue_client.update_message(
+        updated: QueueMessage = self.queue_client.update_message(
             msg.id, msg.pop_receipt, visibility_timeout = visibility_timeout
         )
+        msg.pop_receipt = updated.pop_receipt
+        msg.next_visible_on = updated.next_visible_on
@@ -0,0 +1,74 @@
+# background_workflows/storage/queue/i_async_queue_backend.py
+
+from abc import ABC, abstractmethod
+from typing import Any, List
+
+class IAsyncQueueBackend(ABC):
+    """
+    Interface for native asyncio queue operations.
+
+    The coroutine methods carry an `_async` suffix so that a backend can implement both
+    IQueueBackend and IAsyncQueueBackend on the same instance (e.g., a WorkflowClient
+    enqueues synchronously while MainAsyncController consumes asynchronously).
+
+    Implementations must provide coroutines to:
+      - create_queue_async()
+      - send_message_async(...)
+      - receive_messages_async(...)
+      - delete_message_async(...)
+      - update_message_async(...)
+      - close_async()
+    """
+
+    @abstractmethod
+    async def create_queue_async(self) -> None:
+        """
+        Create the queue if it does not already exist.
+        """
+        raise NotImplementedError("create_queue_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def send_message_async(self, msg_str: str) -> None:
+        """
+        Send a message to the queue.
+
+        :param msg_str: The message string to be sent.
+        """
+        raise NotImplementedError("send_message_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def receive_messages_async(self, max_messages: int = 1, visibility_timeout: int = 60) -> List[Any]:
+        """
+        Receive messages from the queue.
+
+        :param max_messages: Maximum number of messages to retrieve.
+        :param visibility_timeout: The visibility timeout (in seconds) for the retrieved messages.
+        :return: A list of message objects.
+        """
+        raise NotImplementedError("receive_messages_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def delete_message_async(self, msg: Any) -> None:
+        """
+        Delete the specified message from the queue.
+
+        :param msg: The message object to delete.
+        """
+        raise NotImplementedError("delete_message_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def update_message_async(self, msg: Any, visibility_timeout: int = 60) -> None:
+        """
+        Update the visibility timeout of the specified message.
+
+        :param msg: The message object to update.
+        :param visibility_timeout: The new visibility timeout (in seconds).
+        """
+        raise NotImplementedError("update_message_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def close_async(self) -> None:
+        """
+        Release any connections held by the async client.
+        """
+        raise NotImplementedError("close_async() must be implemented by subclasses.")
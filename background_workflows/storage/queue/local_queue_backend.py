@@ -22,6 +22,9 @@ class LocalQueueBackend(IQueueBackend):
         Initialize the local in-memory queue.
         """
         self.queue: deque[str] = deque()
+        # Messages released back to the front since the last receive; the next release goes
+        # after them, so releasing several messages keeps their order.
+        self._released_at_front: int = 0
 
     def create_queue(self) -> None:
         """
@@ -53,6 +56,7 @@ class LocalQueueBackend(IQueueBackend):
         :return: A list of message dictionaries.
         """
         msgs: List[Dict[str, Any]] = []
+        self._released_at_front = 0
         while self.queue and len(msgs) < max_messages:
             raw: str = self.queue.popleft()
             msg_obj: Dict[str, Any] = {"id": id(raw), "pop_receipt": None, "content": raw}
@@ -74,9 +78,13 @@ class LocalQueueBackend(IQueueBackend):
         """
         Update the specified message's visibility timeout.
 
-        This functionality is not implemented in the local approach.
+        Timed visibility is not simulated locally; extending a lease is a no-op. A timeout of
+        zero (or less) releases the message, putting it back at the front of the queue behind
+        any message released since the last receive, so released messages keep their order.
 
         :param msg: The message dictionary to update.
-        :param visibility_timeout: The new visibility timeout (unused locally).
+        :param visibility_timeout: The new visibility timeout, in seconds.
         """
-        pass
+        if visibility_timeout <= 0:
+            self.queue.insert(self._released_at_front, msg["content"])
+            self._released_at_front += 1
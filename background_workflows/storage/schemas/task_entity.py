@@ -1,7 +1,26 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence, Set
 from background_workflows.constants.app_constants import AppConstants
 
+# Attribute names (equal to the table field names) in storage column order (see TaskEntity.from_row).
+_ROW_ATTRIBUTES: tuple = (
+    AppConstants.TaskTableFields.PARTITION_KEY,
+    AppConstants.TaskTableFields.ROW_KEY,
+    AppConstants.TaskTableFields.TASK_TYPE,
+    AppConstants.TaskTableFields.STATUS,
+    AppConstants.TaskTableFields.INPUT_PAYLOAD,
+    AppConstants.TaskTableFields.OUTPUT_PAYLOAD,
+    AppConstants.TaskTableFields.START_TIME,
+    AppConstants.TaskTableFields.END_TIME,
+    AppConstants.TaskTableFields.BATCH_ID,
+    AppConstants.TaskTableFields.ERROR_MESSAGE,
+    AppConstants.TaskTableFields.CONTAINER_NAME,
+    AppConstants.TaskTableFields.BLOB_NAME,
+)
+# Fields whose changes are tracked; the keys identify the entity and are always written.
+_TRACKED_FIELDS: FrozenSet[str] = frozenset(_ROW_ATTRIBUTES[2:])
+
+
 class TaskEntity:
     """
     Represents a row in the 'active' and 'finished' storage tables.
@@ -9,6 +28,13 @@ class TaskEntity:
     - PartitionKey corresponds to ResourceId.
     - RowKey is the unique identifier for the task.
     - Additional fields include task type, status, payloads, timestamps, and error details.
+
+    Assignments that change a non-key field are recorded in `dirty_fields`, so stores can
+    send only what changed (`to_partial_dict()`). A new entity starts with every field dirty;
+    entities loaded from storage (`from_row`, `from_dict`) start clean.
+
+    A field can also be deferred (`defer_field()`): its value is produced by a loader on first
+    access, e.g. a payload kept in blob storage (see PayloadOffloader).
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -19,6 +45,7 @@ class TaskEntity:
 
         :param kwargs: Dictionary containing task fields.
         """
+        self._dirty_fields: Set[str] = set()
         self.PartitionKey: Optional[str] = kwargs.get(AppConstants.TaskTableFields.PARTITION_KEY)
         self.RowKey: Optional[str] = kwargs.get(AppConstants.TaskTableFields.ROW_KEY)
         # ResourceId is derived from PartitionKey.
@@ -40,6 +67,140 @@ class TaskEntity:
         self.BlobName: Optional[str] = kwargs.get(AppConstants.TaskTableFields.BLOB_NAME, None)
 
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any], offset: int = 0) -> "TaskEntity":
+        """
+        Build a TaskEntity directly from a storage row, skipping the keyword-argument lookups
+        of __init__ (used on hot read paths).
+
+        The row holds the task columns in storage order, starting at `offset`: resource_id,
+        row_key, task_type, status, input_payload, output_payload, start_time, end_time,
+        batch_id, error_message, container_name, blob_name.
+
+        :param row: The column values (e.g., a sqlite3 result row).
+        :param offset: Index of the resource_id column within the row.
+        :return: The TaskEntity.
+        """
+        entity = cls.__new__(cls)
+        # Fill __dict__ directly: bypasses change tracking, so the entity starts clean.
+        values: Dict[str, Any] = entity.__dict__
+        values.update(zip(_ROW_ATTRIBUTES, row[offset:offset + 12]))
+        values["ResourceId"] = values["PartitionKey"]
+        values["_dirty_fields"] = set()
+        return entity
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskEntity":
+        """
+        Build a TaskEntity from an entity read from storage (e.g., an Azure Table entity).
+        The result has no dirty fields.
+
+        :param data: Field values keyed by AppConstants.TaskTableFields names.
+        :return: The TaskEntity.
+        """
+        entity = cls(**data)
+        entity.mark_clean()
+        return entity
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute and records tracked fields whose value changes.
+
+        :param name: Attribute name.
+        :param value: New value.
+        """
+        if name in _TRACKED_FIELDS:
+            values: Dict[str, Any] = self.__dict__
+            if name not in values or values[name] != value:
+                values["_dirty_fields"].add(name)
+                # The new value no longer comes from the deferred source.
+                loaders: Optional[Dict[str, Callable[[], Any]]] = values.get("_field_loaders")
+                if loaders:
+                    loaders.pop(name, None)
+        object.__setattr__(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Loads a deferred field on first access. Only called for attributes that are not set.
+
+        :param name: Attribute name.
+        :return: The loaded value.
+        :raises AttributeError: If the attribute is neither set nor deferred.
+        """
+        loaders: Optional[Dict[str, Callable[[], Any]]] = self.__dict__.get("_field_loaders")
+        if loaders and name in loaders:
+            value: Any = loaders[name]()
+            # Stored directly: loading does not make the field dirty.
+            self.__dict__[name] = value
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def defer_field(self, name: str, loader: Callable[[], Any]) -> None:
+        """
+        Replaces the value of a field with a loader that is called on first access. The field
+        is not marked dirty, and the loader stays attached (see `field_loader()`) until the
+        field is assigned a different value.
+
+        :param name: Field name (one of AppConstants.TaskTableFields).
+        :param loader: Returns the field value.
+        """
+        values: Dict[str, Any] = self.__dict__
+        values.pop(name, None)
+        values.setdefault("_field_loaders", {})[name] = loader
+
+    def field_loader(self, name: str) -> Optional[Callable[[], Any]]:
+        """
+        :param name: Field name.
+        :return: The loader the field's current value comes from, or None if the field is not deferred.
+        """
+        loaders: Optional[Dict[str, Callable[[], Any]]] = self.__dict__.get("_field_loaders")
+        return loaders.get(name) if loaders else None
+
+    def copy_with(self, values: Dict[str, Any]) -> "TaskEntity":
+        """
+        Returns a copy of this entity with some fields replaced, without marking them dirty
+        (e.g., payloads replaced by blob references before a write). The copy has its own
+        dirty-field set, initially equal to this entity's.
+
+        :param values: Replacement values keyed by field name.
+        :return: The copy.
+        """
+        entity = TaskEntity.__new__(TaskEntity)
+        copied: Dict[str, Any] = entity.__dict__
+        copied.update(self.__dict__)
+        copied["_dirty_fields"] = set(self._dirty_fields)
+        if "_field_loaders" in copied:
+            copied["_field_loaders"] = dict(copied["_field_loaders"])
+        copied.update(values)
+        return entity
+
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """
+        :return: Names of the fields changed since the entity was loaded or last marked clean.
+        """
+        return frozenset(self._dirty_fields)
+
+    def mark_clean(self) -> None:
+        """
+        Forget pending changes, e.g. after the entity has been written to storage.
+        """
+        self._dirty_fields.clear()
+
+    def to_partial_dict(self) -> Dict[str, Any]:
+        """
+        Like `to_dict()`, but with only the keys and the dirty fields, for merge-mode updates.
+
+        :return: A dictionary with PartitionKey, RowKey and every changed field.
+        """
+        partial: Dict[str, Any] = {
+            AppConstants.TaskTableFields.PARTITION_KEY: self.ResourceId,
+            AppConstants.TaskTableFields.ROW_KEY: self.RowKey,
+        }
+        for name in self._dirty_fields:
+            partial[name] = getattr(self, name)
+        return partial
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert this TaskEntity to a dictionary suitable for storage upsert operations.
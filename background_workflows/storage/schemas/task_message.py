@@ -3,6 +3,7 @@
 import json
 from typing import Any, Dict, Optional, Union
 from background_workflows.constants.app_constants import AppConstants
+from background_workflows.utils.payload_codec import PayloadCodecs
 
 
 class TaskMessage:
@@ -24,6 +25,8 @@ class TaskMessage:
       - active_table_name
       - finished_table_name
       - database_name
+
+    The JSON string may be compressed by PayloadCodecs; the codec is detected from its marker.
     """
 
     def __init__(self, azure_or_local_msg: Union[ Dict[ str, Any ], Any ]) -> None:
@@ -39,7 +42,7 @@ class TaskMessage:
         else:
             raw_str = azure_or_local_msg.content
 
-        data: Dict[ str, Any ] = json.loads( raw_str )
+        data: Dict[ str, Any ] = json.loads( PayloadCodecs.decode( raw_str ) )
 
         # Core fields
         self.resource_id: Optional[ str ] = data.get( AppConstants.MessageKeys.RESOURCE_ID )
@@ -60,7 +63,8 @@ class TaskMessage:
         This method builds a dictionary mirroring the structure parsed during initialization,
         including both core and additional fields, and then serializes it to JSON.
 
-        :return: A JSON string representing the task message.
+        :return: A JSON string representing the task message, compressed by PayloadCodecs when
+                 a codec is configured and the message is long enough.
         """
         data: Dict[ str, Any ] = {
             AppConstants.MessageKeys.RESOURCE_ID: self.resource_id,
@@ -72,4 +76,4 @@ class TaskMessage:
             AppConstants.MessageKeys.FINISHED_TABLE_NAME: self.finished_table_name,
             AppConstants.MessageKeys.DATABASE_NAME: self.database_name,
         }
-        return json.dumps( data )
+        return PayloadCodecs.encode( json.dumps( data ) )
@@ -0,0 +1,42 @@
+# background_workflows/storage/schemas/task_page.py
+
+from typing import List, Optional
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class TaskPage:
+    """
+    One page of results from an ITaskStore query.
+
+    - items holds the tasks of this page, in the store's query order.
+    - continuation_token is an opaque string to pass back to the same query for the next
+      page, or None when there are no more results.
+    """
+
+    def __init__(self, items: List[TaskEntity], continuation_token: Optional[str] = None) -> None:
+        """
+        Initialize a TaskPage.
+
+        :param items: The tasks of this page.
+        :param continuation_token: Token for the next page, or None if this is the last page.
+        """
+        self.items: List[TaskEntity] = items
+        self.continuation_token: Optional[str] = continuation_token
+
+    @property
+    def has_more(self) -> bool:
+        """
+        :return: True if another page is available.
+        """
+        return self.continuation_token is not None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        """
+        Return a debug string representation of the TaskPage.
+
+        :return: A string including the number of items and whether more pages exist.
+        """
+        return f"<TaskPage items={len(self.items)}, has_more={self.has_more}>"
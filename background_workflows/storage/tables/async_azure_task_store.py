@@ -0,0 +1,161 @@
+# background_workflows/storage/tables/async_azure_task_store.py
+
+import asyncio
+from typing import Any, Dict, Optional
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables import UpdateMode
+from azure.data.tables.aio import TableServiceClient as AsyncTableServiceClient
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.azure_task_store import AzureTaskStore
+from background_workflows.storage.tables.i_async_task_store import IAsyncTaskStore
+
+
+class AsyncAzureTaskStore( AzureTaskStore, IAsyncTaskStore ):
+    """
+    An Azure Table Storage task store with native asyncio support.
+
+    The synchronous ITaskStore methods are inherited from AzureTaskStore; the coroutine
+    methods use `azure.data.tables.aio`, so table round-trips are awaited on the event loop
+    instead of blocking it. The async clients are created lazily on first use and must be
+    closed with `close_async()`.
+    """
+
+    def __init__(
+            self,
+            connection_string: str,
+            active_table_name: str = AppConstants.TaskStoreFactory.get_active_table_name(),
+            finished_table_name: str = AppConstants.TaskStoreFactory.get_finished_table_name(),
+    ) -> None:
+        """
+        Initialize the AsyncAzureTaskStore.
+
+        :param connection_string: Azure Storage connection string.
+        :param active_table_name: Name of the table for active tasks.
+        :param finished_table_name: Name of the table for finished tasks.
+        """
+        super().__init__( connection_string, active_table_name, finished_table_name )
+        self.async_table_service_client: Any = None
+        self.async_active_client: Any = None
+        self.async_finished_client: Any = None
+
+    def _ensure_async_clients(self) -> None:
+        """
+        Creates the async table clients on first use.
+        """
+        if self.async_table_service_client is None:
+            self.async_table_service_client = AsyncTableServiceClient.from_connection_string( self.connection_string )
+            self.async_active_client = self.async_table_service_client.get_table_client( self.active_table_name )
+            self.async_finished_client = self.async_table_service_client.get_table_client( self.finished_table_name )
+
+    async def get_task_async(
+            self, resource_id: str, row_key: str, location: Optional[ str ] = None
+    ) -> Optional[ TaskEntity ]:
+        """
+        Retrieves a task from the active table or, if not found there, from the finished table.
+        Without a location hint, both point reads are awaited concurrently.
+
+        :param resource_id: The partition key for the task.
+        :param row_key: The row key (unique identifier) for the task.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: A TaskEntity instance if found, or None otherwise.
+        """
+        self._ensure_async_clients()
+        if location is not None:
+            client: Any = self._async_client_for( location )
+            entity_data = await self._get_entity_async( client, resource_id, row_key )
+        else:
+            active_data, finished_data = await asyncio.gather(
+                self._get_entity_async( self.async_active_client, resource_id, row_key ),
+                self._get_entity_async( self.async_finished_client, resource_id, row_key ),
+            )
+            entity_data = active_data if active_data is not None else finished_data
+        return TaskEntity.from_dict( entity_data ) if entity_data is not None else None
+
+    @staticmethod
+    async def _get_entity_async(client: Any, resource_id: str, row_key: str) -> Optional[ Dict[ str, Any ] ]:
+        """
+        Awaits one entity read, mapping "not found" to None.
+
+        :param client: The table client to read from.
+        :param resource_id: The partition key for the task.
+        :param row_key: The row key for the task.
+        :return: The entity with the given keys, or None if the table does not contain it.
+        """
+        try:
+            return await client.get_entity( partition_key = resource_id, row_key = row_key )
+        except ResourceNotFoundError:
+            return None
+
+    def _async_client_for(self, location: str) -> Any:
+        """
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :return: The async table client holding that location.
+        :raises ValueError: If location is not recognized.
+        """
+        if location == AppConstants.TaskLocations.ACTIVE:
+            return self.async_active_client
+        if location == AppConstants.TaskLocations.FINISHED:
+            return self.async_finished_client
+        raise ValueError( f"Unknown task location: {location}" )
+
+    async def upsert_task_async(self, entity: TaskEntity) -> None:
+        """
+        Inserts or updates the provided task entity in the active table, sending only its dirty
+        fields with UpdateMode.MERGE. An entity without changes is not written.
+
+        :param entity: The TaskEntity to upsert.
+        """
+        if not entity.dirty_fields:
+            return
+        self._ensure_async_clients()
+        await self.async_active_client.upsert_entity( entity.to_partial_dict(), mode = UpdateMode.MERGE )
+        entity.mark_clean()
+
+    async def delete_task_async(self, resource_id: str, row_key: str) -> None:
+        """
+        Deletes the task from the active table.
+
+        :param resource_id: The partition key of the task.
+        :param row_key: The row key of the task.
+        """
+        self._ensure_async_clients()
+        await self.async_active_client.delete_entity( partition_key = resource_id, row_key = row_key )
+
+    async def move_to_finished_async(self, entity: TaskEntity) -> None:
+        """
+        Moves a task entity to the finished table by upserting it there.
+
+        :param entity: The TaskEntity to move.
+        """
+        self._ensure_async_clients()
+        await self.async_finished_client.upsert_entity( entity.to_dict() )
+
+    async def complete_task_async(self, entity: TaskEntity) -> None:
+        """
+        Moves a COMPLETED task to the finished table, then deletes it from the active table.
+        Azure Tables cannot span two tables in one transaction, so the finished row is written first.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        await self.move_to_finished_async( entity )
+        await self.delete_task_async( entity.ResourceId, entity.RowKey )
+
+    async def fail_task_async(self, entity: TaskEntity) -> None:
+        """
+        Moves a failed task to the finished table, then deletes it from the active table.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        await self.complete_task_async( entity )
+
+    async def close_async(self) -> None:
+        """
+        Closes the async table clients and their HTTP sessions.
+        """
+        if self.async_table_service_client is not None:
+            await asyncio.gather( self.async_active_client.close(), self.async_finished_client.close() )
+            await self.async_table_service_client.close()
+            self.async_table_service_client = None
+            self.async_active_client = None
+            self.async_finished_client = None
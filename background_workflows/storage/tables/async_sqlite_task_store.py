@@ -0,0 +1,124 @@
+# background_workflows/storage/tables/async_sqlite_task_store.py
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.i_async_task_store import IAsyncTaskStore
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+
+
+class AsyncSqliteTaskStore(SqliteTaskStore, IAsyncTaskStore):
+    """
+    SQLite task store with asyncio support.
+
+    SQLite has no non-blocking I/O, so the coroutine methods run the synchronous queries on a
+    single dedicated thread owned by the store (the same model as aiosqlite). The event loop
+    never blocks on disk I/O, statements are serialized on one connection, and the default
+    executor is left free for other work. The synchronous ITaskStore methods remain available
+    and share the same connection, so in-memory databases work for both.
+    """
+
+    def __init__(
+        self,
+        db_path: str = AppConstants.TaskStoreFactory.get_sqlite_db_path(),
+        active_table_name: str = AppConstants.TaskStoreFactory.get_active_table_name(),
+        finished_table_name: str = AppConstants.TaskStoreFactory.get_finished_table_name(),
+        connection_mode: str = AppConstants.SqliteTaskStore.DEFAULT_CONNECTION_MODE,
+    ) -> None:
+        """
+        Initialize the async SQLite task store.
+
+        :param db_path: Path to the SQLite database file (use ":memory:" for tests).
+        :param active_table_name: Name of the table that stores active tasks.
+        :param finished_table_name: Name of the table that stores finished tasks.
+        :param connection_mode: "shared" or "per_thread" (see SqliteTaskStore).
+        """
+        super().__init__(db_path, active_table_name, finished_table_name, connection_mode=connection_mode)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=AppConstants.AsyncSqliteTaskStore.THREAD_NAME_PREFIX
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a synchronous store method on the store's dedicated thread.
+
+        :param func: The bound method to call.
+        :param args: Positional arguments for func.
+        :return: The method's return value.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args))
+
+    async def get_task_async(
+        self, resource_id: str, row_key: str, location: Optional[str] = None
+    ) -> Optional[TaskEntity]:
+        """
+        Retrieves a task from the active table or, if not found, from the finished table.
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: A TaskEntity instance if found; otherwise, None.
+        """
+        return await self._run(self.get_task, resource_id, row_key, location)
+
+    async def upsert_task_async(self, entity: TaskEntity) -> bool:
+        """
+        Inserts or updates the given task entity in the active table.
+
+        :param entity: The TaskEntity instance to upsert.
+        :return: True if the upsert is successful, False otherwise.
+        """
+        return await self._run(self.upsert_task, entity)
+
+    async def delete_task_async(self, resource_id: str, row_key: str) -> None:
+        """
+        Deletes a task from the active table.
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        """
+        await self._run(self.delete_task, resource_id, row_key)
+
+    async def move_to_finished_async(self, entity: TaskEntity) -> None:
+        """
+        Inserts the given task entity into the finished table.
+
+        :param entity: The TaskEntity instance to move.
+        """
+        await self._run(self.move_to_finished, entity)
+
+    async def complete_task_async(self, entity: TaskEntity) -> None:
+        """
+        Moves a COMPLETED task to the finished table and deletes it from the active table
+        in one transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        await self._run(self.complete_task, entity)
+
+    async def fail_task_async(self, entity: TaskEntity) -> None:
+        """
+        Moves a failed task to the finished table and deletes it from the active table
+        in one transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        await self._run(self.fail_task, entity)
+
+    async def close_async(self) -> None:
+        """
+        Closes the SQLite connection on the store's thread and stops that thread.
+        """
+        await self._run(super().close)
+        self._executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """
+        Closes the SQLite database connection and stops the store's thread.
+        """
+        self._executor.shutdown(wait=True)
+        super().close()
@@ -1,10 +1,16 @@
 # background_workflows/storage/tables/azure_task_store.py
 
-from typing import Optional
-from azure.data.tables import TableServiceClient
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from azure.data.tables import TableClient, TableServiceClient, TableTransactionError, UpdateMode
 from azure.core.exceptions import ResourceNotFoundError
 from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.azure_client_registry import AzureClientRegistry
 from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_page import TaskPage
 from background_workflows.storage.tables.i_task_storage import ITaskStore
 
 
@@ -14,6 +20,14 @@ class AzureTaskStore( ITaskStore ):
 
     This class handles the creation of the active and finished tables, and provides
     methods for retrieving, upserting, deleting, and moving TaskEntity objects.
+
+    Active-table updates are partial: only the entity's dirty fields (see TaskEntity.dirty_fields)
+    are sent, with UpdateMode.MERGE, so a status change does not resend the payloads.
+
+    Multi-entity writes (`upsert_tasks`, `finish_tasks`) are sent as entity group transactions:
+    one request per partition and table, for up to MAX_TRANSACTION_OPERATIONS entities. A
+    transaction cannot span tables, so moving a single task from the active to the finished
+    table remains two requests.
     """
 
     def __init__(
@@ -33,11 +47,14 @@ class AzureTaskStore( ITaskStore ):
         self.active_table_name: str = active_table_name
         self.finished_table_name: str = finished_table_name
 
-        self.table_service_client: TableServiceClient = TableServiceClient.from_connection_string(
+        # Shared with every other store of the same account in this process (one pooled transport).
+        self.table_service_client: TableServiceClient = AzureClientRegistry.shared().table_service_client(
             self.connection_string
         )
         self.active_client = None
         self.finished_client = None
+        self._read_executor: Optional[ ThreadPoolExecutor ] = None
+        self._read_executor_lock: threading.Lock = threading.Lock()
 
     def create_if_not_exists(self) -> None:
         """
@@ -51,33 +68,214 @@ class AzureTaskStore( ITaskStore ):
         self.active_client = self.table_service_client.get_table_client( self.active_table_name )
         self.finished_client = self.table_service_client.get_table_client( self.finished_table_name )
 
-    def get_task(self, resource_id: str, row_key: str) -> Optional[ TaskEntity ]:
+    def get_task(
+            self, resource_id: str, row_key: str, location: Optional[ str ] = None
+    ) -> Optional[ TaskEntity ]:
         """
-        Retrieves a task from the active table. If the task is not found in the active table,
-        it attempts to retrieve it from the finished table.
+        Retrieves a task from the active table or, if not found there, from the finished table.
+        Without a location hint, both point reads are issued in parallel, so a finished task
+        costs one round trip of latency instead of two.
 
         :param resource_id: The partition key for the task.
         :param row_key: The row key (unique identifier) for the task.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
         :return: A TaskEntity instance if found, or None otherwise.
         """
+        if location is not None:
+            entity_data = self._get_entity( self._client_for( location ), resource_id, row_key )
+            return TaskEntity.from_dict( entity_data ) if entity_data is not None else None
+
+        executor: ThreadPoolExecutor = self._get_read_executor()
+        active_future = executor.submit( self._get_entity, self.active_client, resource_id, row_key )
+        finished_future = executor.submit( self._get_entity, self.finished_client, resource_id, row_key )
+        entity_data = active_future.result()
+        if entity_data is None:
+            entity_data = finished_future.result()
+        return TaskEntity.from_dict( entity_data ) if entity_data is not None else None
+
+    def get_tasks(
+            self, keys: Iterable[ Tuple[ str, str ] ], location: Optional[ str ] = None
+    ) -> Dict[ Tuple[ str, str ], TaskEntity ]:
+        """
+        Fetches many tasks with parallel point reads (one per key and table) on the store's
+        read pool. The active entity wins if a task is present in both tables.
+
+        :param keys: (resource_id, row_key) pairs; duplicates are fetched once.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: The tasks found, keyed by (resource_id, row_key). Missing keys are omitted.
+        """
+        clients: List[ TableClient ] = (
+            [ self._client_for( location ) ] if location is not None else [ self.active_client, self.finished_client ]
+        )
+        executor: ThreadPoolExecutor = self._get_read_executor()
+        futures = {
+            key: [ executor.submit( self._get_entity, client, key[ 0 ], key[ 1 ] ) for client in clients ]
+            for key in dict.fromkeys( keys )
+        }
+        found: Dict[ Tuple[ str, str ], TaskEntity ] = { }
+        for key, key_futures in futures.items():
+            for future in key_futures:
+                entity_data = future.result()
+                if entity_data is not None:
+                    found[ key ] = TaskEntity.from_dict( entity_data )
+                    break
+        return found
+
+    @staticmethod
+    def _get_entity(client: TableClient, resource_id: str, row_key: str) -> Optional[ Dict[ str, Any ] ]:
+        """
+        Reads one entity, mapping "not found" to None.
+
+        :param client: The table client to read from.
+        :param resource_id: The partition key for the task.
+        :param row_key: The row key for the task.
+        :return: The entity with the given keys, or None if the table does not contain it.
+        """
         try:
-            entity_data = self.active_client.get_entity( partition_key = resource_id, row_key = row_key )
-            return TaskEntity( **entity_data )
+            return client.get_entity( partition_key = resource_id, row_key = row_key )
         except ResourceNotFoundError:
-            try:
-                entity_data = self.finished_client.get_entity( partition_key = resource_id, row_key = row_key )
-                return TaskEntity( **entity_data )
-            except ResourceNotFoundError:
-                return None
+            return None
+
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool used for parallel point reads, creating it on first use.
+
+        :return: The ThreadPoolExecutor.
+        """
+        if self._read_executor is None:
+            with self._read_executor_lock:
+                if self._read_executor is None:
+                    self._read_executor = ThreadPoolExecutor(
+                        max_workers = AppConstants.AzureTaskStore.READ_MAX_WORKERS,
+                        thread_name_prefix = AppConstants.AzureTaskStore.READ_THREAD_NAME_PREFIX,
+                    )
+        return self._read_executor
 
     def upsert_task(self, entity: TaskEntity) -> None:
         """
-        Inserts or updates the provided task entity in the active table.
+        Inserts or updates the provided task entity in the active table, sending only its dirty
+        fields with UpdateMode.MERGE. An entity without changes is not written.
 
         :param entity: The TaskEntity to upsert.
         """
-        data = entity.to_dict()
-        self.active_client.upsert_entity( data )
+        if not entity.dirty_fields:
+            return
+        self.active_client.upsert_entity( entity.to_partial_dict(), mode = UpdateMode.MERGE )
+        entity.mark_clean()
+
+    def upsert_tasks(self, entities: Iterable[ TaskEntity ]) -> None:
+        """
+        Upserts many entities into the active table with one transaction per partition (split
+        at MAX_TRANSACTION_OPERATIONS entities or MAX_TRANSACTION_BYTES). As in `upsert_task()`,
+        only dirty fields are sent, with UpdateMode.MERGE. Repeated updates of the same task
+        (e.g., RUNNING then COMPLETED) are merged into a single write of its last state.
+
+        :param entities: The TaskEntity objects to upsert.
+        :raises TableTransactionError: If the service rejects a transaction.
+        """
+        entities = [ entity for entity in entities if entity.dirty_fields ]
+        latest: Dict[ Tuple[ str, str ], Dict[ str, Any ] ] = self._latest_by_key( entities, partial = True )
+        self._submit_by_partition(
+            self.active_client, [ ( "upsert", data, { "mode": UpdateMode.MERGE } ) for data in latest.values() ]
+        )
+        for entity in entities:
+            entity.mark_clean()
+
+    def finish_tasks(self, entities: Iterable[ TaskEntity ]) -> None:
+        """
+        Records the final state of many tasks: the finished entities are upserted with one
+        transaction per partition, then the active entities are deleted the same way. As in
+        `complete_task()`, the finished rows are written first, so a failure in between leaves
+        tasks visible rather than lost.
+
+        :param entities: The TaskEntity objects in their final state.
+        :raises TableTransactionError: If the service rejects an upsert transaction.
+        """
+        latest: Dict[ Tuple[ str, str ], Dict[ str, Any ] ] = self._latest_by_key( entities )
+        self._submit_by_partition( self.finished_client, [ ( "upsert", data ) for data in latest.values() ] )
+        deletes = [
+            ( "delete", { AppConstants.TaskTableFields.PARTITION_KEY: rid, AppConstants.TaskTableFields.ROW_KEY: rk } )
+            for rid, rk in latest
+        ]
+        self._submit_by_partition( self.active_client, deletes )
+
+    @staticmethod
+    def _latest_by_key(
+            entities: Iterable[ TaskEntity ], partial: bool = False
+    ) -> Dict[ Tuple[ str, str ], Dict[ str, Any ] ]:
+        """
+        Converts entities to table rows, with one row per (PartitionKey, RowKey): a transaction
+        may not touch the same entity twice.
+
+        :param entities: The TaskEntity objects.
+        :param partial: If True, rows hold only dirty fields and later changes are merged into
+                        earlier ones; otherwise the last full row of each key wins.
+        :return: The rows keyed by (PartitionKey, RowKey), in first-seen order.
+        """
+        latest: Dict[ Tuple[ str, str ], Dict[ str, Any ] ] = { }
+        for entity in entities:
+            key: Tuple[ str, str ] = ( entity.ResourceId, entity.RowKey )
+            if partial:
+                latest.setdefault( key, { } ).update( entity.to_partial_dict() )
+            else:
+                latest[ key ] = entity.to_dict()
+        return latest
+
+    @staticmethod
+    def _transaction_chunks(
+            operations: List[ Tuple[ Any, ... ] ]
+    ) -> List[ List[ Tuple[ Any, ... ] ] ]:
+        """
+        Groups operations by PartitionKey and splits each group so that no transaction exceeds
+        MAX_TRANSACTION_OPERATIONS operations or (approximately) MAX_TRANSACTION_BYTES.
+
+        :param operations: (operation name, entity[, options]) tuples, in any partition order.
+        :return: The transactions to submit; each holds a single partition.
+        """
+        by_partition: Dict[ str, List[ Tuple[ Any, ... ] ] ] = { }
+        for operation in operations:
+            partition_key: str = operation[ 1 ][ AppConstants.TaskTableFields.PARTITION_KEY ]
+            by_partition.setdefault( partition_key, [ ] ).append( operation )
+
+        max_operations: int = AppConstants.AzureTaskStore.MAX_TRANSACTION_OPERATIONS
+        max_bytes: int = AppConstants.AzureTaskStore.MAX_TRANSACTION_BYTES
+        chunks: List[ List[ Tuple[ Any, ... ] ] ] = [ ]
+        for partition_operations in by_partition.values():
+            chunk: List[ Tuple[ Any, ... ] ] = [ ]
+            chunk_bytes: int = 0
+            for operation in partition_operations:
+                size: int = len( json.dumps( operation[ 1 ], default = str ) )
+                if chunk and ( len( chunk ) == max_operations or chunk_bytes + size > max_bytes ):
+                    chunks.append( chunk )
+                    chunk, chunk_bytes = [ ], 0
+                chunk.append( operation )
+                chunk_bytes += size
+            if chunk:
+                chunks.append( chunk )
+        return chunks
+
+    def _submit_by_partition(self, client: TableClient, operations: List[ Tuple[ Any, ... ] ]) -> None:
+        """
+        Submits the operations as entity group transactions (see `_transaction_chunks`).
+
+        A delete transaction fails as a whole if one entity is already gone (e.g., a redelivered
+        message); its deletes are then retried one by one, which ignores missing entities.
+
+        :param client: The table client to write to.
+        :param operations: (operation name, entity[, options]) tuples.
+        :raises TableTransactionError: If the service rejects an upsert transaction.
+        """
+        for chunk in self._transaction_chunks( operations ):
+            try:
+                client.submit_transaction( chunk )
+            except TableTransactionError:
+                if any( operation[ 0 ] != "delete" for operation in chunk ):
+                    raise
+                for _, data in chunk:
+                    client.delete_entity(
+                        partition_key = data[ AppConstants.TaskTableFields.PARTITION_KEY ],
+                        row_key = data[ AppConstants.TaskTableFields.ROW_KEY ],
+                    )
 
     def delete_task(self, resource_id: str, row_key: str) -> None:
         """
@@ -96,3 +294,130 @@ class AzureTaskStore( ITaskStore ):
         """
         data = entity.to_dict()
         self.finished_client.upsert_entity( data )
+
+    def query_tasks_by_status(
+            self,
+            status: str,
+            location: str = AppConstants.TaskLocations.ACTIVE,
+            page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+            continuation_token: Optional[ str ] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks with the given status.
+
+        :param status: The status to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(
+            location, f"{AppConstants.TaskTableFields.STATUS} eq @value", { "value": status },
+            page_size, continuation_token,
+        )
+
+    def query_tasks_by_type(
+            self,
+            task_type: str,
+            location: str = AppConstants.TaskLocations.ACTIVE,
+            page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+            continuation_token: Optional[ str ] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks of the given type.
+
+        :param task_type: The task type to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(
+            location, f"{AppConstants.TaskTableFields.TASK_TYPE} eq @value", { "value": task_type },
+            page_size, continuation_token,
+        )
+
+    def query_tasks_by_end_time(
+            self,
+            start: datetime,
+            end: datetime,
+            location: str = AppConstants.TaskLocations.FINISHED,
+            page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+            continuation_token: Optional[ str ] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks whose EndTime falls in [start, end). Table Storage returns
+        results in (PartitionKey, RowKey) order, not by EndTime.
+
+        :param start: Inclusive lower bound (naive datetimes are treated as UTC).
+        :param end: Exclusive upper bound (naive datetimes are treated as UTC).
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        field: str = AppConstants.TaskTableFields.END_TIME
+        return self._query_page(
+            location,
+            f"{field} ge @start and {field} lt @end",
+            { "start": self._as_utc( start ), "end": self._as_utc( end ) },
+            page_size,
+            continuation_token,
+        )
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """
+        :param value: A naive (UTC) or timezone-aware datetime.
+        :return: The same instant as a timezone-aware UTC datetime.
+        """
+        return value.replace( tzinfo = timezone.utc ) if value.tzinfo is None else value.astimezone( timezone.utc )
+
+    def _client_for(self, location: str) -> TableClient:
+        """
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :return: The table client holding that location.
+        :raises ValueError: If location is not recognized.
+        """
+        if location == AppConstants.TaskLocations.ACTIVE:
+            return self.active_client
+        if location == AppConstants.TaskLocations.FINISHED:
+            return self.finished_client
+        raise ValueError( f"Unknown task location: {location}" )
+
+    def _query_page(
+            self,
+            location: str,
+            query_filter: str,
+            parameters: Dict[ str, Any ],
+            page_size: int,
+            continuation_token: Optional[ str ],
+    ) -> TaskPage:
+        """
+        Runs a filtered query and returns a single page. The service's continuation token
+        (a dict of next partition/row keys) is serialized to JSON for the caller.
+
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param query_filter: OData filter with @-parameters.
+        :param parameters: Values for the filter parameters.
+        :param page_size: Maximum number of entities to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        :raises ValueError: If location or page_size is invalid.
+        """
+        if not 1 <= page_size <= AppConstants.TaskQueries.MAX_PAGE_SIZE:
+            raise ValueError( f"page_size must be between 1 and {AppConstants.TaskQueries.MAX_PAGE_SIZE}." )
+        pages = self._client_for( location ).query_entities(
+            query_filter, parameters = parameters, results_per_page = page_size
+        ).by_page( continuation_token = json.loads( continuation_token ) if continuation_token else None )
+        items = [ TaskEntity.from_dict( entity_data ) for entity_data in next( pages, [ ] ) ]
+        next_token = pages.continuation_token
+        return TaskPage( items, json.dumps( next_token ) if next_token else None )
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool used for parallel point reads.
+        """
+        if self._read_executor is not None:
+            self._read_executor.shutdown( wait = True )
+            self._read_executor = None
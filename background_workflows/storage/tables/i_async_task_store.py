@@ -0,0 +1,83 @@
+# background_workflows/storage/tables/i_async_task_store.py
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from background_workflows.storage.schemas.task_entity import TaskEntity
+
+
+class IAsyncTaskStore(ABC):
+    """
+    Interface for native asyncio access to the 'active' and 'finished' task areas.
+
+    The coroutine methods carry an `_async` suffix so that a store can implement both
+    ITaskStore and IAsyncTaskStore on the same instance, e.g., a WorkflowClient writes
+    synchronously while async tasks update the same store without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def get_task_async(
+        self, resource_id: str, row_key: str, location: Optional[str] = None
+    ) -> Optional[TaskEntity]:
+        """
+        Fetch a single task from the active store (or, if not found, the finished store).
+
+        :param resource_id: The partition key associated with the task.
+        :param row_key: The unique row identifier for the task.
+        :param location: Optional hint (AppConstants.TaskLocations.ACTIVE or FINISHED); only that
+                         location is probed.
+        :return: A TaskEntity if the task is found; otherwise, None.
+        """
+        raise NotImplementedError("get_task_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def upsert_task_async(self, entity: TaskEntity) -> None:
+        """
+        Insert or update a task in the active store.
+
+        :param entity: The TaskEntity to insert or update.
+        """
+        raise NotImplementedError("upsert_task_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def delete_task_async(self, resource_id: str, row_key: str) -> None:
+        """
+        Remove the task from the active store.
+
+        :param resource_id: The partition key of the task.
+        :param row_key: The unique identifier of the task.
+        """
+        raise NotImplementedError("delete_task_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def move_to_finished_async(self, entity: TaskEntity) -> None:
+        """
+        Insert the task entity into the finished store for historical record.
+
+        :param entity: The TaskEntity to move to the finished store.
+        """
+        raise NotImplementedError("move_to_finished_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def complete_task_async(self, entity: TaskEntity) -> None:
+        """
+        Record a COMPLETED task in the finished store and remove it from the active store.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        raise NotImplementedError("complete_task_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def fail_task_async(self, entity: TaskEntity) -> None:
+        """
+        Record a failed (ERROR) task in the finished store and remove it from the active store.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        raise NotImplementedError("fail_task_async() must be implemented by subclasses.")
+
+    @abstractmethod
+    async def close_async(self) -> None:
+        """
+        Release any connections held by the async client.
+        """
+        raise NotImplementedError("close_async() must be implemented by subclasses.")
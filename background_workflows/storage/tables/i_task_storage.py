@@ -1,8 +1,11 @@
 # background_workflows/storage/tables/i_task_store.py
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from background_workflows.constants.app_constants import AppConstants
 from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_page import TaskPage
 
 
 class ITaskStore(ABC):
@@ -21,16 +24,40 @@ class ITaskStore(ABC):
         raise NotImplementedError("create_if_not_exists() must be implemented by subclasses.")
 
     @abstractmethod
-    def get_task(self, resource_id: str, row_key: str) -> Optional[TaskEntity]:
+    def get_task(self, resource_id: str, row_key: str, location: Optional[str] = None) -> Optional[TaskEntity]:
         """
-        Fetch a single task from the active store.
+        Fetch a single task from the active store or, if not found there, the finished store,
+        in as few round trips as the backend allows.
 
         :param resource_id: The partition key associated with the task.
         :param row_key: The unique row identifier for the task.
+        :param location: Optional hint (AppConstants.TaskLocations.ACTIVE or FINISHED) for callers
+                         that know where the task is; only that location is probed.
         :return: A TaskEntity if the task is found; otherwise, None.
         """
         raise NotImplementedError("get_task() must be implemented by subclasses.")
 
+    def get_tasks(
+        self, keys: Iterable[Tuple[str, str]], location: Optional[str] = None
+    ) -> Dict[Tuple[str, str], TaskEntity]:
+        """
+        Fetch many tasks in one call.
+
+        The default implementation calls `get_task()` once per key; stores override it with a
+        batched lookup.
+
+        :param keys: (resource_id, row_key) pairs; duplicates are fetched once.
+        :param location: Optional hint (AppConstants.TaskLocations.ACTIVE or FINISHED); only that
+                         location is probed.
+        :return: The tasks found, keyed by (resource_id, row_key). Missing keys are omitted.
+        """
+        found: Dict[Tuple[str, str], TaskEntity] = {}
+        for key in dict.fromkeys(keys):
+            entity: Optional[TaskEntity] = self.get_task(key[0], key[1], location)
+            if entity is not None:
+                found[key] = entity
+        return found
+
     @abstractmethod
     def upsert_task(self, entity: TaskEntity) -> None:
         """
@@ -40,6 +67,19 @@ class ITaskStore(ABC):
         """
         raise NotImplementedError("upsert_task() must be implemented by subclasses.")
 
+    def upsert_tasks(self, entities: Iterable[TaskEntity]) -> None:
+        """
+        Insert or update many tasks in the active store.
+
+        The default implementation calls `upsert_task()` once per entity; stores override it
+        to write the entities in as few transactions as the backend allows. If an entity
+        appears more than once, only its last state needs to be written.
+
+        :param entities: The TaskEntity objects to insert or update.
+        """
+        for entity in entities:
+            self.upsert_task(entity)
+
     @abstractmethod
     def delete_task(self, resource_id: str, row_key: str) -> None:
         """
@@ -58,3 +98,125 @@ class ITaskStore(ABC):
         :param entity: The TaskEntity to move to the finished store.
         """
         raise NotImplementedError("move_to_finished() must be implemented by subclasses.")
+
+    @abstractmethod
+    def query_tasks_by_status(
+        self,
+        status: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetch one page of tasks with the given status.
+
+        :param status: The status to match (see AppConstants.TaskStatus).
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        raise NotImplementedError("query_tasks_by_status() must be implemented by subclasses.")
+
+    @abstractmethod
+    def query_tasks_by_type(
+        self,
+        task_type: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetch one page of tasks of the given activity type.
+
+        :param task_type: The task type to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        raise NotImplementedError("query_tasks_by_type() must be implemented by subclasses.")
+
+    @abstractmethod
+    def query_tasks_by_end_time(
+        self,
+        start: datetime,
+        end: datetime,
+        location: str = AppConstants.TaskLocations.FINISHED,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetch one page of tasks whose EndTime falls in [start, end).
+
+        Naive datetimes are interpreted as UTC, matching the EndTime written by BaseTask.
+
+        :param start: Inclusive lower bound.
+        :param end: Exclusive upper bound.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        raise NotImplementedError("query_tasks_by_end_time() must be implemented by subclasses.")
+
+    def complete_task(self, entity: TaskEntity) -> None:
+        """
+        Record a COMPLETED task in the finished store and remove it from the active store.
+
+        The default implementation calls `move_to_finished()` then `delete_task()`; stores that
+        support it should override this to apply both writes in a single atomic transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self._finish_task(entity)
+
+    def fail_task(self, entity: TaskEntity) -> None:
+        """
+        Record a failed (ERROR) task in the finished store and remove it from the active store.
+
+        The default implementation calls `move_to_finished()` then `delete_task()`; stores that
+        support it should override this to apply both writes in a single atomic transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self._finish_task(entity)
+
+    def finish_tasks(self, entities: Iterable[TaskEntity]) -> None:
+        """
+        Record the final state (COMPLETED or ERROR) of many tasks in the finished store and
+        remove them from the active store.
+
+        The default implementation calls `fail_task()` for ERROR entities and `complete_task()`
+        for the others; stores override it to batch the writes.
+
+        :param entities: The TaskEntity objects in their final state.
+        """
+        for entity in entities:
+            if entity.Status == AppConstants.TaskStatus.ERROR:
+                self.fail_task(entity)
+            else:
+                self.complete_task(entity)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every write issued so far is durable.
+
+        Stores write synchronously by default, so this returns immediately; stores that buffer
+        writes (e.g., SqliteTaskStore in write-behind mode) override it.
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if all writes are durable, False if the timeout expired or a buffered write
+                 issued by the calling thread failed.
+        """
+        return True
+
+    def _finish_task(self, entity: TaskEntity) -> None:
+        """
+        Non-atomic fallback shared by `complete_task()` and `fail_task()`. The finished row is
+        written first, so a crash in between leaves the task visible rather than lost.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self.move_to_finished(entity)
+        self.delete_task(entity.ResourceId, entity.RowKey)
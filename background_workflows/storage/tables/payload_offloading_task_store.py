@@ -0,0 +1,234 @@
+# background_workflows/storage/tables/payload_offloading_task_store.py
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.payload_offloader import PayloadOffloader, PAYLOAD_FIELDS
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_page import TaskPage
+from background_workflows.storage.tables.i_task_storage import ITaskStore
+
+
+class PayloadOffloadingTaskStore(ITaskStore):
+    """
+    ITaskStore decorator that keeps large payloads out of the task rows of another store.
+
+    Every write goes through `PayloadOffloader.offload()`, so payloads longer than the
+    offloader's threshold are uploaded to blob storage and the inner store only receives their
+    references. Every entity read is passed to `PayloadOffloader.attach()`, so a payload blob is
+    downloaded only when InputPayload or OutputPayload is first accessed; listing or paging
+    tasks does not download any payload.
+
+    Completing a task moves the reference, not the blob, to the finished row. Blobs are deleted
+    when the task is deleted through this store (e.g., by the task creation saga's
+    compensation) and when finished rows are purged (SqliteTaskMaintenance with a
+    payload_offloader, or `PayloadOffloader.delete_payloads()` for other retention jobs).
+    """
+
+    def __init__(self, inner: ITaskStore, offloader: PayloadOffloader) -> None:
+        """
+        :param inner: The store that holds the task rows.
+        :param offloader: The PayloadOffloader that holds the large payloads.
+        """
+        self.inner: ITaskStore = inner
+        self.offloader: PayloadOffloader = offloader
+
+    def create_if_not_exists(self) -> None:
+        """
+        Creates the inner store's tables and the payload container.
+        """
+        self.inner.create_if_not_exists()
+        self.offloader.create_if_not_exists()
+
+    def get_task(self, resource_id: str, row_key: str, location: Optional[str] = None) -> Optional[TaskEntity]:
+        """
+        Retrieves a task from the inner store; its offloaded payloads load on first access.
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        :param location: Optional AppConstants.TaskLocations hint.
+        :return: A TaskEntity instance if found; otherwise, None.
+        """
+        entity: Optional[TaskEntity] = self.inner.get_task(resource_id, row_key, location)
+        return self.offloader.attach(entity) if entity is not None else None
+
+    def get_tasks(
+        self, keys: Iterable[Tuple[str, str]], location: Optional[str] = None
+    ) -> Dict[Tuple[str, str], TaskEntity]:
+        """
+        Retrieves many tasks with the inner store's batched lookup.
+
+        :param keys: (resource_id, row_key) pairs; duplicates are fetched once.
+        :param location: Optional AppConstants.TaskLocations hint.
+        :return: The tasks found, keyed by (resource_id, row_key). Missing keys are omitted.
+        """
+        found: Dict[Tuple[str, str], TaskEntity] = self.inner.get_tasks(keys, location)
+        for entity in found.values():
+            self.offloader.attach(entity)
+        return found
+
+    def upsert_task(self, entity: TaskEntity) -> Optional[bool]:
+        """
+        Offloads the entity's large payloads, then upserts it in the inner store.
+
+        :param entity: The TaskEntity instance to upsert.
+        :return: The inner store's result (SQLite stores report success as a bool).
+        """
+        stored: TaskEntity = self.offloader.offload(entity)
+        result: Optional[bool] = self.inner.upsert_task(stored)
+        self._sync_clean(entity, stored)
+        return result
+
+    def upsert_tasks(self, entities: Iterable[TaskEntity]) -> Optional[bool]:
+        """
+        Offloads the large payloads of every entity, then upserts them with the inner store's
+        batched write.
+
+        :param entities: The TaskEntity instances to upsert.
+        :return: The inner store's result (SQLite stores report success as a bool).
+        """
+        pairs: List[Tuple[TaskEntity, TaskEntity]] = [(entity, self.offloader.offload(entity)) for entity in entities]
+        result: Optional[bool] = self.inner.upsert_tasks([stored for _, stored in pairs])
+        for entity, stored in pairs:
+            self._sync_clean(entity, stored)
+        return result
+
+    def delete_task(self, resource_id: str, row_key: str) -> None:
+        """
+        Deletes an active task and then the blobs of its offloaded payloads.
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        """
+        entity: Optional[TaskEntity] = self.inner.get_task(resource_id, row_key, AppConstants.TaskLocations.ACTIVE)
+        self.inner.delete_task(resource_id, row_key)
+        if entity is not None:
+            self.offloader.delete_payloads(getattr(entity, field) for field in PAYLOAD_FIELDS)
+
+    def move_to_finished(self, entity: TaskEntity) -> None:
+        """
+        Offloads the entity's large payloads, then writes it to the inner store's finished table.
+
+        :param entity: The TaskEntity instance to move.
+        """
+        self.inner.move_to_finished(self.offloader.offload(entity))
+
+    def complete_task(self, entity: TaskEntity) -> None:
+        """
+        Offloads the entity's large payloads, then completes it in the inner store.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self.inner.complete_task(self.offloader.offload(entity))
+
+    def fail_task(self, entity: TaskEntity) -> None:
+        """
+        Offloads the entity's large payloads, then fails it in the inner store.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self.inner.fail_task(self.offloader.offload(entity))
+
+    def finish_tasks(self, entities: Iterable[TaskEntity]) -> None:
+        """
+        Offloads the large payloads of every entity, then finishes them with the inner store's
+        batched write.
+
+        :param entities: The TaskEntity instances in their final state.
+        """
+        self.inner.finish_tasks([self.offloader.offload(entity) for entity in entities])
+
+    def query_tasks_by_status(
+        self,
+        status: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks with the given status from the inner store.
+
+        :param status: The status to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._attach_page(self.inner.query_tasks_by_status(status, location, page_size, continuation_token))
+
+    def query_tasks_by_type(
+        self,
+        task_type: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks of the given type from the inner store.
+
+        :param task_type: The task type to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._attach_page(self.inner.query_tasks_by_type(task_type, location, page_size, continuation_token))
+
+    def query_tasks_by_end_time(
+        self,
+        start: datetime,
+        end: datetime,
+        location: str = AppConstants.TaskLocations.FINISHED,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks whose EndTime falls in [start, end) from the inner store.
+
+        :param start: Inclusive lower bound.
+        :param end: Exclusive upper bound.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._attach_page(
+            self.inner.query_tasks_by_end_time(start, end, location, page_size, continuation_token)
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the inner store's writes are durable (payload blobs are written synchronously).
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if all writes are durable, False if the timeout expired or a write failed.
+        """
+        return self.inner.flush(timeout)
+
+    def close(self) -> None:
+        """
+        Closes the inner store.
+        """
+        self.inner.close()
+
+    def _attach_page(self, page: TaskPage) -> TaskPage:
+        """
+        :param page: A page read from the inner store.
+        :return: The same page, with offloaded payloads deferred.
+        """
+        for entity in page.items:
+            self.offloader.attach(entity)
+        return page
+
+    @staticmethod
+    def _sync_clean(entity: TaskEntity, stored: TaskEntity) -> None:
+        """
+        Marks the caller's entity clean when the inner store has cleaned the copy it wrote
+        (stores that send only changed fields do so after a successful write).
+
+        :param entity: The caller's entity.
+        :param stored: The entity passed to the inner store.
+        """
+        if stored is not entity and not stored.dirty_fields:
+            entity.mark_clean()
@@ -0,0 +1,356 @@
+# background_workflows/storage/tables/sharded_sqlite_task_store.py
+
+import json
+import os
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_page import TaskPage
+from background_workflows.storage.tables.i_task_storage import ITaskStore
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.utils.task_logger import logger
+
+
+class ShardedSqliteTaskStore(ITaskStore):
+    """
+    ITaskStore that spreads tasks over `shard_count` SQLite database files by resource_id.
+
+    A single SQLite file serializes every writer; with N files, writes to different shards
+    commit in parallel. Each shard is a full SqliteTaskStore with its own connections (and its
+    own writer thread in write-behind mode), so every per-task operation touches exactly one
+    shard. A resource's tasks always live in the same shard, chosen with a CRC-32 of the
+    resource_id (stable across processes, unlike hash()).
+
+    Shard files are named after db_path and the shard count (see
+    AppConstants.ShardedSqliteTaskStore.SHARD_PATH_FORMAT). Changing the shard count therefore
+    opens a new, empty set of files rather than misrouting existing tasks; existing data must be
+    migrated explicitly.
+
+    Queries by status, type or end time run on every shard and merge the results by sort key.
+    The continuation token holds one position per shard.
+    """
+
+    def __init__(
+        self,
+        db_path: str = AppConstants.TaskStoreFactory.get_sqlite_db_path(),
+        shard_count: int = AppConstants.ShardedSqliteTaskStore.DEFAULT_SHARD_COUNT,
+        active_table_name: str = AppConstants.TaskStoreFactory.get_active_table_name(),
+        finished_table_name: str = AppConstants.TaskStoreFactory.get_finished_table_name(),
+        connection_mode: str = AppConstants.SqliteTaskStore.DEFAULT_CONNECTION_MODE,
+        **shard_options: Any,
+    ) -> None:
+        """
+        Initialize the sharded store.
+
+        :param db_path: Base path of the database files (use ":memory:" for tests; each shard
+                        then gets its own in-memory database).
+        :param shard_count: Number of database files.
+        :param active_table_name: Name of the table that stores active tasks in every shard.
+        :param finished_table_name: Name of the table that stores finished tasks in every shard.
+        :param connection_mode: "shared" or "per_thread", applied to every shard.
+        :param shard_options: Further SqliteTaskStore keyword arguments (e.g., write_behind,
+                              busy_timeout_secs), applied to every shard.
+        :raises ValueError: If shard_count is less than 1.
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1.")
+        self.db_path: str = db_path
+        self.shard_count: int = shard_count
+        self.active_table_name: str = active_table_name
+        self.finished_table_name: str = finished_table_name
+        self.connection_mode: str = connection_mode
+        self.shards: List[SqliteTaskStore] = [
+            SqliteTaskStore(
+                db_path=self.shard_path(db_path, index, shard_count),
+                active_table_name=active_table_name,
+                finished_table_name=finished_table_name,
+                connection_mode=connection_mode,
+                **shard_options,
+            )
+            for index in range(shard_count)
+        ]
+
+    @staticmethod
+    def shard_path(db_path: str, index: int, shard_count: int) -> str:
+        """
+        :param db_path: Base path of the database files.
+        :param index: Shard index, from 0 to shard_count - 1.
+        :param shard_count: Number of shards.
+        :return: The database path of the shard.
+        """
+        if db_path == AppConstants.SqliteTaskStore.MEMORY_DB_PATH:
+            return db_path
+        base, ext = os.path.splitext(db_path)
+        return AppConstants.ShardedSqliteTaskStore.SHARD_PATH_FORMAT.format(
+            base=base, index=index, count=shard_count, ext=ext
+        )
+
+    def shard_index(self, resource_id: str) -> int:
+        """
+        :param resource_id: The partition key of a task.
+        :return: The index of the shard holding the resource's tasks.
+        """
+        return zlib.crc32(str(resource_id).encode("utf-8")) % self.shard_count
+
+    def shard_for(self, resource_id: str) -> SqliteTaskStore:
+        """
+        :param resource_id: The partition key of a task.
+        :return: The shard holding the resource's tasks.
+        """
+        return self.shards[self.shard_index(resource_id)]
+
+    def create_if_not_exists(self) -> None:
+        """
+        Opens and migrates every shard.
+        """
+        for shard in self.shards:
+            shard.create_if_not_exists()
+        logger.info(f"Sharded SQLite store ready with {self.shard_count} shards.")
+
+    def get_task(self, resource_id: str, row_key: str, location: Optional[str] = None) -> Optional[TaskEntity]:
+        """
+        Retrieves a task from its shard (active table first, then finished).
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: A TaskEntity instance if found; otherwise, None.
+        """
+        return self.shard_for(resource_id).get_task(resource_id, row_key, location)
+
+    def get_tasks(
+        self, keys: Iterable[Tuple[str, str]], location: Optional[str] = None
+    ) -> Dict[Tuple[str, str], TaskEntity]:
+        """
+        Groups the keys by shard and runs one batched lookup per shard involved.
+
+        :param keys: (resource_id, row_key) pairs; duplicates are fetched once.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: The tasks found, keyed by (resource_id, row_key). Missing keys are omitted.
+        """
+        by_shard: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+        for key in dict.fromkeys((rid, rk) for rid, rk in keys):
+            by_shard[self.shard_index(key[0])].append(key)
+        found: Dict[Tuple[str, str], TaskEntity] = {}
+        for index, shard_keys in by_shard.items():
+            found.update(self.shards[index].get_tasks(shard_keys, location))
+        return found
+
+    def upsert_task(self, entity: TaskEntity) -> bool:
+        """
+        Inserts or updates the task in its shard's active table.
+
+        :param entity: The TaskEntity instance to upsert.
+        :return: True if the upsert is successful, False otherwise.
+        """
+        return self.shard_for(entity.ResourceId).upsert_task(entity)
+
+    def upsert_tasks(self, entities: Iterable[TaskEntity]) -> bool:
+        """
+        Upserts many entities with one transaction per shard involved.
+
+        :param entities: The TaskEntity instances to upsert.
+        :return: True if every shard's upsert is successful, False otherwise.
+        """
+        succeeded: bool = True
+        for index, shard_entities in self._group_by_shard(entities).items():
+            succeeded = self.shards[index].upsert_tasks(shard_entities) and succeeded
+        return succeeded
+
+    def finish_tasks(self, entities: Iterable[TaskEntity]) -> None:
+        """
+        Moves many tasks to the finished table with one transaction per shard involved.
+
+        :param entities: The TaskEntity instances in their final state.
+        """
+        for index, shard_entities in self._group_by_shard(entities).items():
+            self.shards[index].finish_tasks(shard_entities)
+
+    def _group_by_shard(self, entities: Iterable[TaskEntity]) -> Dict[int, List[TaskEntity]]:
+        """
+        :param entities: TaskEntity instances.
+        :return: The entities grouped by shard index, in their original order.
+        """
+        by_shard: Dict[int, List[TaskEntity]] = defaultdict(list)
+        for entity in entities:
+            by_shard[self.shard_index(entity.ResourceId)].append(entity)
+        return by_shard
+
+    def delete_task(self, resource_id: str, row_key: str) -> None:
+        """
+        Deletes a task from its shard's active table.
+
+        :param resource_id: The partition key.
+        :param row_key: The unique task identifier.
+        """
+        self.shard_for(resource_id).delete_task(resource_id, row_key)
+
+    def move_to_finished(self, entity: TaskEntity) -> None:
+        """
+        Inserts the task into its shard's finished table.
+
+        :param entity: The TaskEntity instance to move.
+        """
+        self.shard_for(entity.ResourceId).move_to_finished(entity)
+
+    def complete_task(self, entity: TaskEntity) -> None:
+        """
+        Moves a COMPLETED task to the finished table of its shard in a single transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self.shard_for(entity.ResourceId).complete_task(entity)
+
+    def fail_task(self, entity: TaskEntity) -> None:
+        """
+        Moves a failed task to the finished table of its shard in a single transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self.shard_for(entity.ResourceId).fail_task(entity)
+
+    def get_all_active_tasks(self, resource_id: str) -> List[TaskEntity]:
+        """
+        Retrieves all active tasks of a resource from its shard.
+
+        :param resource_id: The partition key to filter tasks.
+        :return: A list of TaskEntity instances.
+        """
+        return self.shard_for(resource_id).get_all_active_tasks(resource_id)
+
+    def query_tasks_by_status(
+        self,
+        status: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks with the given status across every shard.
+
+        :param status: The status to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(location, "status = ?", (status,), ("rowid",), page_size, continuation_token)
+
+    def query_tasks_by_type(
+        self,
+        task_type: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks of the given type across every shard.
+
+        :param task_type: The task type to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(location, "task_type = ?", (task_type,), ("rowid",), page_size, continuation_token)
+
+    def query_tasks_by_end_time(
+        self,
+        start: datetime,
+        end: datetime,
+        location: str = AppConstants.TaskLocations.FINISHED,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks whose EndTime falls in [start, end) across every shard,
+        oldest first.
+
+        :param start: Inclusive lower bound (naive datetimes are treated as UTC).
+        :param end: Exclusive upper bound (naive datetimes are treated as UTC).
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(
+            location,
+            "end_time >= ? AND end_time < ?",
+            (SqliteTaskStore.to_utc_iso(start), SqliteTaskStore.to_utc_iso(end)),
+            ("end_time", "rowid"),
+            page_size,
+            continuation_token,
+        )
+
+    def _query_page(
+        self,
+        location: str,
+        where: str,
+        params: Sequence[Any],
+        order_by: Sequence[str],
+        page_size: int,
+        continuation_token: Optional[str],
+    ) -> TaskPage:
+        """
+        Scatter-gather version of SqliteTaskStore._query_page.
+
+        Each shard returns up to page_size + 1 rows after its own position; the rows are merged
+        by (sort key, shard index) and the first page_size are returned. The token records, per
+        shard, the sort key of its last returned row, so no row is skipped or repeated even
+        though shards contribute unevenly to each page.
+
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param where: Filter expression with ? placeholders.
+        :param params: Values for the filter placeholders.
+        :param order_by: Sort key columns (ending with rowid).
+        :param page_size: Maximum number of rows to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        :raises ValueError: If location, page_size or the token is invalid.
+        """
+        SqliteTaskStore.check_page_size(page_size)
+        positions: List[Optional[List[Any]]] = [None] * self.shard_count
+        if continuation_token is not None:
+            positions = json.loads(continuation_token)
+            if not isinstance(positions, list) or len(positions) != self.shard_count:
+                raise ValueError("The continuation token was not issued by a store with this shard count.")
+
+        key_len: int = len(order_by)
+        candidates: List[Tuple[tuple, int, Any]] = []
+        for index, shard in enumerate(self.shards):
+            rows: List[Any] = shard.query_keyset_rows(location, where, params, order_by, page_size + 1, positions[index])
+            candidates.extend((tuple(row[:key_len]), index, row) for row in rows)
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[1]))
+
+        page: List[Tuple[tuple, int, Any]] = candidates[:page_size]
+        for sort_key, index, _ in page:
+            positions[index] = list(sort_key)
+        next_token: Optional[str] = json.dumps(positions) if len(candidates) > page_size else None
+        return TaskPage([TaskEntity.from_row(row, key_len) for _, _, row in page], next_token)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every shard has committed the writes issued so far.
+
+        :param timeout: Maximum number of seconds to wait in total; None waits indefinitely.
+        :return: True if all writes are durable, False if the timeout expired or a write failed.
+        """
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        durable: bool = True
+        for shard in self.shards:
+            remaining: Optional[float] = None if deadline is None else max(0.0, deadline - time.monotonic())
+            # Flush every shard, so a failure on one is not reported late by the next flush.
+            durable = shard.flush(remaining) and durable
+        return durable
+
+    def close(self) -> None:
+        """
+        Closes every shard, committing queued writes first in write-behind mode.
+        """
+        for shard in self.shards:
+            shard.close()
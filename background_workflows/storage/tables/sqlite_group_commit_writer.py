@@ -0,0 +1,230 @@
+# background_workflows/storage/tables/sqlite_group_commit_writer.py
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.utils.task_logger import logger
+
+# A write: called with a connection inside an open transaction.
+WriteOperation = Callable[[sqlite3.Connection], Any]
+
+# Queue markers: end the current batch now (flush) / stop once the queue is drained (close).
+_FLUSH: object = object()
+_STOP: object = object()
+
+
+class _SubmitterState:
+    """
+    Per-thread record of writes that failed since the thread's last flush.
+    """
+
+    def __init__(self) -> None:
+        self.failed: int = 0
+
+
+# A queued write: (sequence number, operation, submitting thread's state).
+_QueuedWrite = Tuple[int, WriteOperation, _SubmitterState]
+
+
+class SqliteGroupCommitWriter:
+    """
+    Write-behind queue for SqliteTaskStore.
+
+    Writes submitted from any thread are applied in FIFO order by a single writer thread,
+    which groups them into one transaction every `interval_ms` milliseconds or `max_rows`
+    writes, whichever comes first. `flush()` lets callers wait until everything they have
+    submitted so far is committed, and `close()` commits all pending writes before returning.
+
+    If a grouped transaction fails, it is rolled back and its writes are retried one by one,
+    so a single bad write does not discard the rest of the batch. A write that still fails is
+    reported to the thread that submitted it: its next `flush()` returns False.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[WriteOperation], Any],
+        interval_ms: int = AppConstants.SqliteTaskStore.GROUP_COMMIT_INTERVAL_MS,
+        max_rows: int = AppConstants.SqliteTaskStore.GROUP_COMMIT_MAX_ROWS,
+    ) -> None:
+        """
+        Initialize the writer and start its thread.
+
+        :param execute: Runs a write operation in its own transaction on the calling thread's
+                        connection (e.g., SqliteTaskStore.run_with_busy_retry).
+        :param interval_ms: Maximum time a write waits before its batch is committed.
+        :param max_rows: Maximum number of writes per transaction.
+        :raises ValueError: If interval_ms is negative or max_rows is less than 1.
+        """
+        if interval_ms < 0 or max_rows < 1:
+            raise ValueError("interval_ms must be >= 0 and max_rows must be >= 1.")
+        self._execute: Callable[[WriteOperation], Any] = execute
+        self.interval_ms: int = interval_ms
+        self.max_rows: int = max_rows
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        # Sequence numbers of submitted / committed writes; guarded by _committed_condition.
+        self._submitted_seq: int = 0
+        self._committed_seq: int = 0
+        self._committed_condition: threading.Condition = threading.Condition()
+        self._closed: bool = False
+        self._local: threading.local = threading.local()
+
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=AppConstants.SqliteTaskStore.WRITER_THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, operation: WriteOperation) -> int:
+        """
+        Queues a write for the next group commit.
+
+        :param operation: Called with the writer's connection inside the batch transaction.
+        :return: The write's sequence number.
+        :raises RuntimeError: If the writer has been closed.
+        """
+        with self._committed_condition:
+            if self._closed:
+                raise RuntimeError("The write-behind writer is closed.")
+            self._submitted_seq += 1
+            seq: int = self._submitted_seq
+            self._queue.put((seq, operation, self._submitter_state()))
+        return seq
+
+    def pending_count(self) -> int:
+        """
+        :return: The number of submitted writes that are not committed yet.
+        """
+        with self._committed_condition:
+            return self._submitted_seq - self._committed_seq
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commits the current batch immediately and waits until every write submitted before
+        this call is durable.
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if all those writes are committed, False if the timeout expired or a write
+                 submitted by the calling thread since its last flush failed.
+        """
+        state: _SubmitterState = self._submitter_state()
+        with self._committed_condition:
+            target: int = self._submitted_seq
+            if self._committed_seq < target:
+                if not self._closed:
+                    self._queue.put(_FLUSH)
+                if not self._committed_condition.wait_for(lambda: self._committed_seq >= target, timeout):
+                    return False
+            failed: int = state.failed
+            state.failed = 0
+        if failed:
+            logger.error(f"{failed} write-behind write(s) from this thread failed and were not committed.")
+        return failed == 0
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting writes, commits everything still queued and stops the writer thread.
+
+        :param timeout: Maximum number of seconds to wait for the writer thread.
+        """
+        with self._committed_condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _submitter_state(self) -> _SubmitterState:
+        """
+        :return: The calling thread's failure record, created on first use.
+        """
+        state: Optional[_SubmitterState] = getattr(self._local, "state", None)
+        if state is None:
+            state = _SubmitterState()
+            self._local.state = state
+        return state
+
+    def _run(self) -> None:
+        """
+        Writer thread: collects batches and commits them until stopped and drained.
+        """
+        stopping: bool = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._commit(batch)
+
+    def _next_batch(self) -> Tuple[List[_QueuedWrite], bool]:
+        """
+        Blocks for the first write, then gathers more until the interval elapses, the batch is
+        full, or a flush/stop marker arrives.
+
+        :return: The batch and whether a stop marker was seen.
+        """
+        batch: List[_QueuedWrite] = []
+        item: Any = self._queue.get()
+        if item is _STOP:
+            return batch, True
+        if item is _FLUSH:
+            return batch, False
+        batch.append(item)
+
+        deadline: float = time.monotonic() + self.interval_ms / 1000.0
+        while len(batch) < self.max_rows:
+            remaining: float = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return self._drain_into(batch), True
+            if item is _FLUSH:
+                break
+            batch.append(item)
+        return batch, False
+
+    def _drain_into(self, batch: List[_QueuedWrite]) -> List[_QueuedWrite]:
+        """
+        Moves every remaining queued write into the batch (used on stop).
+
+        :param batch: The batch being assembled.
+        :return: The same batch.
+        """
+        while True:
+            try:
+                item: Any = self._queue.get_nowait()
+            except queue.Empty:
+                return batch
+            if item is not _FLUSH and item is not _STOP:
+                batch.append(item)
+
+    def _commit(self, batch: List[_QueuedWrite]) -> None:
+        """
+        Applies a batch in one transaction, falling back to one transaction per write on failure,
+        then publishes the new committed sequence number. Writes that fail on their own are
+        recorded against their submitting thread before the number is published.
+
+        :param batch: The (sequence number, operation, submitter) entries to apply, in order.
+        """
+        operations: List[WriteOperation] = [operation for _, operation, _ in batch]
+        failed: List[_SubmitterState] = []
+        try:
+            self._execute(lambda conn: [operation(conn) for operation in operations])
+        except Exception as ex:
+            logger.warning(f"Group commit of {len(operations)} write(s) failed ({ex}); retrying individually.")
+            for _, operation, state in batch:
+                try:
+                    self._execute(operation)
+                except Exception as op_ex:
+                    logger.exception(f"Write-behind operation failed: {op_ex}")
+                    failed.append(state)
+
+        with self._committed_condition:
+            for state in failed:
+                state.failed += 1
+            self._committed_seq = batch[-1][0]
+            self._committed_condition.notify_all()
+        logger.debug(f"Group-committed {len(operations)} write(s).")
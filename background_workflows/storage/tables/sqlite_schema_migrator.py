@@ -0,0 +1,181 @@
+# background_workflows/storage/tables/sqlite_schema_migrator.py
+
+import sqlite3
+from typing import Callable, List
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.utils.task_logger import logger
+
+# Columns with a secondary index on both tables, for status, type, batch and time-range queries.
+INDEXED_COLUMNS: tuple = ("status", "task_type", "batch_id", "end_time")
+
+# Timestamp columns compared as ISO-8601 text ("YYYY-MM-DDTHH:MM:SS...").
+TIMESTAMP_COLUMNS: tuple = ("start_time", "end_time")
+
+TASK_TABLE_COLUMNS: str = """
+    resource_id TEXT,
+    row_key TEXT,
+    task_type TEXT,
+    status TEXT,
+    input_payload TEXT,
+    output_payload TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    batch_id TEXT,
+    error_message TEXT,
+    container_name TEXT,
+    blob_name TEXT,
+    PRIMARY KEY(resource_id, row_key)
+"""
+
+
+class SqliteSchemaMigrator:
+    """
+    Brings the active/finished tables of a SQLite task store up to the latest schema version.
+
+    The version is stored in the database header (`PRAGMA user_version`). Each migration moves
+    the schema one version forward and runs, together with the version bump, in a single
+    `BEGIN IMMEDIATE` transaction, so concurrent processes opening the same file migrate it
+    exactly once and a failed migration leaves the previous version intact.
+
+    Migrations must be idempotent (IF NOT EXISTS, `add_column_if_missing`): when a store opens
+    a database whose version is current but whose own tables are missing (e.g., another table
+    pair in the same file), every migration is replayed for its tables.
+
+    To change the schema, append a method to `migrations()`; never edit or reorder existing ones.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, active_table_name: str, finished_table_name: str) -> None:
+        """
+        Initialize the migrator.
+
+        :param conn: Connection to the database to migrate.
+        :param active_table_name: Name of the table that stores active tasks.
+        :param finished_table_name: Name of the table that stores finished tasks.
+        """
+        self.conn: sqlite3.Connection = conn
+        self.active_table_name: str = active_table_name
+        self.finished_table_name: str = finished_table_name
+
+    def migrations(self) -> List[Callable[[], None]]:
+        """
+        :return: The migrations in order; migration i upgrades the schema to version i + 1.
+        """
+        return [
+            self._create_tables,
+            self._create_indexes,
+            self._normalize_timestamps,
+        ]
+
+    @property
+    def latest_version(self) -> int:
+        """
+        :return: The schema version after every migration has run.
+        """
+        return len(self.migrations())
+
+    def current_version(self) -> int:
+        """
+        :return: The schema version recorded in the database.
+        """
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def tables_exist(self) -> bool:
+        """
+        :return: True if both the active and the finished table exist.
+        """
+        count: int = self.conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+            (self.active_table_name, self.finished_table_name),
+        ).fetchone()[0]
+        return count == 2
+
+    def migrate(self) -> int:
+        """
+        Applies every pending migration.
+
+        A database already migrated by a newer version of this library is left untouched
+        (migrations are additive, so older workers keep working during a rolling upgrade).
+
+        :return: The schema version after migrating.
+        """
+        # Cheap check first, so an up-to-date database never takes the write lock.
+        version: int = self.current_version()
+        if version >= self.latest_version and self.tables_exist():
+            if version > self.latest_version:
+                logger.warning(
+                    f"SQLite schema version {version} is newer than this library's ({self.latest_version}); "
+                    "skipping migrations."
+                )
+            return version
+
+        if version == 0 and not self._has_any_table():
+            # Only possible before the first table exists: lets maintenance return free pages
+            # to the OS with PRAGMA incremental_vacuum instead of a full VACUUM.
+            self.conn.execute(
+                f"PRAGMA auto_vacuum = {AppConstants.SqliteTaskMaintenance.AUTO_VACUUM_INCREMENTAL}"
+            )
+
+        migrations: List[Callable[[], None]] = self.migrations()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock: another connection may have migrated meanwhile.
+            version = self.current_version()
+            start: int = min(version, len(migrations)) if self.tables_exist() else 0
+            for index in range(start, len(migrations)):
+                logger.info(f"Applying SQLite schema migration {index + 1}: {migrations[index].__name__}")
+                migrations[index]()
+            if version < self.latest_version:
+                # PRAGMA does not accept bound parameters; the value is an int we computed.
+                self.conn.execute(f"PRAGMA user_version = {int(self.latest_version)}")
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        return max(version, self.latest_version)
+
+    def _has_any_table(self) -> bool:
+        """
+        :return: True if the database contains at least one table.
+        """
+        return self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1").fetchone() is not None
+
+    def add_column_if_missing(self, table: str, column: str, declaration: str) -> None:
+        """
+        Adds a column unless it already exists (SQLite has no ADD COLUMN IF NOT EXISTS).
+
+        :param table: Table to alter.
+        :param column: Column name.
+        :param declaration: Column type and constraints, e.g. "TEXT".
+        """
+        existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        if column not in existing:
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+    def _create_tables(self) -> None:
+        """
+        Version 1: the active and finished tables, keyed by (resource_id, row_key).
+        """
+        for table in (self.active_table_name, self.finished_table_name):
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({TASK_TABLE_COLUMNS})")
+
+    def _create_indexes(self) -> None:
+        """
+        Version 2: secondary indexes backing the status, type and time-range queries.
+        """
+        for table in (self.active_table_name, self.finished_table_name):
+            for column in INDEXED_COLUMNS:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})")
+
+    def _normalize_timestamps(self) -> None:
+        """
+        Version 3: rewrites timestamps stored with a space between date and time
+        ("2026-10-01 12:00:00", as older versions wrote them) to the "T" separator used by
+        isoformat(), so text range queries on end_time also match those rows.
+        """
+        for table in (self.active_table_name, self.finished_table_name):
+            for column in TIMESTAMP_COLUMNS:
+                self.conn.execute(
+                    f"UPDATE {table} SET {column} = substr({column}, 1, 10) || 'T' || substr({column}, 12) "
+                    f"WHERE {column} LIKE '____-__-__ %'"
+                )
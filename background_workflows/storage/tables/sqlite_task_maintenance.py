@@ -0,0 +1,294 @@
+# background_workflows/storage/tables/sqlite_task_maintenance.py
+
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.local_blob_store import LocalBlobStore
+from background_workflows.storage.blobs.payload_offloader import PayloadOffloader
+from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
+from background_workflows.utils.task_logger import logger
+
+
+class MaintenanceReport:
+    """
+    Outcome of one SqliteTaskMaintenance run.
+    """
+
+    def __init__(self) -> None:
+        self.archived: int = 0
+        self.deleted: int = 0
+        self.deleted_blobs: int = 0
+        self.vacuumed_pages: int = 0
+        self.archive_files: List[str] = []
+
+    def __repr__(self) -> str:
+        """
+        Return a debug string representation of the MaintenanceReport.
+
+        :return: A string including the archived, deleted, deleted blob and vacuumed counts.
+        """
+        return (
+            f"<MaintenanceReport archived={self.archived}, deleted={self.deleted}, "
+            f"deleted_blobs={self.deleted_blobs}, vacuumed_pages={self.vacuumed_pages}>"
+        )
+
+
+class SqliteTaskMaintenance:
+    """
+    Retention, archival and compaction for the finished table of a SqliteTaskStore.
+
+    A finished row is expired when its end_time is older than `max_age`, or when it is not
+    among the `max_rows` most recent ones. Expired rows are processed oldest first, in batches
+    of `batch_size`. Each batch is appended to gzip-compressed JSON Lines files, one per
+    day of end_time (`<archive_dir>/<table>/<YYYY-MM-DD>.jsonl.gz`). The files are fsync'ed
+    and then the batch is deleted in its own short transaction. A crash between the two steps
+    can duplicate archived rows but never loses them.
+
+    Afterwards, free pages are returned to the OS with `PRAGMA incremental_vacuum`. Databases
+    created before incremental auto-vacuum was enabled need a one-time full VACUUM
+    (`full_vacuum=True`), which rewrites the whole file and blocks writers while it runs.
+
+    Rows without an end_time are never expired.
+
+    With a `payload_offloader`, payloads kept in blob storage (see PayloadOffloadingTaskStore)
+    are written into the archive in full, and their blobs are deleted once their rows are.
+    """
+
+    def __init__(
+        self,
+        task_store: SqliteTaskStore,
+        max_age: Optional[timedelta] = None,
+        max_rows: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        batch_size: int = AppConstants.SqliteTaskMaintenance.DEFAULT_BATCH_SIZE,
+        vacuum_pages: int = AppConstants.SqliteTaskMaintenance.DEFAULT_VACUUM_PAGES,
+        payload_offloader: Optional[PayloadOffloader] = None,
+    ) -> None:
+        """
+        Initialize the maintenance job.
+
+        :param task_store: An initialized SqliteTaskStore.
+        :param max_age: Finished rows whose end_time is older than this are expired.
+        :param max_rows: Only this many of the most recent finished rows are kept.
+        :param archive_dir: Directory for archive files; None deletes expired rows without archiving.
+        :param batch_size: Rows archived and deleted per transaction.
+        :param vacuum_pages: Free pages to release per run (0 = all).
+        :param payload_offloader: Resolves and deletes offloaded payloads; None leaves their blobs alone.
+        :raises ValueError: If neither max_age nor max_rows is given, or a limit is negative.
+        """
+        if max_age is None and max_rows is None:
+            raise ValueError("At least one of max_age or max_rows is required.")
+        if (max_rows is not None and max_rows < 0) or batch_size < 1 or vacuum_pages < 0:
+            raise ValueError("max_rows and vacuum_pages must be >= 0 and batch_size must be >= 1.")
+        self.task_store: SqliteTaskStore = task_store
+        self.max_age: Optional[timedelta] = max_age
+        self.max_rows: Optional[int] = max_rows
+        self.archive_dir: Optional[str] = archive_dir
+        self.batch_size: int = batch_size
+        self.vacuum_pages: int = vacuum_pages
+        self.payload_offloader: Optional[PayloadOffloader] = payload_offloader
+
+    def run(self, full_vacuum: bool = False) -> MaintenanceReport:
+        """
+        Archives and deletes every expired finished row, then compacts the database.
+
+        :param full_vacuum: If True and incremental auto-vacuum is not enabled yet, enable it
+                            with a full VACUUM.
+        :return: A MaintenanceReport.
+        """
+        report: MaintenanceReport = MaintenanceReport()
+        cutoff: Optional[str] = None
+        if self.max_age is not None:
+            cutoff = SqliteTaskStore.to_utc_iso(datetime.utcnow() - self.max_age)
+
+        while True:
+            batch: List[tuple] = self._next_expired_batch(cutoff)
+            if not batch:
+                break
+            if self.archive_dir is not None:
+                self._archive(batch, report)
+            deleted: int = self._delete(batch)
+            if not deleted:
+                # Every row of the batch was replaced concurrently; stop rather than spin.
+                logger.warning("SQLite maintenance stopped early: expired rows changed while being purged.")
+                break
+            report.deleted += deleted
+            if self.payload_offloader is not None:
+                self._delete_payloads(batch, deleted, report)
+
+        report.vacuumed_pages = self.compact(full_vacuum)
+        logger.info(f"SQLite maintenance of {self.task_store.finished_table_name} finished: {report}")
+        return report
+
+    def _next_expired_batch(self, cutoff: Optional[str]) -> List[tuple]:
+        """
+        Returns the oldest expired rows, at most batch_size of them.
+
+        Both criteria select a prefix of the rows ordered by end_time, so the expired rows of
+        a batch are the longer of the two prefixes.
+
+        :param cutoff: ISO-8601 end_time below which rows are expired, or None.
+        :return: The expired rows, oldest first (rowid first, then the task columns).
+        """
+        table: str = self.task_store.finished_table_name
+        conn: sqlite3.Connection = self.task_store.connection()
+        excess: int = 0
+        if self.max_rows is not None:
+            total: int = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE end_time IS NOT NULL").fetchone()[0]
+            excess = max(0, total - self.max_rows)
+
+        rows: List[Any] = conn.execute(
+            f"""
+            SELECT rowid, resource_id, row_key, task_type, status, input_payload, output_payload,
+                   start_time, end_time, batch_id, error_message, container_name, blob_name
+            FROM {table}
+            WHERE end_time IS NOT NULL
+            ORDER BY end_time, rowid
+            LIMIT ?
+            """,
+            (self.batch_size,),
+        ).fetchall()
+        aged: int = sum(1 for row in rows if cutoff is not None and row[8] < cutoff)
+        return rows[: max(aged, excess)]
+
+    def _archive(self, batch: Sequence[Any], report: MaintenanceReport) -> None:
+        """
+        Appends the batch to one gzip-compressed JSON Lines file per end_time day and flushes
+        the files to disk. Appending adds a new gzip member, which gzip readers concatenate.
+
+        :param batch: Rows returned by _next_expired_batch.
+        :param report: Report to update.
+        """
+        by_day: Dict[str, List[str]] = defaultdict(list)
+        for row in batch:
+            entity = TaskEntity.from_row(row, 1)
+            if self.payload_offloader is not None:
+                # to_dict() below downloads the payloads, so the archive stays complete.
+                self.payload_offloader.attach(entity)
+            by_day[str(row[8])[:10]].append(json.dumps(entity.to_dict(), default=str))
+
+        table_dir: str = os.path.join(self.archive_dir, self.task_store.finished_table_name)
+        os.makedirs(table_dir, exist_ok=True)
+        for day, lines in by_day.items():
+            path: str = os.path.join(table_dir, f"{day}{AppConstants.SqliteTaskMaintenance.ARCHIVE_FILE_SUFFIX}")
+            with open(path, "ab") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+                    archive.write(("\n".join(lines) + "\n").encode("utf-8"))
+                raw.flush()
+                os.fsync(raw.fileno())
+            if path not in report.archive_files:
+                report.archive_files.append(path)
+        report.archived += len(batch)
+
+    def _delete(self, batch: Sequence[Any]) -> int:
+        """
+        Deletes the batch in one transaction. Matching on row_key as well as rowid skips rows
+        that were replaced (and got a new rowid) since the batch was read.
+
+        :param batch: Rows returned by _next_expired_batch.
+        :return: The number of rows deleted.
+        """
+        table: str = self.task_store.finished_table_name
+        keys: List[tuple] = [(row[0], row[2], row[8]) for row in batch]
+        return self.task_store.run_with_busy_retry(
+            lambda conn: conn.executemany(
+                f"DELETE FROM {table} WHERE rowid = ? AND row_key = ? AND end_time = ?", keys
+            ).rowcount
+        )
+
+    def _delete_payloads(self, batch: Sequence[Any], deleted: int, report: MaintenanceReport) -> None:
+        """
+        Deletes the payload blobs of a purged batch. When some rows were replaced concurrently
+        (and so not deleted), the batch's blobs are kept, as the new rows may reference them.
+
+        :param batch: Rows returned by _next_expired_batch.
+        :param deleted: Number of rows of the batch that were deleted.
+        :param report: Report to update.
+        """
+        if deleted != len(batch):
+            logger.warning("SQLite maintenance kept the payload blobs of a batch whose rows changed while being purged.")
+            return
+        report.deleted_blobs += self.payload_offloader.delete_payloads(
+            value for row in batch for value in (row[5], row[6])
+        )
+
+    def compact(self, full_vacuum: bool = False) -> int:
+        """
+        Returns free pages to the OS and truncates the WAL file.
+
+        :param full_vacuum: If True and incremental auto-vacuum is off, switch it on with a full VACUUM.
+        :return: The number of pages released.
+        """
+        conn: sqlite3.Connection = self.task_store.connection()
+        incremental: int = AppConstants.SqliteTaskMaintenance.AUTO_VACUUM_INCREMENTAL
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != incremental:
+            if not full_vacuum:
+                logger.info("Incremental auto-vacuum is off; run with full_vacuum=True once to enable it.")
+                return 0
+            logger.info("Enabling incremental auto-vacuum with a full VACUUM.")
+            conn.execute(f"PRAGMA auto_vacuum = {incremental}")
+            conn.execute("VACUUM")
+
+        free_before: int = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        # incremental_vacuum returns one row per step; fetching them all runs it to completion.
+        conn.execute(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})").fetchall()
+        released: int = free_before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if self.task_store.is_per_thread:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return released
+
+
+def main(argv: Optional[Sequence[str]] = None) -> MaintenanceReport:
+    """
+    Maintenance entry point:
+    `python -m background_workflows.storage.tables.sqlite_task_maintenance --max-age-days 30 --archive-dir archive`
+
+    :param argv: Command-line arguments (defaults to sys.argv[1:]).
+    :return: The MaintenanceReport of the run.
+    """
+    parser = argparse.ArgumentParser(description="Archive, purge and compact finished SQLite tasks.")
+    parser.add_argument("--db-path", default=AppConstants.TaskStoreFactory.get_sqlite_db_path())
+    parser.add_argument("--active-table", default=AppConstants.TaskStoreFactory.get_active_table_name())
+    parser.add_argument("--finished-table", default=AppConstants.TaskStoreFactory.get_finished_table_name())
+    parser.add_argument("--max-age-days", type=float, default=None)
+    parser.add_argument("--max-rows", type=int, default=None)
+    parser.add_argument("--archive-dir", default=None, help="Omit to delete expired rows without archiving.")
+    parser.add_argument("--batch-size", type=int, default=AppConstants.SqliteTaskMaintenance.DEFAULT_BATCH_SIZE)
+    parser.add_argument("--vacuum-pages", type=int, default=AppConstants.SqliteTaskMaintenance.DEFAULT_VACUUM_PAGES)
+    parser.add_argument("--full-vacuum", action="store_true", help="Enable incremental auto-vacuum with a full VACUUM.")
+    parser.add_argument(
+        "--payload-blob-root", default=None, help="LocalBlobStore root of offloaded payloads, to delete their blobs."
+    )
+    parser.add_argument("--payload-container", default=AppConstants.PayloadOffload.get_container_name())
+    args = parser.parse_args(argv)
+
+    store: SqliteTaskStore = SqliteTaskStore(args.db_path, args.active_table, args.finished_table)
+    store.create_if_not_exists()
+    try:
+        return SqliteTaskMaintenance(
+            store,
+            max_age=timedelta(days=args.max_age_days) if args.max_age_days is not None else None,
+            max_rows=args.max_rows,
+            archive_dir=args.archive_dir,
+            batch_size=args.batch_size,
+            vacuum_pages=args.vacuum_pages,
+            payload_offloader=(
+                PayloadOffloader(LocalBlobStore(args.payload_blob_root), args.payload_container)
+                if args.payload_blob_root is not None
+                else None
+            ),
+        ).run(full_vacuum=args.full_vacuum)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
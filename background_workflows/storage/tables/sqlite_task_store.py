@@ -1,19 +1,88 @@
+import json
 import sqlite3
-import os
-from datetime import datetime
-from typing import Optional, List, Any
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, List, Any, Callable, Dict, Iterable, Sequence, Tuple, TypeVar
 
 from background_workflows.constants.app_constants import AppConstants
 from background_workflows.storage.schemas.task_entity import TaskEntity
+from background_workflows.storage.schemas.task_page import TaskPage
 from background_workflows.storage.tables.i_task_storage import ITaskStore
+from background_workflows.storage.tables.sqlite_group_commit_writer import SqliteGroupCommitWriter
+from background_workflows.storage.tables.sqlite_schema_migrator import SqliteSchemaMigrator
 from background_workflows.utils.task_logger import logger
 
+T = TypeVar("T")
+
+# Task columns in storage order (the order of TaskEntity.from_row and of every positional binding).
+TASK_COLUMNS: str = (
+    "resource_id, row_key, task_type, status, input_payload, output_payload, "
+    "start_time, end_time, batch_id, error_message, container_name, blob_name"
+)
+TASK_PLACEHOLDERS: str = ", ".join("?" for _ in TASK_COLUMNS.split(", "))
+TASK_COLUMNS_OF_T: str = ", ".join(f"t.{column}" for column in TASK_COLUMNS.split(", "))
+
+
+class SqliteTaskStatements:
+    """
+    SQL text for one (active, finished) table pair, built once per store instead of
+    re-formatting the statements on every call. All statements bind positionally, in
+    TASK_COLUMNS order.
+    """
+
+    def __init__(self, active_table_name: str, finished_table_name: str) -> None:
+        """
+        :param active_table_name: Name of the table that stores active tasks.
+        :param finished_table_name: Name of the table that stores finished tasks.
+        """
+        self.table_names: Tuple[str, str] = (active_table_name, finished_table_name)
+        active, finished = self.table_names
+        key_filter: str = "WHERE resource_id=? AND row_key=?"
+        coalesced: str = ",\n".join(
+            f"{column} = COALESCE(excluded.{column}, {active}.{column})"
+            for column in TASK_COLUMNS.split(", ")[2:]
+        )
+
+        self.upsert_active: str = (
+            f"INSERT INTO {active} ({TASK_COLUMNS}) VALUES ({TASK_PLACEHOLDERS}) "
+            f"ON CONFLICT(resource_id, row_key) DO UPDATE SET {coalesced}"
+        )
+        self.delete_active: str = f"DELETE FROM {active} {key_filter}"
+        self.insert_finished: str = f"INSERT INTO {finished} ({TASK_COLUMNS}) VALUES ({TASK_PLACEHOLDERS})"
+        self.replace_finished: str = f"INSERT OR REPLACE INTO {finished} ({TASK_COLUMNS}) VALUES ({TASK_PLACEHOLDERS})"
+        self.select_active: str = f"SELECT {TASK_COLUMNS} FROM {active} {key_filter}"
+        self.select_finished: str = f"SELECT {TASK_COLUMNS} FROM {finished} {key_filter}"
+        # Both tables in one statement; the active row wins if a task is present in both.
+        self.select_either: str = (
+            f"SELECT 0 AS source, {TASK_COLUMNS} FROM {active} {key_filter} "
+            f"UNION ALL SELECT 1 AS source, {TASK_COLUMNS} FROM {finished} {key_filter} "
+            f"ORDER BY source LIMIT 1"
+        )
+        self.select_active_by_resource: str = f"SELECT {TASK_COLUMNS} FROM {active} WHERE resource_id=?"
+
 
 class SqliteTaskStore(ITaskStore):
     """
     SQLite-based ITaskStore implementation using dynamic table names for 'active'
     and 'finished' tasks. This class creates the necessary tables (if they do not exist)
     and provides methods for upserting, retrieving, deleting, and moving tasks.
+
+    Connection modes:
+      - "shared" (default): one connection shared by every thread.
+      - "per_thread": each thread lazily opens its own connection, configured with WAL
+        journaling, synchronous=NORMAL and a tunable page cache, so readers never block the
+        writer and worker threads do not serialize on one connection. In-memory databases
+        cannot be shared across connections and always use "shared".
+
+    In both modes, statements wait up to `busy_timeout_secs` on a locked database, and writes
+    that still fail with "database is locked" are retried with exponential backoff.
+
+    Write-behind mode (`write_behind=True`, file databases only, implies "per_thread"): writes
+    return as soon as they are queued, and a single writer thread commits them in grouped
+    transactions every `group_commit_interval_ms` milliseconds or `group_commit_max_rows` writes.
+    Writes are applied in submission order; readers see them once committed. Call `flush()`
+    to wait until everything written so far is durable; `close()` flushes automatically.
     """
 
     def __init__(
@@ -21,6 +90,13 @@ class SqliteTaskStore(ITaskStore):
         db_path: str = AppConstants.TaskStoreFactory.get_sqlite_db_path(),
         active_table_name: str = AppConstants.TaskStoreFactory.get_active_table_name(),
         finished_table_name: str = AppConstants.TaskStoreFactory.get_finished_table_name(),
+        connection_mode: str = AppConstants.SqliteTaskStore.DEFAULT_CONNECTION_MODE,
+        busy_timeout_secs: float = AppConstants.SqliteTaskStore.BUSY_TIMEOUT_SECS,
+        busy_retry_attempts: int = AppConstants.SqliteTaskStore.BUSY_RETRY_ATTEMPTS,
+        cache_size_kib: int = AppConstants.SqliteTaskStore.DEFAULT_CACHE_SIZE_KIB,
+        write_behind: bool = False,
+        group_commit_interval_ms: int = AppConstants.SqliteTaskStore.GROUP_COMMIT_INTERVAL_MS,
+        group_commit_max_rows: int = AppConstants.SqliteTaskStore.GROUP_COMMIT_MAX_ROWS,
     ) -> None:
         """
         Initialize the SQLite task store.
@@ -28,182 +104,305 @@ class SqliteTaskStore(ITaskStore):
         :param db_path: Path to the SQLite database file (use ":memory:" for tests).
         :param active_table_name: Name of the table that stores active tasks.
         :param finished_table_name: Name of the table that stores finished tasks.
+        :param connection_mode: "shared" (one connection for all threads) or "per_thread"
+                                (one WAL-mode connection per thread).
+        :param busy_timeout_secs: How long a statement waits on a locked database.
+        :param busy_retry_attempts: Extra attempts for writes that still hit a locked database.
+        :param cache_size_kib: Page cache size per connection, in KiB ("per_thread" mode).
+        :param write_behind: If True, queue writes to a single writer thread that group-commits them.
+        :param group_commit_interval_ms: Write-behind mode: maximum delay before queued writes are committed.
+        :param group_commit_max_rows: Write-behind mode: maximum number of writes per transaction.
+        :raises ValueError: If connection_mode is not recognized, or write_behind is used with ":memory:".
         """
+        if connection_mode not in (
+            AppConstants.SqliteTaskStore.ConnectionModes.SHARED,
+            AppConstants.SqliteTaskStore.ConnectionModes.PER_THREAD,
+        ):
+            raise ValueError(f"Unknown connection_mode: {connection_mode}")
+        if db_path == AppConstants.SqliteTaskStore.MEMORY_DB_PATH:
+            # Every connection to ":memory:" opens a separate, empty database.
+            if write_behind:
+                raise ValueError("write_behind requires a file database; ':memory:' is not supported.")
+            connection_mode = AppConstants.SqliteTaskStore.ConnectionModes.SHARED
+        if write_behind:
+            # The writer thread needs its own WAL connection so readers are not blocked by group commits.
+            connection_mode = AppConstants.SqliteTaskStore.ConnectionModes.PER_THREAD
+
         self.db_path: str = db_path
         self.active_table_name: str = active_table_name
         self.finished_table_name: str = finished_table_name
+        self.connection_mode: str = connection_mode
+        self.busy_timeout_secs: float = busy_timeout_secs
+        self.busy_retry_attempts: int = busy_retry_attempts
+        self.cache_size_kib: int = cache_size_kib
         self._conn: Optional[sqlite3.Connection] = None
+        self._statements: SqliteTaskStatements = SqliteTaskStatements(active_table_name, finished_table_name)
+
+        # "per_thread" mode: each thread's connection, plus every connection opened so far (for close()).
+        self._local: threading.local = threading.local()
+        self._all_conns: List[sqlite3.Connection] = []
+        self._conns_lock: threading.Lock = threading.Lock()
+
+        # Write-behind mode: the writer is started by create_if_not_exists() and stopped by close().
+        self.write_behind: bool = write_behind
+        self.group_commit_interval_ms: int = group_commit_interval_ms
+        self.group_commit_max_rows: int = group_commit_max_rows
+        self._writer: Optional[SqliteGroupCommitWriter] = None
+
+    @property
+    def is_per_thread(self) -> bool:
+        """
+        :return: True if each thread uses its own connection.
+        """
+        return self.connection_mode == AppConstants.SqliteTaskStore.ConnectionModes.PER_THREAD
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Opens a new connection and applies the PRAGMAs of the configured connection mode.
+
+        :return: The new sqlite3.Connection.
+        """
+        # check_same_thread stays off so close() can release every connection from one thread.
+        conn: sqlite3.Connection = sqlite3.connect(
+            self.db_path, timeout=self.busy_timeout_secs, check_same_thread=False
+        )
+        if self.is_per_thread:
+            conn.execute(f"PRAGMA journal_mode={AppConstants.SqliteTaskStore.JOURNAL_MODE_WAL}")
+            conn.execute(f"PRAGMA synchronous={AppConstants.SqliteTaskStore.SYNCHRONOUS_NORMAL}")
+            # A negative cache_size is interpreted by SQLite as KiB rather than pages.
+            conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        with self._conns_lock:
+            self._all_conns.append(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection for the calling thread, opening it on first use in "per_thread" mode.
+
+        :return: The sqlite3.Connection to use.
+        """
+        if not self.is_per_thread:
+            return self._conn
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+        return conn
+
+    def run_with_busy_retry(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs a write in its own transaction, retrying with exponential backoff while the
+        database is locked by another connection.
+
+        :param operation: Called with the connection inside a transaction.
+        :return: The operation's return value.
+        :raises sqlite3.OperationalError: If the database stays locked after every retry.
+        """
+        backoff: float = AppConstants.SqliteTaskStore.BUSY_RETRY_BACKOFF_SECS
+        for attempt in range(self.busy_retry_attempts + 1):
+            conn: sqlite3.Connection = self.connection()
+            try:
+                with conn:
+                    return operation(conn)
+            except sqlite3.OperationalError as ex:
+                is_busy: bool = "locked" in str(ex) or "busy" in str(ex)
+                if not is_busy or attempt == self.busy_retry_attempts:
+                    raise
+                logger.warning(f"SQLite database busy (attempt {attempt + 1}); retrying in {backoff:.2f}s.")
+                time.sleep(backoff)
+                backoff *= 2
+
+    def _write(self, operation: Callable[[sqlite3.Connection], Any]) -> None:
+        """
+        Applies a write now, or queues it for the next group commit in write-behind mode.
+
+        :param operation: Called with a connection inside a transaction.
+        """
+        if self._writer is not None:
+            self._writer.submit(operation)
+        else:
+            self.run_with_busy_retry(operation)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every write issued so far is committed. A no-op unless write-behind is enabled.
+
+        :param timeout: Maximum number of seconds to wait; None waits indefinitely.
+        :return: True if all writes are durable, False if the timeout expired or a write issued by
+                 the calling thread since its last flush failed and was not committed.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
 
     def create_if_not_exists(self) -> None:
         """
-        Creates the required tables in the SQLite database if they do not already exist.
-        Uses "IF NOT EXISTS" in the CREATE TABLE statements.
-        """
-        # Determine if initialization is needed by checking if the database file exists.
-        needs_init: bool = not os.path.exists(self.db_path)
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        if needs_init:
-            with self._conn:
-                # Create the "active" table if it doesn't exist.
-                self._conn.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS {self.active_table_name} (
-                        resource_id TEXT,
-                        row_key TEXT,
-                        task_type TEXT,
-                        status TEXT,
-                        input_payload TEXT,
-                        output_payload TEXT,
-                        start_time TEXT,
-                        end_time TEXT,
-                        batch_id TEXT,
-                        error_message TEXT,
-                        container_name TEXT,
-                        blob_name TEXT,
-                        PRIMARY KEY(resource_id, row_key)
-                    );
-                    """
-                )
-                # Create the "finished" table if it doesn't exist.
-                self._conn.execute(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS {self.finished_table_name} (
-                        resource_id TEXT,
-                        row_key TEXT,
-                        task_type TEXT,
-                        status TEXT,
-                        input_payload TEXT,
-                        output_payload TEXT,
-                        start_time TEXT,
-                        end_time TEXT,
-                        batch_id TEXT,
-                        error_message TEXT,
-                        container_name TEXT,
-                        blob_name TEXT,
-                        PRIMARY KEY(resource_id, row_key)
-                    );
-                    """
-                )
-            logger.info("SQLite tables created or verified.")
-
-    def _row_to_entity(self, row: List[Any]) -> TaskEntity:
-        """
-        Converts a row from SQLite into a TaskEntity.
-
-        :param row: List of column values from the query.
-        :return: A TaskEntity instance populated with the row data.
-        """
-        return TaskEntity(
-            PartitionKey=row[0],
-            RowKey=row[1],
-            TaskType=row[2],
-            Status=row[3],
-            InputPayload=row[4],
-            OutputPayload=row[5],
-            StartTime=row[6],
-            EndTime=row[7],
-            BatchID=row[8],
-            ErrorMessage=row[9],
-            ContainerName=row[10],
-            BlobName=row[11]
+        Opens the database and brings its tables up to the latest schema version (creating
+        them if needed) with SqliteSchemaMigrator. Safe to call more than once.
+        In write-behind mode, also starts the writer thread.
+        """
+        if self._conn is None:
+            self._conn = self._open_connection()
+            if self.is_per_thread:
+                self._local.conn = self._conn
+        version: int = SqliteSchemaMigrator(self._conn, self.active_table_name, self.finished_table_name).migrate()
+        logger.info(f"SQLite tables created or verified (schema version {version}).")
+        if self.write_behind and self._writer is None:
+            self._writer = SqliteGroupCommitWriter(
+                self.run_with_busy_retry,
+                interval_ms=self.group_commit_interval_ms,
+                max_rows=self.group_commit_max_rows,
+            )
+
+    def _sql(self) -> SqliteTaskStatements:
+        """
+        Returns the precomputed statements, rebuilding them only if the table names were changed.
+
+        :return: The SqliteTaskStatements of the current table pair.
+        """
+        statements: SqliteTaskStatements = self._statements
+        if statements.table_names != (self.active_table_name, self.finished_table_name):
+            statements = SqliteTaskStatements(self.active_table_name, self.finished_table_name)
+            self._statements = statements
+        return statements
+
+    @staticmethod
+    def _entity_params(entity: TaskEntity, keep_text_times: bool = True) -> Tuple[Any, ...]:
+        """
+        Converts an entity to positional parameters in TASK_COLUMNS order, with datetimes as
+        ISO-8601 text.
+
+        :param entity: The TaskEntity to bind.
+        :param keep_text_times: If False, non-datetime StartTime/EndTime values bind as NULL.
+        :return: The parameter tuple.
+        """
+        start_time: Any = entity.StartTime
+        end_time: Any = entity.EndTime
+        if isinstance(start_time, datetime):
+            start_time = start_time.isoformat()
+        elif not keep_text_times:
+            start_time = None
+        if isinstance(end_time, datetime):
+            end_time = end_time.isoformat()
+        elif not keep_text_times:
+            end_time = None
+        return (
+            entity.ResourceId,
+            entity.RowKey,
+            entity.TaskType,
+            entity.Status,
+            entity.InputPayload,
+            entity.OutputPayload,
+            start_time,
+            end_time,
+            entity.BatchID,
+            entity.ErrorMessage,
+            entity.ContainerName,
+            entity.BlobName,
         )
 
-    def get_task(self, resource_id: str, row_key: str) -> Optional[TaskEntity]:
+    def get_task(self, resource_id: str, row_key: str, location: Optional[str] = None) -> Optional[TaskEntity]:
         """
-        Retrieves a task by its resource_id and row_key from the active table,
-        or, if not found, from the finished table.
+        Retrieves a task by its resource_id and row_key from the active table or, if not found,
+        from the finished table, with a single UNION ALL statement. The active row wins if a
+        task is present in both.
 
         :param resource_id: The partition key.
         :param row_key: The unique task identifier.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
         :return: A TaskEntity instance if found; otherwise, None.
         """
-        with self._conn:
-            cursor = self._conn.execute(
-                f"SELECT * FROM {self.active_table_name} WHERE resource_id=? AND row_key=?",
-                (resource_id, row_key),
-            )
-            row = cursor.fetchone()
-            if row:
-                logger.debug(f"Row found (active): {row}")
-                return self._row_to_entity(row)
-
-            cursor = self._conn.execute(
-                f"SELECT * FROM {self.finished_table_name} WHERE resource_id=? AND row_key=?",
-                (resource_id, row_key),
+        statements: SqliteTaskStatements = self._sql()
+        if location is None:
+            row = self.connection().execute(statements.select_either, (resource_id, row_key, resource_id, row_key)).fetchone()
+            return TaskEntity.from_row(row, 1) if row else None
+
+        if location == AppConstants.TaskLocations.ACTIVE:
+            sql: str = statements.select_active
+        elif location == AppConstants.TaskLocations.FINISHED:
+            sql = statements.select_finished
+        else:
+            raise ValueError(f"Unknown task location: {location}")
+        row = self.connection().execute(sql, (resource_id, row_key)).fetchone()
+        return TaskEntity.from_row(row) if row else None
+
+    def get_tasks(
+        self, keys: Iterable[Tuple[str, str]], location: Optional[str] = None
+    ) -> Dict[Tuple[str, str], TaskEntity]:
+        """
+        Fetches many tasks with one statement per MAX_KEYS_PER_STATEMENT keys. The keys are
+        bound as a VALUES list and joined to each table through its primary key, so each key
+        costs one index lookup per table. The active row wins if a task is present in both.
+
+        :param keys: (resource_id, row_key) pairs; duplicates are fetched once.
+        :param location: Optional AppConstants.TaskLocations hint; only that table is read.
+        :return: The tasks found, keyed by (resource_id, row_key). Missing keys are omitted.
+        """
+        unique_keys: List[Tuple[str, str]] = list(dict.fromkeys((rid, rk) for rid, rk in keys))
+        tables: List[str] = (
+            [self._table_for(location)]
+            if location is not None
+            else [self.active_table_name, self.finished_table_name]
+        )
+        found: Dict[Tuple[str, str], TaskEntity] = {}
+        conn: sqlite3.Connection = self.connection()
+        chunk_size: int = AppConstants.TaskQueries.MAX_KEYS_PER_STATEMENT
+        for start in range(0, len(unique_keys), chunk_size):
+            chunk: List[Tuple[str, str]] = unique_keys[start:start + chunk_size]
+            values: str = ", ".join("(?, ?)" for _ in chunk)
+            # CROSS JOIN keeps the key list as the outer loop, so each table is probed by primary key.
+            selects: str = " UNION ALL ".join(
+                f"SELECT {source} AS source, {TASK_COLUMNS_OF_T} FROM k CROSS JOIN {table} AS t "
+                f"ON t.resource_id = k.resource_id AND t.row_key = k.row_key"
+                for source, table in enumerate(tables)
             )
-            row = cursor.fetchone()
-            if row:
-                logger.debug(f"Row found (finished): {row}")
-                return self._row_to_entity(row)
-        return None
+            rows = conn.execute(
+                f"WITH k(resource_id, row_key) AS (VALUES {values}) {selects} ORDER BY source DESC",
+                [part for key in chunk for part in key],
+            ).fetchall()
+            # Rows arrive finished-first, so an active row overwrites a finished one for the same key.
+            for row in rows:
+                found[(row[1], row[2])] = TaskEntity.from_row(row, 1)
+        return found
 
     def upsert_task(self, entity: TaskEntity) -> bool:
         """
-        Inserts or updates the given task entity in the active table.
-        Converts any datetime fields to ISO format if necessary.
+        Inserts or updates the given task entity in the active table. None fields (and
+        non-datetime StartTime/EndTime values) keep the stored value.
 
         :param entity: The TaskEntity instance to upsert.
-        :return: True if the upsert is successful, False otherwise.
+        :return: True if the upsert is successful (or queued, in write-behind mode), False otherwise.
         """
         try:
-            data = entity.to_dict()
-            # Convert datetime fields to ISO format if they are datetime objects.
-            data["StartTime"] = data["StartTime"].isoformat() if isinstance(data["StartTime"], datetime) else None
-            data["EndTime"] = data["EndTime"].isoformat() if isinstance(data["EndTime"], datetime) else None
-
-            logger.debug(f"Upserting task: {data}")
-            with self._conn:
-                self._conn.execute(
-                    f"""
-                    INSERT INTO {self.active_table_name} (
-                        resource_id,
-                        row_key,
-                        task_type,
-                        status,
-                        input_payload,
-                        output_payload,
-                        start_time,
-                        end_time,
-                        batch_id,
-                        error_message,
-                        container_name,
-                        blob_name
-                    )
-                    VALUES (
-                        :PartitionKey,
-                        :RowKey,
-                        :TaskType,
-                        :Status,
-                        :InputPayload,
-                        :OutputPayload,
-                        :StartTime,
-                        :EndTime,
-                        :BatchID,
-                        :ErrorMessage,
-                        :ContainerName,
-                        :BlobName
-                    )
-                    ON CONFLICT(resource_id, row_key) DO UPDATE SET
-                        task_type = COALESCE(excluded.task_type, {self.active_table_name}.task_type),
-                        status = COALESCE(excluded.status, {self.active_table_name}.status),
-                        input_payload = COALESCE(excluded.input_payload, {self.active_table_name}.input_payload),
-                        output_payload = COALESCE(excluded.output_payload, {self.active_table_name}.output_payload),
-                        start_time = COALESCE(excluded.start_time, {self.active_table_name}.start_time),
-                        end_time = COALESCE(excluded.end_time, {self.active_table_name}.end_time),
-                        batch_id = COALESCE(excluded.batch_id, {self.active_table_name}.batch_id),
-                        error_message = COALESCE(excluded.error_message, {self.active_table_name}.error_message),
-                        container_name = COALESCE(excluded.container_name, {self.active_table_name}.container_name),
-                        blob_name = COALESCE(excluded.blob_name, {self.active_table_name}.blob_name)
-                    """,
-                    data,
-                )
-            logger.debug(f"Task {data['RowKey']} upserted successfully.")
+            sql: str = self._sql().upsert_active
+            params: Tuple[Any, ...] = self._entity_params(entity, keep_text_times=False)
+            self._write(lambda conn: conn.execute(sql, params))
+            logger.debug(f"Task {entity.RowKey} upserted successfully.")
             return True
 
         except Exception as e:
             logger.exception(f"Error while upserting task: {e}")
             return False
 
+    def upsert_tasks(self, entities: Iterable[TaskEntity]) -> bool:
+        """
+        Upserts many entities into the active table in a single transaction (or a single
+        queued write, in write-behind mode), with the same semantics as `upsert_task()`.
+
+        :param entities: The TaskEntity instances to upsert.
+        :return: True if the upsert is successful (or queued), False otherwise.
+        """
+        try:
+            sql: str = self._sql().upsert_active
+            params: List[Tuple[Any, ...]] = [self._entity_params(entity, keep_text_times=False) for entity in entities]
+            self._write(lambda conn: conn.executemany(sql, params))
+            logger.debug(f"{len(params)} tasks upserted successfully.")
+            return True
+
+        except Exception as e:
+            logger.exception(f"Error while upserting tasks: {e}")
+            return False
+
     def delete_task(self, resource_id: str, row_key: str) -> None:
         """
         Deletes a task from the active table.
@@ -211,11 +410,8 @@ class SqliteTaskStore(ITaskStore):
         :param resource_id: The partition key.
         :param row_key: The unique task identifier.
         """
-        with self._conn:
-            self._conn.execute(
-                f"DELETE FROM {self.active_table_name} WHERE resource_id=? AND row_key=?",
-                (resource_id, row_key),
-            )
+        sql: str = self._sql().delete_active
+        self._write(lambda conn: conn.execute(sql, (resource_id, row_key)))
         logger.debug(f"Deleted task with resource_id={resource_id}, row_key={row_key}")
 
     def move_to_finished(self, entity: TaskEntity) -> None:
@@ -224,42 +420,242 @@ class SqliteTaskStore(ITaskStore):
 
         :param entity: The TaskEntity instance to move.
         """
-        data = entity.to_dict()
-        with self._conn:
-            self._conn.execute(
+        sql: str = self._sql().insert_finished
+        params: Tuple[Any, ...] = self._entity_params(entity)
+        self._write(lambda conn: conn.execute(sql, params))
+        logger.debug(f"Moved task {entity.RowKey} to finished table.")
+
+    def query_tasks_by_status(
+        self,
+        status: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks with the given status, using the status index.
+
+        :param status: The status to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(location, "status = ?", (status,), ("rowid",), page_size, continuation_token)
+
+    def query_tasks_by_type(
+        self,
+        task_type: str,
+        location: str = AppConstants.TaskLocations.ACTIVE,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks of the given type, using the task_type index.
+
+        :param task_type: The task type to match.
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(location, "task_type = ?", (task_type,), ("rowid",), page_size, continuation_token)
+
+    def query_tasks_by_end_time(
+        self,
+        start: datetime,
+        end: datetime,
+        location: str = AppConstants.TaskLocations.FINISHED,
+        page_size: int = AppConstants.TaskQueries.DEFAULT_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> TaskPage:
+        """
+        Fetches one page of tasks whose EndTime falls in [start, end), oldest first, using the
+        end_time index. EndTime is stored as ISO-8601 text, so the range is compared as text.
+
+        :param start: Inclusive lower bound (naive datetimes are treated as UTC).
+        :param end: Exclusive upper bound (naive datetimes are treated as UTC).
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param page_size: Maximum number of tasks to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        """
+        return self._query_page(
+            location,
+            "end_time >= ? AND end_time < ?",
+            (self.to_utc_iso(start), self.to_utc_iso(end)),
+            ("end_time", "rowid"),
+            page_size,
+            continuation_token,
+        )
+
+    @staticmethod
+    def to_utc_iso(value: datetime) -> str:
+        """
+        Formats a datetime like the EndTime values written by BaseTask (naive UTC, ISO-8601).
+
+        :param value: The datetime to format.
+        :return: The ISO-8601 string.
+        """
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+
+    def _table_for(self, location: str) -> str:
+        """
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :return: The name of the table holding that location.
+        :raises ValueError: If location is not recognized.
+        """
+        if location == AppConstants.TaskLocations.ACTIVE:
+            return self.active_table_name
+        if location == AppConstants.TaskLocations.FINISHED:
+            return self.finished_table_name
+        raise ValueError(f"Unknown task location: {location}")
+
+    def _query_page(
+        self,
+        location: str,
+        where: str,
+        params: Sequence[Any],
+        order_by: Sequence[str],
+        page_size: int,
+        continuation_token: Optional[str],
+    ) -> TaskPage:
+        """
+        Runs a keyset-paginated query: rows are ordered by `order_by` (which must end with rowid
+        to be unique), and the continuation token holds the sort key of the last returned row,
+        so every page is an index range scan regardless of how deep the caller pages.
+
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param where: Filter expression with ? placeholders.
+        :param params: Values for the filter placeholders.
+        :param order_by: Sort key columns.
+        :param page_size: Maximum number of rows to return.
+        :param continuation_token: Token from the previous page, or None for the first page.
+        :return: A TaskPage.
+        :raises ValueError: If location or page_size is invalid.
+        """
+        self.check_page_size(page_size)
+        after: Optional[List[Any]] = json.loads(continuation_token) if continuation_token is not None else None
+        # One extra row tells whether another page exists.
+        rows: List[Any] = self.query_keyset_rows(location, where, params, order_by, page_size + 1, after)
+
+        key_len: int = len(order_by)
+        next_token: Optional[str] = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_token = json.dumps(list(rows[-1][:key_len]))
+        return TaskPage([TaskEntity.from_row(row, key_len) for row in rows], next_token)
+
+    @staticmethod
+    def check_page_size(page_size: int) -> None:
+        """
+        Validates the page size of a paginated query.
+
+        :param page_size: Requested page size.
+        :raises ValueError: If page_size is outside [1, MAX_PAGE_SIZE].
+        """
+        if not 1 <= page_size <= AppConstants.TaskQueries.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {AppConstants.TaskQueries.MAX_PAGE_SIZE}.")
+
+    def query_keyset_rows(
+        self,
+        location: str,
+        where: str,
+        params: Sequence[Any],
+        order_by: Sequence[str],
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+    ) -> List[Any]:
+        """
+        Fetches up to `limit` rows ordered by `order_by`, starting after the sort key `after`.
+        This is the keyset scan behind every paginated query; ShardedSqliteTaskStore merges the
+        rows it returns from each shard.
+
+        :param location: AppConstants.TaskLocations.ACTIVE or FINISHED.
+        :param where: Filter expression with ? placeholders.
+        :param params: Values for the filter placeholders.
+        :param order_by: Sort key columns (ending with rowid).
+        :param limit: Maximum number of rows to return.
+        :param after: Sort key of the last row already returned, or None to start at the beginning.
+        :return: Rows holding the sort key columns followed by TASK_COLUMNS.
+        """
+        table: str = self._table_for(location)
+        sort_key: str = ", ".join(order_by)
+        args: List[Any] = list(params)
+        if after is not None:
+            where += f" AND ({sort_key}) > ({', '.join('?' for _ in order_by)})"
+            args.extend(after)
+        args.append(limit)
+
+        conn: sqlite3.Connection = self.connection()
+        with conn:
+            return conn.execute(
                 f"""
-                INSERT INTO {self.finished_table_name} (
-                    resource_id,
-                    row_key,
-                    task_type,
-                    status,
-                    input_payload,
-                    output_payload,
-                    start_time,
-                    end_time,
-                    batch_id,
-                    error_message,
-                    container_name,
-                    blob_name
-                )
-                VALUES (
-                    :PartitionKey,
-                    :RowKey,
-                    :TaskType,
-                    :Status,
-                    :InputPayload,
-                    :OutputPayload,
-                    :StartTime,
-                    :EndTime,
-                    :BatchID,
-                    :ErrorMessage,
-                    :ContainerName,
-                    :BlobName
-                )
+                SELECT {sort_key}, {TASK_COLUMNS}
+                FROM {table}
+                WHERE {where}
+                ORDER BY {sort_key}
+                LIMIT ?
                 """,
-                data,
-            )
-        logger.debug(f"Moved task {data['RowKey']} to finished table.")
+                args,
+            ).fetchall()
+
+    def complete_task(self, entity: TaskEntity) -> None:
+        """
+        Moves a COMPLETED task to the finished table and deletes it from the active table
+        in a single transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self._finish_task(entity)
+
+    def fail_task(self, entity: TaskEntity) -> None:
+        """
+        Moves a failed task to the finished table and deletes it from the active table
+        in a single transaction.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        self._finish_task(entity)
+
+    def _finish_task(self, entity: TaskEntity) -> None:
+        """
+        Writes the task's final state to the finished table and removes it from the active
+        table atomically, so it is never present in both (or neither) of them.
+        INSERT OR REPLACE keeps the operation idempotent for redelivered messages.
+
+        :param entity: The TaskEntity in its final state.
+        """
+        statements: SqliteTaskStatements = self._sql()
+        params: Tuple[Any, ...] = self._entity_params(entity)
+        key: Tuple[Any, Any] = (entity.ResourceId, entity.RowKey)
+
+        def finish(conn: sqlite3.Connection) -> None:
+            conn.execute(statements.replace_finished, params)
+            conn.execute(statements.delete_active, key)
+
+        self._write(finish)
+        logger.debug(f"Finished task {entity.RowKey} with status {entity.Status}.")
+
+    def finish_tasks(self, entities: Iterable[TaskEntity]) -> None:
+        """
+        Moves many tasks to the finished table and deletes them from the active table in a
+        single transaction.
+
+        :param entities: The TaskEntity instances in their final state.
+        """
+        statements: SqliteTaskStatements = self._sql()
+        params: List[Tuple[Any, ...]] = [self._entity_params(entity) for entity in entities]
+        keys: List[Tuple[Any, Any]] = [row[:2] for row in params]
+
+        def finish(conn: sqlite3.Connection) -> None:
+            conn.executemany(statements.replace_finished, params)
+            conn.executemany(statements.delete_active, keys)
+
+        self._write(finish)
+        logger.debug(f"Finished {len(params)} tasks.")
 
     def get_all_active_tasks(self, resource_id: str) -> List[TaskEntity]:
         """
@@ -268,34 +664,23 @@ class SqliteTaskStore(ITaskStore):
         :param resource_id: The partition key to filter tasks.
         :return: A list of TaskEntity instances.
         """
-        with self._conn:
-            cursor = self._conn.execute(
-                f"""
-                SELECT resource_id,
-                       row_key,
-                       task_type,
-                       status,
-                       input_payload,
-                       output_payload,
-                       start_time,
-                       end_time,
-                       batch_id,
-                       error_message,
-                       container_name,
-                       blob_name
-                FROM {self.active_table_name}
-                WHERE resource_id=?
-                """,
-                (resource_id,),
-            )
-            rows = cursor.fetchall()
-        return [self._row_to_entity(row) for row in rows] if rows else []
+        rows = self.connection().execute(self._sql().select_active_by_resource, (resource_id,)).fetchall()
+        return [TaskEntity.from_row(row) for row in rows]
 
     def close(self) -> None:
         """
-        Closes the SQLite database connection.
+        Closes the SQLite database connection. In write-behind mode, every queued write is
+        committed first.
         """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        with self._conns_lock:
+            conns: List[sqlite3.Connection] = self._all_conns
+            self._all_conns = []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
         if self._conn:
-            self._conn.close()
             self._conn = None
             logger.debug("SQLite connection closed.")
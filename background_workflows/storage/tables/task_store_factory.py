@@ -3,7 +3,15 @@
 import os
 from typing import Optional
 from background_workflows.constants.app_constants import AppConstants
+from background_workflows.storage.blobs.azure_blob_store import AzureBlobStore
+from background_workflows.storage.blobs.i_blob_store import IBlobStore
+from background_workflows.storage.blobs.local_blob_store import LocalBlobStore
+from background_workflows.storage.blobs.payload_offloader import PayloadOffloader
+from background_workflows.storage.tables.async_azure_task_store import AsyncAzureTaskStore
+from background_workflows.storage.tables.async_sqlite_task_store import AsyncSqliteTaskStore
 from background_workflows.storage.tables.i_task_storage import ITaskStore
+from background_workflows.storage.tables.payload_offloading_task_store import PayloadOffloadingTaskStore
+from background_workflows.storage.tables.sharded_sqlite_task_store import ShardedSqliteTaskStore
 from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore
 from background_workflows.storage.tables.azure_task_store import AzureTaskStore
 from background_workflows.tasks.base_task import logger
@@ -25,11 +33,15 @@ class TaskStoreFactory:
         active_table_name: Optional[str] = None,
         finished_table_name: Optional[str] = None,
         sqlite_db_path: Optional[str] = None,
+        sqlite_connection_mode: Optional[str] = None,
+        sqlite_shard_count: Optional[int] = None,
+        payload_offload_threshold: Optional[int] = None,
+        payload_container_name: Optional[str] = None,
     ) -> None:
         """
         Initialize the TaskStoreFactory with the desired configuration.
 
-        :param store_mode: The storage mode to use ('azure' or 'sqlite').
+        :param store_mode: The storage mode to use ('azure', 'sqlite' or 'sqlite_sharded').
         :param azure_connection_string: Connection string for Azure Table Storage.
                                         If not provided, the default from AppConstants is used.
         :param active_table_name: Name of the table for active tasks.
@@ -38,6 +50,14 @@ class TaskStoreFactory:
                                     Defaults to the AppConstants value if not provided.
         :param sqlite_db_path: Path to the SQLite database.
                                Defaults to the AppConstants value if not provided.
+        :param sqlite_connection_mode: "shared" or "per_thread" SQLite connections.
+                                       Defaults to the AppConstants value if not provided.
+        :param sqlite_shard_count: Number of database files in 'sqlite_sharded' mode.
+                                   Defaults to the AppConstants value if not provided.
+        :param payload_offload_threshold: Payloads longer than this many characters are kept in blob
+                                          storage (0 disables offloading). Defaults to the AppConstants value.
+        :param payload_container_name: Blob container of offloaded payloads.
+                                       Defaults to the AppConstants value if not provided.
         """
         self.store_mode: str = store_mode.lower()
         self.azure_connection_string: Optional[str] = (
@@ -46,12 +66,70 @@ class TaskStoreFactory:
         self.active_table_name: str = active_table_name or AppConstants.TaskStoreFactory.get_active_table_name()
         self.finished_table_name: str = finished_table_name or AppConstants.TaskStoreFactory.get_finished_table_name()
         self.sqlite_db_path: str = sqlite_db_path or AppConstants.TaskStoreFactory.get_sqlite_db_path()
+        self.sqlite_connection_mode: str = (
+            sqlite_connection_mode or AppConstants.TaskStoreFactory.get_sqlite_connection_mode()
+        )
+        self.sqlite_shard_count: int = sqlite_shard_count or AppConstants.TaskStoreFactory.get_sqlite_shard_count()
+        self.payload_offload_threshold: int = (
+            payload_offload_threshold
+            if payload_offload_threshold is not None
+            else AppConstants.PayloadOffload.get_threshold()
+        )
+        self.payload_container_name: str = payload_container_name or AppConstants.PayloadOffload.get_container_name()
+
+    @classmethod
+    def from_task_store(cls, task_store: ITaskStore) -> "TaskStoreFactory":
+        """
+        Build a factory that recreates the given store's configuration, e.g. so another
+        process can open its own connection to the same storage.
+
+        :param task_store: An AzureTaskStore, SqliteTaskStore or ShardedSqliteTaskStore instance,
+                           optionally wrapped in a PayloadOffloadingTaskStore.
+        :return: A TaskStoreFactory configured like task_store.
+        :raises ValueError: If the store type is unsupported or cannot be shared (in-memory SQLite).
+        """
+        if isinstance(task_store, PayloadOffloadingTaskStore):
+            factory: TaskStoreFactory = cls.from_task_store(task_store.inner)
+            factory.payload_offload_threshold = task_store.offloader.threshold
+            factory.payload_container_name = task_store.offloader.container_name
+            return factory
+        if isinstance(task_store, AzureTaskStore):
+            return cls(
+                store_mode=AppConstants.TaskStoreFactory.StoreModes.AZURE,
+                azure_connection_string=task_store.connection_string,
+                active_table_name=task_store.active_table_name,
+                finished_table_name=task_store.finished_table_name,
+            )
+        if isinstance(task_store, ShardedSqliteTaskStore):
+            if task_store.db_path == AppConstants.SqliteTaskStore.MEMORY_DB_PATH:
+                raise ValueError("An in-memory SQLite store cannot be shared with other processes.")
+            return cls(
+                store_mode=AppConstants.TaskStoreFactory.StoreModes.SQLITE_SHARDED,
+                active_table_name=task_store.active_table_name,
+                finished_table_name=task_store.finished_table_name,
+                sqlite_db_path=task_store.db_path,
+                sqlite_connection_mode=task_store.connection_mode,
+                sqlite_shard_count=task_store.shard_count,
+            )
+        if isinstance(task_store, SqliteTaskStore):
+            if task_store.db_path == AppConstants.SqliteTaskStore.MEMORY_DB_PATH:
+                raise ValueError("An in-memory SQLite store cannot be shared with other processes.")
+            return cls(
+                store_mode=AppConstants.TaskStoreFactory.StoreModes.SQLITE,
+                active_table_name=task_store.active_table_name,
+                finished_table_name=task_store.finished_table_name,
+                sqlite_db_path=task_store.db_path,
+                sqlite_connection_mode=task_store.connection_mode,
+            )
+        raise ValueError(f"Cannot derive a TaskStoreFactory from {type(task_store).__name__}.")
 
     def get_task_store(self) -> ITaskStore:
         """
         Create and return an ITaskStore instance based on the configured store mode.
 
-        :return: An instance of AzureTaskStore if store_mode is 'azure', or SqliteTaskStore if store_mode is 'sqlite'.
+        :return: An instance of AzureTaskStore if store_mode is 'azure', SqliteTaskStore if store_mode is 'sqlite',
+                 or ShardedSqliteTaskStore if store_mode is 'sqlite_sharded', wrapped in a
+                 PayloadOffloadingTaskStore when payload_offload_threshold is above 0.
         :raises ValueError: If store_mode is not recognized or required parameters are missing.
         """
         if self.store_mode == "azure":
@@ -67,10 +145,81 @@ class TaskStoreFactory:
                 db_path=self.sqlite_db_path,
                 active_table_name=self.active_table_name,
                 finished_table_name=self.finished_table_name,
+                connection_mode=self.sqlite_connection_mode,
             )
+        elif self.store_mode == AppConstants.TaskStoreFactory.StoreModes.SQLITE_SHARDED:
+            store = self._sharded_sqlite_store()
         else:
             raise ValueError(f"Unknown store_mode: {self.store_mode}")
 
+        if self.payload_offload_threshold > 0:
+            store = PayloadOffloadingTaskStore(store, self.get_payload_offloader())
+
         logger.info(f"Creating task store using {self.store_mode} mode.")
         store.create_if_not_exists()
         return store
+
+    def get_async_task_store(self) -> ITaskStore:
+        """
+        Create and return a task store that also implements IAsyncTaskStore, for use by
+        async tasks (e.g., with MainAsyncController).
+
+        :return: An AsyncAzureTaskStore if store_mode is 'azure', or AsyncSqliteTaskStore if store_mode is 'sqlite'.
+                 'sqlite_sharded' returns a ShardedSqliteTaskStore, whose calls run on the default executor.
+                 With payload offloading enabled, the store is wrapped in a PayloadOffloadingTaskStore.
+        :raises ValueError: If store_mode is not recognized or required parameters are missing.
+        """
+        if self.store_mode == "azure":
+            if not self.azure_connection_string:
+                raise ValueError("Azure connection string is required for Azure store mode.")
+            store: ITaskStore = AsyncAzureTaskStore(
+                connection_string=self.azure_connection_string,
+                active_table_name=self.active_table_name,
+                finished_table_name=self.finished_table_name,
+            )
+        elif self.store_mode == "sqlite":
+            store = AsyncSqliteTaskStore(
+                db_path=self.sqlite_db_path,
+                active_table_name=self.active_table_name,
+                finished_table_name=self.finished_table_name,
+                connection_mode=self.sqlite_connection_mode,
+            )
+        elif self.store_mode == AppConstants.TaskStoreFactory.StoreModes.SQLITE_SHARDED:
+            store = self._sharded_sqlite_store()
+        else:
+            raise ValueError(f"Unknown store_mode: {self.store_mode}")
+
+        if self.payload_offload_threshold > 0:
+            # Offloaded payloads must resolve here too; the wrapper's calls run on the default executor.
+            store = PayloadOffloadingTaskStore(store, self.get_payload_offloader())
+
+        logger.info(f"Creating async task store using {self.store_mode} mode.")
+        store.create_if_not_exists()
+        return store
+
+    def get_payload_offloader(self) -> PayloadOffloader:
+        """
+        Create the PayloadOffloader used by get_task_store() when payload offloading is enabled,
+        e.g. to pass to SqliteTaskMaintenance. Payloads go to Azure Blob Storage in 'azure' mode
+        and to a LocalBlobStore otherwise.
+
+        :return: A PayloadOffloader with this factory's threshold and container.
+        """
+        blob_store: IBlobStore = (
+            AzureBlobStore(self.azure_connection_string)
+            if self.store_mode == AppConstants.TaskStoreFactory.StoreModes.AZURE
+            else LocalBlobStore()
+        )
+        return PayloadOffloader(blob_store, self.payload_container_name, self.payload_offload_threshold)
+
+    def _sharded_sqlite_store(self) -> ShardedSqliteTaskStore:
+        """
+        :return: A ShardedSqliteTaskStore configured from this factory.
+        """
+        return ShardedSqliteTaskStore(
+            db_path=self.sqlite_db_path,
+            shard_count=self.sqlite_shard_count,
+            active_table_name=self.active_table_name,
+            finished_table_name=self.finished_table_name,
+            connection_mode=self.sqlite_connection_mode,
+        )
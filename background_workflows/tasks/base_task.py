@@ -1,12 +1,15 @@
 # background_workflows/tasks/base_task.py
 
 import abc
+import asyncio
 import socket
 import time
 import logging
 from datetime import datetime
-from typing import Optional, Dict
+from functools import partial
+from typing import Any, Optional, Dict
 
+from background_workflows.storage.tables.i_async_task_store import IAsyncTaskStore
 from background_workflows.storage.tables.i_task_storage import ITaskStore
 from background_workflows.storage.schemas.task_entity import TaskEntity
 
@@ -61,8 +64,8 @@ class BaseTask(abc.ABC):
 
     def _complete_single(self, unique_key: str, input_task_entity: Optional[TaskEntity] = None) -> None:
         """
-        Marks the task as COMPLETED, sets its end time, moves it to the finished store,
-        and removes it from the active cache.
+        Marks the task as COMPLETED, sets its end time, and moves it to the finished store
+        (one atomic `complete_task()` call), then removes it from the active cache.
 
         :param unique_key: The unique key in the format "resource_id||row_key".
         :param input_task_entity: Optionally, a TaskEntity to complete directly; if not provided,
@@ -72,17 +75,15 @@ class BaseTask(abc.ABC):
         if task_entity:
             task_entity.mark_completed()
             task_entity.EndTime = datetime.utcnow()
-            self.task_store.upsert_task(task_entity)
 
             # Move the task to the finished store and remove it from active storage.
-            self.task_store.move_to_finished(task_entity)
-            self.task_store.delete_task(task_entity.ResourceId, task_entity.RowKey)
+            self.task_store.complete_task(task_entity)
             self._active_items.pop(unique_key, None)
 
     def _fail_single(self, unique_key: str, error_message: str) -> None:
         """
-        Marks the task as ERROR, sets its end time and error message, moves it to the finished store,
-        and removes it from the active cache.
+        Marks the task as ERROR, sets its end time and error message, and moves it to the finished
+        store (one atomic `fail_task()` call), then removes it from the active cache.
 
         :param unique_key: The unique key in the format "resource_id||row_key".
         :param error_message: The error message describing the failure.
@@ -92,11 +93,81 @@ class BaseTask(abc.ABC):
             task_entity.mark_error()
             task_entity.EndTime = datetime.utcnow()
             task_entity.ErrorMessage = error_message
-            self.task_store.upsert_task(task_entity)
 
             # Move the task to the finished store and remove it from active storage.
-            self.task_store.move_to_finished(task_entity)
-            self.task_store.delete_task(task_entity.ResourceId, task_entity.RowKey)
+            self.task_store.fail_task(task_entity)
+            self._active_items.pop(unique_key, None)
+
+    async def _call_store_async(self, method_name: str, *args: Any) -> Any:
+        """
+        Calls a task store method without blocking the event loop.
+
+        Awaits the store's native `<method_name>_async` coroutine when it implements
+        IAsyncTaskStore; otherwise runs the synchronous method in the default executor.
+
+        :param method_name: The ITaskStore method name (e.g., "upsert_task").
+        :param args: Positional arguments for the method.
+        :return: The method's return value.
+        """
+        if isinstance(self.task_store, IAsyncTaskStore):
+            return await getattr(self.task_store, f"{method_name}_async")(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(getattr(self.task_store, method_name), *args))
+
+    async def _initialize_single_async(self, resource_id: str, row_key: str) -> Optional[TaskEntity]:
+        """
+        Async counterpart of `_initialize_single()`: loads the TaskEntity, marks it as RUNNING,
+        sets its start time, and caches it for further processing.
+
+        :param resource_id: The resource identifier (PartitionKey).
+        :param row_key: The unique task identifier (RowKey).
+        :return: The updated TaskEntity if found; otherwise, None.
+        """
+        if not resource_id or not row_key:
+            logger.error("[BaseTask] _initialize_single_async => Missing IDs in message.")
+            return None
+
+        task_entity: Optional[TaskEntity] = await self._call_store_async("get_task", resource_id, row_key)
+        if not task_entity:
+            logger.error(f"[BaseTask] _initialize_single_async => No such task in store: {resource_id}/{row_key}")
+            return None
+
+        task_entity.mark_running()
+        task_entity.StartTime = datetime.utcnow()
+        await self._call_store_async("upsert_task", task_entity)
+
+        unique_key: str = f"{resource_id}||{row_key}"
+        self._active_items[unique_key] = task_entity
+        return task_entity
+
+    async def _complete_single_async(self, unique_key: str, input_task_entity: Optional[TaskEntity] = None) -> None:
+        """
+        Async counterpart of `_complete_single()`.
+
+        :param unique_key: The unique key in the format "resource_id||row_key".
+        :param input_task_entity: Optionally, a TaskEntity to complete directly; if not provided,
+                                  the cached task is used.
+        """
+        task_entity: Optional[TaskEntity] = input_task_entity or self._active_items.get(unique_key)
+        if task_entity:
+            task_entity.mark_completed()
+            task_entity.EndTime = datetime.utcnow()
+            await self._call_store_async("complete_task", task_entity)
+            self._active_items.pop(unique_key, None)
+
+    async def _fail_single_async(self, unique_key: str, error_message: str) -> None:
+        """
+        Async counterpart of `_fail_single()`.
+
+        :param unique_key: The unique key in the format "resource_id||row_key".
+        :param error_message: The error message describing the failure.
+        """
+        task_entity: Optional[TaskEntity] = self._active_items.get(unique_key)
+        if task_entity:
+            task_entity.mark_error()
+            task_entity.EndTime = datetime.utcnow()
+            task_entity.ErrorMessage = error_message
+            await self._call_store_async("fail_task", task_entity)
             self._active_items.pop(unique_key, None)
 
     def _generate_batch_id(self) -> str:
@@ -1,16 +1,51 @@
 # background_workflows/tasks/celery/celery_task.py
 
 from celery import shared_task
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import logging
+import os
+import threading
 
 from background_workflows.constants.app_constants import AppConstants
 from background_workflows.storage.schemas.task_message import TaskMessage
+from background_workflows.storage.tables.i_task_storage import ITaskStore
 from background_workflows.storage.tables.task_store_factory import TaskStoreFactory
 from background_workflows.utils.dynamic_task_creator import DynamicTaskCreator
 
 logger = logging.getLogger( __name__ )
 
+# Task stores reused across messages, keyed by process id and store configuration.
+_task_stores: Dict[ Tuple[ Any, ... ], ITaskStore ] = { }
+_task_stores_lock: threading.Lock = threading.Lock()
+
+
+def _get_task_store(tmsg: TaskMessage) -> ITaskStore:
+    """
+    Returns the task store described by the message, creating it (and its tables) only for the
+    first message with that configuration in this worker process. The process id is part of
+    the key, so a forked worker never reuses its parent's connections.
+
+    :param tmsg: The task message carrying the store configuration.
+    :return: The cached ITaskStore.
+    """
+    key: Tuple[ Any, ... ] = (
+        os.getpid(), tmsg.store_mode, tmsg.active_table_name, tmsg.finished_table_name, tmsg.database_name
+    )
+    store: ITaskStore = _task_stores.get( key )
+    if store is None:
+        with _task_stores_lock:
+            store = _task_stores.get( key )
+            if store is None:
+                factory: TaskStoreFactory = TaskStoreFactory(
+                    store_mode = tmsg.store_mode,
+                    active_table_name = tmsg.active_table_name,
+                    finished_table_name = tmsg.finished_table_name,
+                    sqlite_db_path = tmsg.database_name,
+                )
+                store = factory.get_task_store()
+                _task_stores[ key ] = store
+    return store
+
 
 @shared_task( name = AppConstants.Celery.TASK_NAME_BACKGROUND )
 def celery_task_handler(msg_str: str) -> None:
@@ -23,10 +58,10 @@ def celery_task_handler(msg_str: str) -> None:
 
       1. Wrap the JSON string in a dictionary with the key "content" and parse
          it into a TaskMessage instance.
-      2. Instantiate a TaskStoreFactory using configuration from the TaskMessage.
-      3. Obtain the underlying task store (either Azure or SQLite) via the factory.
-      4. Use DynamicTaskCreator to instantiate the corresponding task object.
-      5. If a valid task object is created, execute it; otherwise, log an error.
+      2. Obtain the task store described by the TaskMessage (built by TaskStoreFactory for the
+         first message with that configuration, then reused).
+      3. Use DynamicTaskCreator to instantiate the corresponding task object.
+      4. If a valid task object is created, execute it; otherwise, log an error.
 
     :param msg_str: A JSON string representing the task message.
     """
@@ -35,15 +70,8 @@ def celery_task_handler(msg_str: str) -> None:
         wrapped: Dict[ str, Any ] = {"content": msg_str}
         tmsg: TaskMessage = TaskMessage( wrapped )
 
-        # Instantiate the factory using configuration extracted from the TaskMessage.
-        factory: TaskStoreFactory = TaskStoreFactory(
-            store_mode = tmsg.store_mode,
-            active_table_name = tmsg.active_table_name,
-            finished_table_name = tmsg.finished_table_name,
-            sqlite_db_path = tmsg.database_name,
-        )
-        # Obtain the task store (Azure or SQLite, depending on configuration).
-        store = factory.get_task_store()
+        # Reuse the task store (and its Azure clients or SQLite connection) across messages.
+        store: ITaskStore = _get_task_store( tmsg )
 
         # Dynamically create the task instance.
         creator: DynamicTaskCreator = DynamicTaskCreator( store )
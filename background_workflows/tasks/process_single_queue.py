@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 
 from background_workflows.constants.app_constants import AppConstants
 from background_workflows.tasks.base_task import BaseTask
+from background_workflows.utils.payload_codec import PayloadCodecs
 from background_workflows.utils.task_logger import logger
 
 
@@ -57,8 +58,8 @@ class ProcessSingleQueue(BaseTask):
 
         unique_key: str = f"{resource_id}||{row_key}"
         try:
-            # Parse the input payload (assumed to be a JSON string) into a dictionary.
-            input_payload: Dict[str, Any] = json.loads(entity.InputPayload)
+            # Parse the input payload (a JSON string, possibly compressed by PayloadCodecs) into a dictionary.
+            input_payload: Dict[str, Any] = json.loads(PayloadCodecs.decode(entity.InputPayload))
 
             # Retrieve container_name and blob_name from the task entity.
             container_name: Optional[ str ] = entity.ContainerName
@@ -71,7 +72,7 @@ class ProcessSingleQueue(BaseTask):
             # Execute the task-specific logic.
             output_payload: str = self.do_work_on_single(input_payload)
             # Save the output payload to the entity.
-            entity.OutputPayload = output_payload
+            entity.OutputPayload = PayloadCodecs.encode(output_payload)
             # Mark the task as completed.
             self._complete_single(unique_key, entity)
         except Exception as ex:
@@ -86,20 +87,23 @@ class ProcessSingleQueue(BaseTask):
         2. Parses input payload from JSON into a dict.
         3. Awaits do_work_on_single_async(...) for async I/O.
         4. On success, marks the task COMPLETED; on fail, marks ERROR.
+
+        Store calls never block the event loop: they are awaited natively when the task store
+        implements IAsyncTaskStore, and run in the default executor otherwise.
         """
         from background_workflows.constants.app_constants import AppConstants
 
         resource_id: Optional[ str ] = getattr( msg, AppConstants.MessageKeys.RESOURCE_ID, None )
         row_key: Optional[ str ] = getattr( msg, AppConstants.MessageKeys.ROW_KEY, None )
 
-        entity = self._initialize_single( resource_id, row_key )
+        entity = await self._initialize_single_async( resource_id, row_key )
         if not entity:
             return  # Abort if no entity
 
         unique_key: str = f"{resource_id}||{row_key}"
 
         try:
-            input_payload: Dict[ str, Any ] = json.loads( entity.InputPayload )
+            input_payload: Dict[ str, Any ] = json.loads( PayloadCodecs.decode( entity.InputPayload ) )
 
             container_name: Optional[ str ] = entity.ContainerName
             blob_name: Optional[ str ] = entity.BlobName
@@ -111,9 +115,9 @@ class ProcessSingleQueue(BaseTask):
             output_payload: str = await self.do_work_on_single_async( input_payload )
 
             # Save output and mark COMPLETE
-            entity.OutputPayload = output_payload
-            self._complete_single( unique_key, entity )
+            entity.OutputPayload = PayloadCodecs.encode( output_payload )
+            await self._complete_single_async( unique_key, entity )
 
         except Exception as ex:
             logger.exception( f"[ProcessSingleQueueAsync] single => FAIL => {ex}" )
-            self._fail_single( unique_key, error_message = str( ex ) )
+            await self._fail_single_async( unique_key, error_message = str( ex ) )
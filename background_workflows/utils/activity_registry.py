@@ -1,6 +1,7 @@
 # background_workflows/utils/activity_registry.py
 
 from typing import Type, Optional, Dict, TypeVar
+from background_workflows.constants.app_constants import AppConstants
 from background_workflows.tasks.base_task import BaseTask
 
 # Define a type variable for task classes (subclasses of BaseTask)
@@ -10,20 +11,32 @@ class ActivityRegistry:
     """
     Global registry mapping activity types (strings) to task classes (subclasses of BaseTask).
 
-    This registry allows for the dynamic instantiation of tasks based on their activity type.
+    This registry allows for the dynamic instantiation of tasks based on their activity type,
+    and records the execution mode (thread, process, or async) each activity should run in.
     """
 
     _registry: Dict[str, Type[BaseTask]] = {}
+    _execution_modes: Dict[str, str] = {}
 
     @classmethod
-    def register(cls, activity_type: str, task_class: Type[T]) -> None:
+    def register(
+        cls,
+        activity_type: str,
+        task_class: Type[T],
+        execution_mode: str = AppConstants.ExecutionModes.THREAD,
+    ) -> None:
         """
         Registers a task class under the provided activity_type.
 
         :param activity_type: A string representing the activity type.
         :param task_class: A task class (subclass of BaseTask) to register.
+        :param execution_mode: Where the activity runs: "thread" (default), "process", or "async".
+        :raises ValueError: If execution_mode is not recognized.
         """
+        if execution_mode not in AppConstants.ExecutionModes.ALL:
+            raise ValueError(f"Unknown execution_mode: {execution_mode}")
         cls._registry[activity_type] = task_class
+        cls._execution_modes[activity_type] = execution_mode
 
     @classmethod
     def get(cls, activity_type: str) -> Optional[Type[BaseTask]]:
@@ -34,3 +47,13 @@ class ActivityRegistry:
         :return: The task class registered under the activity_type, or None if not found.
         """
         return cls._registry.get(activity_type)
+
+    @classmethod
+    def get_execution_mode(cls, activity_type: str) -> str:
+        """
+        Retrieves the execution mode registered for the given activity_type.
+
+        :param activity_type: A string representing the activity type.
+        :return: The registered execution mode, or "thread" if the activity is unknown.
+        """
+        return cls._execution_modes.get(activity_type, AppConstants.ExecutionModes.THREAD)
@@ -1,13 +1,17 @@
 # background_workflows/utils/decorators.py
 
 from typing import Callable, Type, TypeVar
+from background_workflows.constants.app_constants import AppConstants
 from background_workflows.utils.activity_registry import ActivityRegistry
 from background_workflows.tasks.base_task import BaseTask
 
 # Define a type variable for classes that are subclasses of BaseTask.
 T = TypeVar('T', bound=BaseTask)
 
-def register_activity(activity_type: str) -> Callable[[Type[T]], Type[T]]:
+def register_activity(
+    activity_type: str,
+    execution_mode: str = AppConstants.ExecutionModes.THREAD,
+) -> Callable[[Type[T]], Type[T]]:
     """
     Decorator to auto-register a BaseTask subclass under the provided activity_type.
 
@@ -17,12 +21,19 @@ def register_activity(activity_type: str) -> Callable[[Type[T]], Type[T]]:
         class MyTask(BaseTask):
             ...
 
+        @register_activity("MY_CPU_HEAVY_TASK", execution_mode="process")
+        class MyCpuHeavyTask(BaseTask):
+            ...
+
     :param activity_type: A string representing the activity type for which the task is registered.
+    :param execution_mode: Where the controller runs the activity: "thread" (default), "process",
+                           or "async" (awaits execute_single_async on any controller with an
+                           asyncio lane, i.e. max_async_tasks > 0).
     :return: A decorator function that registers the task class and returns it.
     """
     def decorator(cls: Type[T]) -> Type[T]:
         if not issubclass(cls, BaseTask):
             raise TypeError("@register_activity can only be used on BaseTask subclasses")
-        ActivityRegistry.register(activity_type, cls)
+        ActivityRegistry.register(activity_type, cls, execution_mode=execution_mode)
         return cls
     return decorator
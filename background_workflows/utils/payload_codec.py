@@ -0,0 +1,247 @@
+# background_workflows/utils/payload_codec.py
+
+import base64
+import binascii
+import gzip
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Type
+
+from background_workflows.constants.app_constants import AppConstants
+from background_workflows.utils.task_logger import logger
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency: "pip install zstandard" enables the zstd codec.
+    zstandard = None
+
+
+class IPayloadCodec(ABC):
+    """
+    Interface for a compression codec used by PayloadCodecs.
+    """
+
+    # Name written in the marker of encoded values; must not contain ":".
+    name: str = ""
+    # Exceptions decompress() raises for data it did not produce.
+    errors: Tuple[Type[BaseException], ...] = ()
+
+    def is_available(self) -> bool:
+        """
+        :return: True if the codec can run in this process (its library is installed).
+        """
+        return True
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        :param data: Uncompressed bytes.
+        :return: Compressed bytes.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """
+        :param data: Bytes produced by compress().
+        :return: The original bytes.
+        """
+        raise NotImplementedError
+
+
+class GzipPayloadCodec(IPayloadCodec):
+    """
+    gzip compression from the standard library; always available.
+    """
+
+    name = AppConstants.PayloadCodec.Names.GZIP
+    errors = (OSError, EOFError, zlib.error)
+
+    def __init__(self, level: int = AppConstants.PayloadCodec.GZIP_LEVEL) -> None:
+        """
+        :param level: Compression level (1-9).
+        """
+        self.level: int = level
+
+    def compress(self, data: bytes) -> bytes:
+        # mtime=0 keeps the output deterministic for equal inputs.
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class ZstdPayloadCodec(IPayloadCodec):
+    """
+    Zstandard compression (faster and smaller than gzip); requires the optional `zstandard` package.
+    """
+
+    name = AppConstants.PayloadCodec.Names.ZSTD
+    errors = (zstandard.ZstdError,) if zstandard is not None else ()
+
+    def __init__(self, level: int = AppConstants.PayloadCodec.ZSTD_LEVEL) -> None:
+        """
+        :param level: Compression level.
+        """
+        self.level: int = level
+
+    def is_available(self) -> bool:
+        return zstandard is not None
+
+    def compress(self, data: bytes) -> bytes:
+        self._require()
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        self._require()
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    def _require(self) -> None:
+        """
+        :raises RuntimeError: If the zstandard package is not installed.
+        """
+        if zstandard is None:
+            raise RuntimeError("The zstd payload codec needs the 'zstandard' package (pip install zstandard).")
+
+
+class PayloadCodecs:
+    """
+    Process-wide codec layer for task payloads (TaskEntity.InputPayload / OutputPayload) and
+    queue message bodies (TaskMessage).
+
+    `encode()` compresses values of at least `threshold` characters with the configured codec
+    and returns "<marker><base64>", so the result is still text for every store and queue; a
+    value that does not get shorter is returned unchanged. `decode()` reads the marker to pick
+    the codec, and returns values without a known marker as they are. A plain value that starts
+    with a known marker is escaped as "@plain:<value>", and a marked value that does not decode
+    is returned unchanged, so no text is misread as compressed. Readers therefore accept
+    plain and compressed values from any writer, whatever codec they are configured with
+    themselves: roll out a version that decodes before enabling a codec (PAYLOAD_CODEC).
+
+    If the configured codec is not available (zstd without the zstandard package), gzip is used.
+    Custom codecs are added with `register()`.
+    """
+
+    _codecs: Dict[str, IPayloadCodec] = {}
+    _active: Optional[IPayloadCodec] = None
+    _threshold: int = 0
+
+    @classmethod
+    def register(cls, codec: IPayloadCodec) -> None:
+        """
+        Makes a codec available for configure() and decode().
+
+        :param codec: The codec; replaces any codec registered under the same name.
+        :raises ValueError: If the codec name is empty, reserved or contains ":".
+        """
+        reserved = (AppConstants.PayloadCodec.Names.NONE, AppConstants.PayloadCodec.Names.PLAIN)
+        if not codec.name or ":" in codec.name or codec.name in reserved:
+            raise ValueError(f"Invalid payload codec name: {codec.name!r}")
+        cls._codecs[codec.name] = codec
+
+    @classmethod
+    def get(cls, name: str) -> Optional[IPayloadCodec]:
+        """
+        :param name: Codec name.
+        :return: The registered codec, or None.
+        """
+        return cls._codecs.get(name)
+
+    @classmethod
+    def configure(
+        cls,
+        codec_name: str = AppConstants.PayloadCodec.Names.NONE,
+        threshold: int = int(AppConstants.PayloadCodec.THRESHOLD_DEFAULT),
+    ) -> None:
+        """
+        Selects the codec applied by encode().
+
+        :param codec_name: A registered codec name, or "none" to write plain values.
+        :param threshold: Values shorter than this many characters are not compressed.
+        :raises ValueError: If the codec is not registered.
+        """
+        codec: Optional[IPayloadCodec] = None
+        if codec_name != AppConstants.PayloadCodec.Names.NONE:
+            codec = cls._codecs.get(codec_name)
+            if codec is None:
+                raise ValueError(f"Unknown payload codec: {codec_name}")
+            if not codec.is_available():
+                logger.warning(f"Payload codec {codec_name} is not available; using gzip instead.")
+                codec = cls._codecs[AppConstants.PayloadCodec.Names.GZIP]
+        cls._active = codec
+        cls._threshold = threshold
+
+    @classmethod
+    def active_codec_name(cls) -> str:
+        """
+        :return: The name of the codec applied by encode(), or "none".
+        """
+        return cls._active.name if cls._active is not None else AppConstants.PayloadCodec.Names.NONE
+
+    @classmethod
+    def encode(cls, value: Any) -> Any:
+        """
+        Compresses a text value with the configured codec.
+
+        :param value: The value to store or send; anything but a string is returned unchanged.
+        :return: The encoded value, or value itself if it is short, incompressible or no codec is
+                 set (escaped as "@plain:<value>" if it starts with a known marker).
+        """
+        if not isinstance(value, str):
+            return value
+        codec: Optional[IPayloadCodec] = cls._active
+        if codec is not None and len(value) >= cls._threshold:
+            compressed: bytes = codec.compress(value.encode("utf-8"))
+            encoded: str = (
+                AppConstants.PayloadCodec.MARKER_FORMAT.format(name=codec.name)
+                + base64.b64encode(compressed).decode("ascii")
+            )
+            if len(encoded) < len(value):
+                return encoded
+        if cls._marker_name(value) is not None:
+            return AppConstants.PayloadCodec.MARKER_FORMAT.format(name=AppConstants.PayloadCodec.Names.PLAIN) + value
+        return value
+
+    @classmethod
+    def decode(cls, value: Any) -> Any:
+        """
+        Restores a value written by encode(), detecting the codec from its marker.
+
+        :param value: A stored or received value.
+        :return: The original text, or value itself if it carries no known marker or does not decode.
+        :raises RuntimeError: If the value's codec is registered but not available here.
+        """
+        name: Optional[str] = cls._marker_name(value)
+        if name is None:
+            return value
+        body: str = value[len(name) + 2:]
+        if name == AppConstants.PayloadCodec.Names.PLAIN:
+            return body
+        codec: IPayloadCodec = cls._codecs[name]
+        if not body:
+            # encode() never writes an empty body.
+            return value
+        try:
+            return codec.decompress(base64.b64decode(body, validate=True)).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError) + codec.errors as ex:
+            # Plain text that only looks encoded (e.g., written before values were escaped).
+            logger.debug(f"Value with a {name} marker did not decode ({ex}); returning it unchanged.")
+            return value
+
+    @classmethod
+    def _marker_name(cls, value: Any) -> Optional[str]:
+        """
+        :param value: A value to inspect.
+        :return: The codec name (or "plain") of the marker value starts with, or None.
+        """
+        if not isinstance(value, str) or not value.startswith("@"):
+            return None
+        name, separator, _ = value[1:].partition(":")
+        if not separator or (name != AppConstants.PayloadCodec.Names.PLAIN and name not in cls._codecs):
+            return None
+        return name
+
+
+PayloadCodecs.register(GzipPayloadCodec())
+PayloadCodecs.register(ZstdPayloadCodec())
+PayloadCodecs.configure(AppConstants.PayloadCodec.get_codec_name(), AppConstants.PayloadCodec.get_threshold())
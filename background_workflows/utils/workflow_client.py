@@ -1,4 +1,4 @@
-from typing import Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from background_workflows.storage.blobs.i_blob_store import IBlobStore
 from background_workflows.saga.task_creation_saga import TaskCreationSaga, SagaFailure
 from background_workflows.constants.app_constants import AppConstants
@@ -7,6 +7,7 @@ import json
 from background_workflows.storage.queue.i_queue_backend import IQueueBackend
 from background_workflows.storage.schemas.task_entity import TaskEntity
 from background_workflows.storage.tables.i_task_storage import ITaskStore
+from background_workflows.utils.payload_codec import PayloadCodecs
 from background_workflows.utils.task_logger import logger
 
 
@@ -83,17 +84,47 @@ class WorkflowClient:
             logger.error(f"SAGA failed for activity '{activity_type}': {ex}")
             raise
 
-    def get_status(self, row_key: str, resource_id: str) -> Optional[str]:
+    def get_status(self, row_key: str, resource_id: str, location: Optional[str] = None) -> Optional[str]:
         """
         Retrieve the status of a task.
 
         :param row_key: The unique row key of the task.
         :param resource_id: The resource (partition) identifier for the task.
+        :param location: Optional AppConstants.TaskLocations hint, for callers that know whether
+                         the task is still active or already finished.
         :return: The status of the task (e.g., CREATED, RUNNING, COMPLETED, ERROR) if found; otherwise, None.
         """
-        task_entity: Optional[TaskEntity] = self.task_store.get_task(resource_id, row_key)
+        task_entity: Optional[TaskEntity] = self.task_store.get_task(resource_id, row_key, location)
         return task_entity.Status if task_entity is not None else None
 
+    def get_statuses(self, row_keys: Iterable[str], resource_id: str) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the status of many tasks of one resource with a single bulk lookup.
+
+        :param row_keys: The unique row keys of the tasks.
+        :param resource_id: The resource (partition) identifier of the tasks.
+        :return: The status of every requested row key; None for tasks that were not found.
+        """
+        keys: List[Tuple[str, str]] = [(resource_id, row_key) for row_key in row_keys]
+        found: Dict[Tuple[str, str], TaskEntity] = self.task_store.get_tasks(keys)
+        return {row_key: found[(rid, row_key)].Status if (rid, row_key) in found else None for rid, row_key in keys}
+
+    def get_results(self, row_keys: Iterable[str], resource_id: str) -> Dict[str, Optional[Any]]:
+        """
+        Retrieve the final result of many tasks of one resource with a single bulk lookup of the
+        finished store.
+
+        :param row_keys: The unique row keys of the tasks.
+        :param resource_id: The resource (partition) identifier of the tasks.
+        :return: The deserialized output payload of every requested row key; None for tasks that
+                 are not completed (or have no output).
+        """
+        keys: List[Tuple[str, str]] = [(resource_id, row_key) for row_key in row_keys]
+        found: Dict[Tuple[str, str], TaskEntity] = self.task_store.get_tasks(
+            keys, AppConstants.TaskLocations.FINISHED
+        )
+        return {row_key: self._result_of(found.get((resource_id, row_key))) for _, row_key in keys}
+
     def get_result(self, row_key: str, resource_id: Optional[str] = None) -> Optional[Any]:
         """
         Retrieve the final result of a completed task.
@@ -105,7 +136,20 @@ class WorkflowClient:
         :param resource_id: The resource (partition) identifier for the task.
         :return: The deserialized output payload if the task is completed; otherwise, None.
         """
-        task_entity: Optional[TaskEntity] = self.task_store.get_task(resource_id, row_key)
+        # Completed tasks only live in the finished store, so the active store is never probed.
+        task_entity: Optional[TaskEntity] = self.task_store.get_task(
+            resource_id, row_key, AppConstants.TaskLocations.FINISHED
+        )
+        return self._result_of(task_entity)
+
+    @staticmethod
+    def _result_of(task_entity: Optional[TaskEntity]) -> Optional[Any]:
+        """
+        Deserialize the output payload of a COMPLETED task.
+
+        :param task_entity: The TaskEntity, or None if the task was not found.
+        :return: The deserialized output payload if the task is completed; otherwise, None.
+        """
         if task_entity is None:
             return None
 
@@ -113,5 +157,5 @@ class WorkflowClient:
             task_entity.Status == AppConstants.TaskStatus.COMPLETED
             and task_entity.OutputPayload
         ):
-            return json.loads(task_entity.OutputPayload)
+            return json.loads(PayloadCodecs.decode(task_entity.OutputPayload))
         return None
\ No newline at end of file
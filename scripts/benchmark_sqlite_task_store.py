@@ -0,0 +1,91 @@
+"""
+Micro-benchmark of the SqliteTaskStore hot path: per-operation cost of upsert_task,
+get_task and complete_task. By default the store is in memory, so the numbers show the
+Python/statement overhead rather than disk latency; pass --file to include the journal I/O.
+
+Usage (from the repository root):
+    python scripts/benchmark_sqlite_task_store.py [--ops 5000] [--repeat 3] [--file]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from background_workflows.storage.schemas.task_entity import TaskEntity  # noqa: E402
+from background_workflows.storage.tables.sqlite_task_store import SqliteTaskStore  # noqa: E402
+from background_workflows.utils.task_logger import logger  # noqa: E402
+
+
+def _time_per_op(operation: Callable[[int], object], ops: int) -> float:
+    """
+    Runs operation(i) for i in range(ops) and returns the mean cost in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(ops):
+        operation(i)
+    return (time.perf_counter() - start) / ops * 1_000_000
+
+
+def run_once(ops: int, use_file: bool) -> Dict[str, float]:
+    """
+    Measures one round of every operation on a fresh database.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteTaskStore(os.path.join(tmp, "bench.db") if use_file else ":memory:")
+        store.create_if_not_exists()
+        # Keep the benchmark about statement overhead, not fsync latency.
+        store.connection().execute("PRAGMA synchronous=OFF")
+        entities: List[TaskEntity] = [
+            TaskEntity(
+                PartitionKey=f"res-{i % 16}",
+                RowKey=f"row-{i}",
+                TaskType="BENCH",
+                InputPayload='{"x": 1}',
+                StartTime=datetime.utcnow(),
+            )
+            for i in range(ops)
+        ]
+
+        def complete(i: int) -> None:
+            entities[i].mark_completed()
+            entities[i].EndTime = datetime.utcnow()
+            store.complete_task(entities[i])
+
+        results = {
+            "upsert_task": _time_per_op(lambda i: store.upsert_task(entities[i]), ops),
+            "get_task (active)": _time_per_op(lambda i: store.get_task(f"res-{i % 16}", f"row-{i}"), ops),
+            "complete_task": _time_per_op(complete, ops),
+            "get_task (finished)": _time_per_op(lambda i: store.get_task(f"res-{i % 16}", f"row-{i}"), ops),
+        }
+        store.close()
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-operation cost of SqliteTaskStore.")
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--file", action="store_true", help="Use a database file instead of :memory:.")
+    parser.add_argument("--log-level", default="WARNING", help="Library log level while measuring.")
+    args = parser.parse_args()
+    logger.setLevel(getattr(logging, args.log_level.upper()))
+
+    best: Dict[str, float] = {}
+    for _ in range(args.repeat):
+        for name, micros in run_once(args.ops, args.file).items():
+            best[name] = min(micros, best.get(name, float("inf")))
+
+    print(f"SqliteTaskStore ({'file' if args.file else ':memory:'}), best of {args.repeat} x {args.ops} ops")
+    for name, micros in best.items():
+        print(f"  {name:<22} {micros:8.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()